@@ -5,6 +5,7 @@ from typing import Any, Dict, List
 
 import typer
 
+from core.engine.dependency_installer import deferred_lockfile_sync
 from core.services.config_loader import load_module_config
 
 from ...ui.printer import print_error, print_info, print_success, print_warning
@@ -44,6 +45,7 @@ def _module_priority(name: str, config: Dict[str, Any]) -> int:
 
 
 @all_app.command("module")
+@deferred_lockfile_sync()
 def add_all(
     profile: str = typer.Option("fastapi/standard", help="Target profile"),
     project: str = typer.Option(None, help="Project name inside boilerplates"),
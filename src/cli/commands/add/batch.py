@@ -0,0 +1,147 @@
+# src/cli/commands/add/batch.py
+"""Install several modules into one project inside a single process.
+
+``rapidkit create`` used to spawn ``rapidkit add module <m> --force`` once per
+essential module, paying for a fresh interpreter, a full manifest scan, a hash
+registry round-trip and a lockfile sync every time. The batch installer runs
+``add_module`` in-process instead and shares that work across the whole batch:
+
+* the manifest graph is scanned once and the install order is resolved once;
+* ``.rapidkit/file-hashes.json`` is loaded once and written once at the end;
+* ``poetry lock`` / ``npm install --package-lock-only`` runs at most once.
+
+Console output of each install is captured so callers can report per-module
+results in their own format.
+"""
+
+from __future__ import annotations
+
+import io
+from contextlib import ExitStack, redirect_stderr, redirect_stdout
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence
+
+import click
+
+from core.engine.dependency_installer import deferred_lockfile_sync
+from core.services.file_hash_registry import hash_registry_session
+from core.services.module_manifest import (
+    ModuleManifest,
+    cached_manifest_scan,
+    load_all_manifests,
+)
+
+from .module import MODULES_PATH, add_module
+
+
+@dataclass
+class ModuleInstallResult:
+    """Outcome of a single module install within a batch."""
+
+    module: str
+    ok: bool
+    output: str = ""
+    # Set when the install raised unexpectedly rather than exiting with an error code.
+    error: Optional[str] = None
+
+
+def resolve_batch_order(modules: Sequence[str], manifests: Dict[str, ModuleManifest]) -> List[str]:
+    """Return ``modules`` with their manifest dependencies placed first.
+
+    Requested order is preserved wherever the dependency graph allows it, so a
+    list that is already topologically sorted comes back unchanged. Unknown slugs
+    are kept in place and left for ``add_module`` to report.
+    """
+
+    ordered: List[str] = []
+    visiting: set[str] = set()
+
+    def visit(slug: str) -> None:
+        if slug in ordered or slug in visiting:
+            return
+        visiting.add(slug)
+        manifest = manifests.get(slug)
+        for dep in (manifest.depends_on if manifest else None) or []:
+            visit(dep)
+        visiting.discard(slug)
+        ordered.append(slug)
+
+    for module in modules:
+        visit(module)
+    return ordered
+
+
+def install_modules_batch(
+    modules: Sequence[str],
+    *,
+    profile: str,
+    project: str,
+    force: bool = False,
+    final: bool = False,
+    on_start: Optional[Callable[[str], None]] = None,
+    on_result: Optional[Callable[[ModuleInstallResult], None]] = None,
+) -> List[ModuleInstallResult]:
+    """Install ``modules`` into ``project`` as one batch.
+
+    A failing module does not abort the batch; its result carries the captured
+    output instead. Deferred work (hash registry write, lockfile sync) runs once
+    after the last module, even when some installs failed; errors raised by that
+    final step (e.g. ``poetry lock`` failing) propagate to the caller.
+    """
+
+    project_root = Path(project)
+    results: List[ModuleInstallResult] = []
+
+    with ExitStack() as stack:
+        stack.enter_context(cached_manifest_scan(MODULES_PATH))
+        stack.enter_context(hash_registry_session(project_root))
+        stack.enter_context(deferred_lockfile_sync())
+
+        order = resolve_batch_order(modules, load_all_manifests(MODULES_PATH))
+        for module in order:
+            if on_start is not None:
+                on_start(module)
+            result = _install_one(
+                module, profile=profile, project=project, force=force, final=final
+            )
+            results.append(result)
+            if on_result is not None:
+                on_result(result)
+
+    return results
+
+
+def _install_one(
+    module: str, *, profile: str, project: str, force: bool, final: bool
+) -> ModuleInstallResult:
+    buffer = io.StringIO()
+    try:
+        with redirect_stdout(buffer), redirect_stderr(buffer):
+            add_module(
+                module,
+                profile=profile,
+                project=project,
+                final=final,
+                force=force,
+                update=False,
+                plan=False,
+                # The batch order already contains the dependency closure.
+                with_deps=False,
+                no_deps=False,
+                reconcile=True,
+            )
+    except click.exceptions.Exit as exc:
+        ok = exc.exit_code == 0
+        return ModuleInstallResult(module=module, ok=ok, output=buffer.getvalue())
+    except SystemExit as exc:
+        ok = exc.code in (0, None)
+        return ModuleInstallResult(module=module, ok=ok, output=buffer.getvalue())
+    except click.ClickException as exc:
+        output = buffer.getvalue() + exc.format_message()
+        return ModuleInstallResult(module=module, ok=False, output=output)
+    except Exception as exc:  # noqa: BLE001 - one module must not abort the batch
+        return ModuleInstallResult(
+            module=module, ok=False, output=buffer.getvalue(), error=str(exc) or repr(exc)
+        )
+    return ModuleInstallResult(module=module, ok=True, output=buffer.getvalue())
@@ -18,7 +18,7 @@ import typer
 import yaml
 from typer.models import OptionInfo
 
-from core.engine.dependency_installer import install_module_dependencies
+from core.engine.dependency_installer import deferred_lockfile_sync, install_module_dependencies
 from core.hooks.framework_handlers import (
     handle_fastapi_router,
     handle_nestjs_module,
@@ -903,6 +903,7 @@ def detect_framework_from_profile(profile: str) -> str:
     return profile.split("/")[0]
 
 
+@deferred_lockfile_sync()
 def add_module(
     name: str,
     profile: Optional[str] = typer.Option(
@@ -0,0 +1,74 @@
+"""`rapidkit deps` – inspect and resolve journalled dependency changes."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Optional
+
+import typer
+
+from core.engine.dependency_installer import (
+    load_deps_journal,
+    sync_pending_lockfiles,
+)
+
+from ..ui.printer import print_error, print_info, print_success
+from ..utils.filesystem import find_project_root
+
+deps_app = typer.Typer(help="Dependency lockfile utilities")
+
+
+def _resolve_project(project: Optional[str]) -> Path:
+    project_root = find_project_root(project)
+    if project_root is None:
+        print_error("❌ Not a valid RapidKit project.")
+        raise typer.Exit(code=1)
+    return project_root
+
+
+@deps_app.command("status")
+def status(
+    project: Optional[str] = typer.Option(
+        None, "--project", "-p", help="Target project root (defaults to auto-detect)."
+    ),
+) -> None:
+    """Show manifest edits that have not been resolved into a lockfile yet."""
+
+    project_root = _resolve_project(project)
+    journal = load_deps_journal(project_root)
+    pending = journal["pending"]
+    if not pending:
+        print_success("✅ Lockfiles are in sync with recorded dependency changes")
+        return
+    print_info(f"🕒 {len(pending)} pending dependency change(s):")
+    for entry in pending:
+        packages = ", ".join(entry.get("packages") or []) or "(normalisation only)"
+        origin = f" [{entry['module']}]" if entry.get("module") else ""
+        print_info(f"   • {entry.get('file')}{origin}: {packages}")
+
+
+@deps_app.command("sync")
+def sync(
+    project: Optional[str] = typer.Option(
+        None, "--project", "-p", help="Target project root (defaults to auto-detect)."
+    ),
+    force: bool = typer.Option(
+        False,
+        "--force",
+        help="Resolve lockfiles even if the dependency set hash is unchanged.",
+    ),
+) -> None:
+    """Resolve pending dependency changes into poetry.lock / package-lock.json."""
+
+    project_root = _resolve_project(project)
+    try:
+        results = sync_pending_lockfiles(project_root, force=force)
+    except RuntimeError as exc:
+        print_error(f"❌ {exc}")
+        raise typer.Exit(code=1) from exc
+    if not results:
+        print_info("Nothing to sync; no pending dependency changes recorded.")
+        return
+    for kind, outcome in results.items():
+        print_info(f"   {kind}: {outcome}")
+    print_success("✅ Lockfiles synced")
@@ -8,7 +8,13 @@ import typer
 
 from core.rendering.template_renderer import render_template
 from core.services.config_loader import load_module_config
-from core.services.file_hash_registry import _sha256, load_hashes, load_snapshot
+from core.services.file_hash_registry import (
+    _sha256,
+    drain_verifications,
+    hash_tracked_file,
+    load_hashes,
+    load_snapshot,
+)
 from core.services.module_manifest import load_manifest_or_none
 from core.services.profile_utils import resolve_profile_chain
 
@@ -107,6 +113,13 @@ def _collect_module_files(
     return all_files
 
 
+def _report_stat_mismatches() -> None:
+    # Diff is read-only: refreshed stats stay in memory and file-hashes.json is never
+    # written here; mutating commands persist stats when they record files.
+    for rel in drain_verifications():
+        print_warning(f"⚠️ {rel} changed without a stat change; cached stat dropped")
+
+
 @diff_app.command("module")
 def diff_module(
     name: str,
@@ -224,14 +237,7 @@ def diff_module(
         entry = hash_registry.get("files", {}).get(rel_record)
         registry_hash = entry.get("hash") if entry else None
         previous_hash = entry.get("previous_hash") if entry else None
-        if dst.exists():
-            try:
-                cur_bytes = dst.read_bytes()
-            except OSError:
-                cur_bytes = b""
-            current_hash = _sha256(cur_bytes)
-        else:
-            current_hash = None
+        current_hash, _ = hash_tracked_file(project_root, hash_registry, rel_record)
 
         status = classify_file_status(dst.exists(), registry_hash, current_hash, regen_hash)
 
@@ -269,6 +275,7 @@ def diff_module(
             except OSError:
                 pass
         report.append(item)
+    _report_stat_mismatches()
 
     if json_output or merge_json:
         merge_files = []
@@ -458,19 +465,13 @@ def diff_all(
             rel_record = str(dst.relative_to(project_root))
             entry = hash_registry.get("files", {}).get(rel_record)
             registry_hash = entry.get("hash") if entry else None
-            if dst.exists():
-                try:
-                    cur_bytes = dst.read_bytes()
-                except OSError:
-                    cur_bytes = b""
-                current_hash = _sha256(cur_bytes)
-            else:
-                current_hash = None
+            current_hash, _ = hash_tracked_file(project_root, hash_registry, rel_record)
             status = classify_file_status(dst.exists(), registry_hash, current_hash, regen_hash)
             counts[status] = counts.get(status, 0) + 1
             report.append({"file": rel_record, "status": status})
 
         results.append({"module": mod_name, "summary": counts, "files": report})
+    _report_stat_mismatches()
     print(
         json.dumps(
             {
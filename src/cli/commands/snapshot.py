@@ -6,15 +6,18 @@ from typing import Any, Dict, Optional
 import typer
 
 from core.rendering.template_renderer import render_template
+from core.services.blob_store import OBJECTS_DIR, BlobStore
 from core.services.config_loader import load_module_config
 from core.services.file_hash_registry import (
     _sha256,
     load_hashes,
     load_snapshot,
+    referenced_hashes,
     save_hashes,
     store_snapshot,
 )
 from core.services.profile_utils import resolve_profile_chain
+from core.services.vendor_store import archive_vendor_versions
 
 from ..ui.printer import print_error, print_info, print_success, print_warning
 from ..utils.filesystem import find_project_root
@@ -216,33 +219,64 @@ def snapshot_backfill(
 @snapshot_app.command("gc")
 def snapshot_gc(
     project: str = typer.Option(None, help="Project name inside boilerplates"),
-    keep: int = typer.Option(200, help="Maximum number of snapshot files to retain"),
+    keep: int = typer.Option(200, help="Maximum number of loose snapshot files to retain"),
     max_age_days: int = typer.Option(
         0, help="Delete snapshots older than this many days (0 = ignore age)"
     ),
+    prune_vendor: bool = typer.Option(
+        False,
+        "--prune-vendor",
+        help="Archive vendor copies of superseded module versions into the pack store",
+    ),
     dry_run: bool = typer.Option(False, "--dry-run", help="Show what would be deleted"),
     json_output: bool = typer.Option(False, "--json", help="Emit JSON summary"),
 ) -> None:
-    """Garbage collect snapshot files to control storage growth.
-
-    Retention logic (both filters can apply):
-      1. Age filter: if max_age_days>0 delete snapshots whose mtime older than threshold.
-      2. Count filter: after age removals, if total still > keep, delete oldest until count==keep.
+    """Garbage collect snapshot storage to control growth of .rapidkit/.
 
-    Safety: Only removes files under .rapidkit/snapshots/.
+    Steps:
+      1. Referenced loose snapshots (.rapidkit/snapshots/<hash>) are moved into the
+         packed store (.rapidkit/objects) so the retention below can never lose them.
+      2. Loose retention: if max_age_days>0 delete loose files older than the
+         threshold; then, if still more than keep, delete the oldest until count==keep.
+      3. With --prune-vendor, vendor trees of versions no longer recorded in
+         file-hashes.json are archived into the pack (load_vendor_file still finds them).
+      4. Packed blobs not referenced by file-hashes.json or an archived vendor
+         ref follow the same age/count retention as loose files; the rest are
+         dropped and the packs are compacted.
     """
     project_root = find_project_root(project)
     if not project_root:
         print_error("❌ Not a valid RapidKit project.")
         raise typer.Exit(code=1)
     snap_dir = project_root / ".rapidkit" / "snapshots"
-    if not snap_dir.exists():
+    objects_dir = project_root / OBJECTS_DIR
+    if not snap_dir.exists() and not objects_dir.exists() and not prune_vendor:
         if json_output:
             print(json.dumps({"deleted": 0, "kept": 0, "reason": "no_dir"}))
             return
         print_info("No snapshots directory.")
         return
-    files = [p for p in snap_dir.iterdir() if p.is_file()]
+
+    registry = load_hashes(project_root)
+    live = referenced_hashes(registry)
+    store = BlobStore.for_project(project_root)
+
+    files = [p for p in snap_dir.iterdir() if p.is_file()] if snap_dir.exists() else []
+    packed_loose = 0
+    if not dry_run:
+        unpacked = []
+        for f in files:
+            if f.name not in live:
+                unpacked.append(f)
+                continue
+            try:
+                store.put(f.read_bytes())
+                f.unlink()
+                packed_loose += 1
+            except OSError:
+                unpacked.append(f)
+        files = unpacked
+
     now = datetime.utcnow().timestamp()
     age_threshold = now - max_age_days * 86400 if max_age_days > 0 else None
     age_deleted = []
@@ -271,6 +305,24 @@ def snapshot_gc(
                 f.unlink()
             except OSError:
                 continue
+
+    vendor_archived = []
+    if prune_vendor:
+        installed = {
+            (entry["module"], entry["version"])
+            for entry in (registry.get("files") or {}).values()
+            if isinstance(entry, dict)
+            and isinstance(entry.get("module"), str)
+            and isinstance(entry.get("version"), str)
+        }
+        vendor_archived = archive_vendor_versions(project_root, installed, dry_run=dry_run)
+    pack_stats = store.gc(
+        live,
+        keep=keep if keep > 0 else None,
+        max_age_seconds=max_age_days * 86400 if max_age_days > 0 else 0,
+        dry_run=dry_run,
+    )
+
     result = {
         "schema_version": "snapshot-gc-v1",
         "deleted": len(to_delete),
@@ -280,6 +332,9 @@ def snapshot_gc(
         "dry_run": dry_run,
         "keep_limit": keep,
         "max_age_days": max_age_days,
+        "packed_loose": packed_loose,
+        "vendor_archived": vendor_archived,
+        "pack": pack_stats.as_dict(),
     }
     if json_output:
         print(json.dumps(result, indent=2))
@@ -287,6 +342,11 @@ def snapshot_gc(
         print_info(
             f"Snapshots kept: {result['kept']} | deleted(age={result['deleted_age']}, count={result['deleted_count']})"
         )
+        print_info(
+            f"Pack objects: {pack_stats.objects_after}/{pack_stats.objects_before} kept "
+            f"({pack_stats.bytes_before} -> {pack_stats.bytes_after} bytes) | "
+            f"loose packed: {packed_loose} | vendor versions archived: {len(vendor_archived)}"
+        )
         if dry_run:
             print_warning("Dry-run: no files removed.")
         print_success("GC complete.")
@@ -9,6 +9,7 @@ from core.rendering.template_renderer import render_template
 from core.services.config_loader import load_module_config
 from core.services.file_hash_registry import (
     _sha256,
+    hash_tracked_file,
     load_hashes,
     record_file_hash,
     save_hashes,
@@ -165,14 +166,10 @@ def _plan_or_apply_upgrade(
         rel_record = str(dst.relative_to(project_root))
         entry = hash_registry.get("files", {}).get(rel_record)
         registry_hash = entry.get("hash") if entry else None
-        if dst.exists():
-            try:
-                current_bytes = dst.read_bytes()
-            except OSError:
-                current_bytes = b""
-            current_hash = _sha256(current_bytes)
-        else:
-            current_hash = None
+        # Upgrades overwrite files, so a stale stat must never hide a local edit.
+        current_hash, _ = hash_tracked_file(
+            project_root, hash_registry, rel_record, trust_stat=False
+        )
         status = classify_file_status(dst.exists(), registry_hash, current_hash, regenerated_hash)
         do_update = False
         reason = None
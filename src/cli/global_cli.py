@@ -188,6 +188,7 @@ def _get_engine_commands() -> dict[str, str]:
         "rollback": "Roll back changes",
         "uninstall": "Remove module",
         "checkpoint": "Create checkpoint",
+        "deps": "Sync dependency lockfiles",
         "optimize": "Optimize project",
         "snapshot": "Snapshot utilities",
         "frameworks": "Detect or scaffold frameworks",
@@ -554,6 +555,7 @@ def _run_global_command(argv: list[str]) -> None:  # noqa: PLR0911
         "rollback",
         "uninstall",
         "checkpoint",
+        "deps",
         "doctor",
         "optimize",
         "snapshot",
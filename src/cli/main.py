@@ -25,6 +25,7 @@ from . import _compat as _compat_shim  # noqa: F401
 from .commands import create_app, info, license_app
 from .commands.add import add_app
 from .commands.checkpoint import checkpoint_app
+from .commands.deps import deps_app
 from .commands.dev import dev_app
 from .commands.diff import diff_app
 from .commands.doctor import doctor_app
@@ -179,6 +180,7 @@ Global commands:
   rapidkit rollback      Roll back changes
   rapidkit uninstall     Remove module
   rapidkit checkpoint    Create checkpoint
+  rapidkit deps          Sync dependency lockfiles
   rapidkit optimize      Optimize project
   rapidkit snapshot      Snapshot utilities
   rapidkit frameworks    Detect or scaffold frameworks
@@ -231,6 +233,7 @@ app.add_typer(upgrade_app, name="upgrade")
 app.add_typer(rollback_app, name="rollback")
 app.add_typer(uninstall_app, name="uninstall")
 app.add_typer(checkpoint_app, name="checkpoint")
+app.add_typer(deps_app, name="deps")
 app.command(name="list")(list_kits)
 app.command(name="info")(info)
 app.command(name="version")(version_cmd)
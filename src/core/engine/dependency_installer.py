@@ -1,12 +1,16 @@
 # src / core / engine / dependency_installer.py
 
+import hashlib
 import json
 import os
 import re
 import subprocess
+import sys
+from contextlib import contextmanager
+from datetime import datetime, timezone
 from json import JSONDecodeError
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
 from cli.ui.printer import print_info, print_success, print_warning
 from cli.utils.filesystem import find_project_root
@@ -17,6 +21,11 @@ from core.services.snippet_injector import (
     parse_poetry_dependency_line,
 )
 
+if sys.version_info >= (3, 11):
+    import tomllib
+else:  # pragma: no cover - Python 3.10 ships tomli via black
+    import tomli as tomllib
+
 
 def _sync_poetry_lockfile(project_root: Path) -> None:
     """Sync poetry.lock with pyproject.toml.
@@ -132,6 +141,238 @@ def _sync_npm_lockfile(project_root: Path) -> None:
         print_success(f"🔒 Synced {package_lock_path}")
 
 
+DEPS_JOURNAL_DIR = ".rapidkit"
+DEPS_JOURNAL_FILE = "deps-journal.json"
+DEFER_LOCKFILE_SYNC_ENV = "RAPIDKIT_DEFER_LOCKFILE_SYNC"
+
+# Manifest and lockfile per supported tool; the manifest feeds the dependency-set hash.
+_LOCKFILE_TOOLS: Dict[str, Tuple[str, str]] = {
+    "poetry": ("pyproject.toml", "poetry.lock"),
+    "npm": ("package.json", "package-lock.json"),
+}
+_NPM_DEPENDENCY_SECTIONS = (
+    "dependencies",
+    "devDependencies",
+    "peerDependencies",
+    "optionalDependencies",
+)
+
+# Lockfile syncs requested while a batch is open; ``None`` means sync immediately.
+_DEFERRED_LOCK_SYNCS: Dict[str, Optional[Dict[Tuple[str, Path], None]]] = {"pending": None}
+
+
+def _poetry_dependency_set(payload: Dict[str, Any]) -> List[Tuple[str, str, str]]:
+    """Return sorted ``(section, name, spec)`` entries from Poetry dependency tables."""
+
+    poetry = payload.get("tool", {}).get("poetry", {})
+    if not isinstance(poetry, dict):
+        return []
+    sections: List[Tuple[str, Any]] = [
+        ("tool.poetry.dependencies", poetry.get("dependencies")),
+        ("tool.poetry.dev-dependencies", poetry.get("dev-dependencies")),
+    ]
+    groups = poetry.get("group")
+    if isinstance(groups, dict):
+        sections.extend(
+            (f"tool.poetry.group.{name}.dependencies", group.get("dependencies"))
+            for name, group in groups.items()
+            if isinstance(group, dict)
+        )
+    entries: List[Tuple[str, str, str]] = []
+    for section, deps in sections:
+        if not isinstance(deps, dict):
+            continue
+        for name, spec in deps.items():
+            value = spec.strip() if isinstance(spec, str) else json.dumps(spec, sort_keys=True)
+            entries.append((section, name.lower().replace("_", "-"), value))
+    return sorted(entries)
+
+
+def _npm_dependency_set(payload: Dict[str, Any]) -> List[Tuple[str, str, str]]:
+    entries: List[Tuple[str, str, str]] = []
+    for section in _NPM_DEPENDENCY_SECTIONS:
+        deps = payload.get(section)
+        if isinstance(deps, dict):
+            entries.extend((section, str(name), str(spec).strip()) for name, spec in deps.items())
+    return sorted(entries)
+
+
+def dependency_set_hash(kind: str, project_root: Path) -> Optional[str]:
+    """Hash the normalised dependency set declared in the project manifest.
+
+    Formatting, ordering and comment churn do not change the hash; only the
+    declared packages and their specs do. Returns None when the manifest is
+    missing or unreadable.
+    """
+
+    manifest_name, _lock_name = _LOCKFILE_TOOLS[kind]
+    manifest_path = project_root / manifest_name
+    try:
+        text = manifest_path.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        return None
+    if kind == "poetry":
+        try:
+            entries = _poetry_dependency_set(tomllib.loads(text))
+        except tomllib.TOMLDecodeError:
+            return None
+    else:
+        try:
+            payload = json.loads(text)
+        except JSONDecodeError:
+            return None
+        entries = _npm_dependency_set(payload) if isinstance(payload, dict) else []
+    return hashlib.sha256(json.dumps(entries).encode("utf-8")).hexdigest()
+
+
+def load_deps_journal(project_root: Path) -> Dict[str, Any]:
+    """Load the dependency-change journal (pending manifest edits + last synced hashes)."""
+
+    path = project_root / DEPS_JOURNAL_DIR / DEPS_JOURNAL_FILE
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, UnicodeDecodeError, JSONDecodeError):
+        data = {}
+    if not isinstance(data, dict):
+        data = {}
+    if not isinstance(data.get("pending"), list):
+        data["pending"] = []
+    if not isinstance(data.get("synced"), dict):
+        data["synced"] = {}
+    return data
+
+
+def _save_deps_journal(project_root: Path, data: Dict[str, Any]) -> None:
+    directory = project_root / DEPS_JOURNAL_DIR
+    directory.mkdir(parents=True, exist_ok=True)
+    (directory / DEPS_JOURNAL_FILE).write_text(
+        json.dumps(data, indent=2, sort_keys=True) + "\n", encoding="utf-8"
+    )
+
+
+def _journal_dependency_change(
+    kind: str, project_root: Path, packages: Iterable[str], module: Optional[str] = None
+) -> None:
+    journal = load_deps_journal(project_root)
+    entry: Dict[str, Any] = {
+        "tool": kind,
+        "file": _LOCKFILE_TOOLS[kind][0],
+        "packages": sorted(set(packages)),
+        "recorded_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+    }
+    if module:
+        entry["module"] = module
+    # Repeat changes replace their earlier entry, so the journal stays bounded
+    # even in projects that never get a lockfile.
+    identity = (kind, entry.get("module"), entry["packages"])
+    journal["pending"] = [
+        pending
+        for pending in journal["pending"]
+        if (pending.get("tool"), pending.get("module"), pending.get("packages")) != identity
+    ]
+    journal["pending"].append(entry)
+    _save_deps_journal(project_root, journal)
+
+
+def sync_lockfile(kind: str, project_root: Path, *, force: bool = False) -> str:
+    """Resolve the lockfile for ``kind`` unless the dependency set is unchanged.
+
+    Returns ``"synced"``, ``"unchanged"`` (hash matches the last successful sync
+    and the lockfile exists) or ``"skipped"`` (no manifest, or no lockfile to
+    update). Journal entries for ``kind`` are cleared only once a lockfile is
+    known to match the manifest; otherwise they stay pending.
+    """
+
+    current = dependency_set_hash(kind, project_root)
+    if current is None:
+        return "skipped"
+    _manifest_name, lock_name = _LOCKFILE_TOOLS[kind]
+    lock_path = project_root / lock_name
+    journal = load_deps_journal(project_root)
+    if not force and journal["synced"].get(kind) == current and lock_path.exists():
+        status = "unchanged"
+        print_info(f"⏭ Dependency set unchanged; skipping {lock_name} resolution")
+    else:
+        sync = _sync_poetry_lockfile if kind == "poetry" else _sync_npm_lockfile
+        sync(project_root)
+        # The sync helpers return early when there is no lockfile to update.
+        if not lock_path.exists():
+            return "skipped"
+        status = "synced"
+        journal["synced"][kind] = current
+    journal["pending"] = [entry for entry in journal["pending"] if entry.get("tool") != kind]
+    _save_deps_journal(project_root, journal)
+    return status
+
+
+def sync_pending_lockfiles(project_root: Path, *, force: bool = False) -> Dict[str, str]:
+    """Sync every tool with journalled changes (or every present tool when ``force``)."""
+
+    journal = load_deps_journal(project_root)
+    kinds = {entry.get("tool") for entry in journal["pending"]}
+    if force:
+        kinds |= {
+            kind
+            for kind, (manifest_name, _lock) in _LOCKFILE_TOOLS.items()
+            if (project_root / manifest_name).exists()
+        }
+    return {
+        kind: sync_lockfile(kind, project_root, force=force)
+        for kind in sorted(k for k in kinds if k in _LOCKFILE_TOOLS)
+    }
+
+
+def _lockfile_sync_deferred() -> bool:
+    return os.environ.get(DEFER_LOCKFILE_SYNC_ENV, "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+def _request_lockfile_sync(
+    kind: str,
+    project_root: Path,
+    packages: Iterable[str] = (),
+    module: Optional[str] = None,
+) -> None:
+    """Journal a manifest edit, then sync now, at the end of the batch, or on demand."""
+
+    _journal_dependency_change(kind, project_root, packages, module)
+    pending = _DEFERRED_LOCK_SYNCS["pending"]
+    if pending is not None:
+        pending.setdefault((kind, project_root.resolve()), None)
+        return
+    if _lockfile_sync_deferred():
+        print_info(f"🕒 Lockfile sync deferred; run `rapidkit deps sync` to update {kind} lock")
+        return
+    sync_lockfile(kind, project_root)
+
+
+@contextmanager
+def deferred_lockfile_sync() -> Iterator[None]:
+    """Coalesce lockfile syncs requested inside the block into one sync per project.
+
+    Installing several modules back to back would otherwise run ``poetry lock`` /
+    ``npm install --package-lock-only`` after every module that touched the
+    manifest. Nested blocks join the outermost one. Queued syncs still run when
+    the block raises, so the lockfile never drifts from the manifest on disk.
+    Also usable as a decorator to scope the coalescing to one CLI command.
+    """
+
+    if _DEFERRED_LOCK_SYNCS["pending"] is not None:
+        yield
+        return
+    pending: Dict[Tuple[str, Path], None] = {}
+    _DEFERRED_LOCK_SYNCS["pending"] = pending
+    try:
+        yield
+    finally:
+        _DEFERRED_LOCK_SYNCS["pending"] = None
+        if _lockfile_sync_deferred():
+            if pending:
+                print_info("🕒 Lockfile sync deferred; run `rapidkit deps sync` when ready")
+        else:
+            for kind, project_root in pending:
+                sync_lockfile(kind, project_root)
+
+
 def _collect_external(deps: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     return [dep for dep in deps if dep.get("source") == "external"]
 
@@ -240,6 +481,8 @@ def install_module_dependencies(
             dependencies.append(dep)
 
     npm_deps = [dep for dep in dependencies if dep.get("tool") == "npm"]
+    raw_module_name = config.get("name")
+    module_name = raw_module_name if isinstance(raw_module_name, str) else None
 
     project_root = find_project_root(project)
     if project_root is None:
@@ -338,7 +581,12 @@ def install_module_dependencies(
             print_warning(f"⚠️ Failed to normalize poetry dependencies: {e}")
 
         if pyproject_changed and pyproject_file:
-            _sync_poetry_lockfile(project_root)
+            _request_lockfile_sync(
+                "poetry",
+                project_root,
+                packages=[str(dep.get("name")) for dep in external_deps if dep.get("name")],
+                module=module_name,
+            )
         # NOTE: Removed requirements.txt sync - using Poetry as single source of truth
         # Poetry workflow doesn't need requirements.txt files
 
@@ -358,7 +606,7 @@ def install_module_dependencies(
                         f"⚠️ package.json at {package_json_path} is not a JSON object; skipping npm dependency injection."
                     )
                 else:
-                    changed = False
+                    changed_packages: List[str] = []
                     for dep in npm_deps:
                         name = str(dep.get("name") or "").strip()
                         version = str(dep.get("version") or "").strip()
@@ -375,13 +623,15 @@ def install_module_dependencies(
                         if existing == version:
                             continue
                         section[name] = version
-                        changed = True
-                    if changed:
+                        changed_packages.append(name)
+                    if changed_packages:
                         package_json_path.write_text(
                             json.dumps(package_payload, indent=2) + "\n", encoding="utf-8"
                         )
                         print_success(f"✅ Updated {package_json_path}")
-                        _sync_npm_lockfile(project_root)
+                        _request_lockfile_sync(
+                            "npm", project_root, packages=changed_packages, module=module_name
+                        )
 
     for dep in dependencies:
         dep.pop(target_field, None)
@@ -3,8 +3,9 @@
 import importlib
 import importlib.util
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 # Use package-relative imports to avoid creating duplicate module objects
 # when the package is imported as `src.*` by the tests.
@@ -15,6 +16,20 @@ from core.rendering.template_renderer import TemplateRenderer
 from core.structure.structure_builder import StructureBuilder
 
 
+@dataclass(frozen=True)
+class RenderPlanItem:
+    """One structure entry whose conditions already passed.
+
+    Exactly one of ``template`` / ``content`` is set for files; ``directory``
+    entries carry neither.
+    """
+
+    path: str
+    template: Optional[str] = None
+    content: Optional[str] = None
+    directory: bool = False
+
+
 class BaseKitGenerator(ABC):
     """Abstract base class for all kit generators.
 
@@ -71,43 +86,72 @@ class BaseKitGenerator(ABC):
         builder.clean_output()
         self.structure_builder = builder
 
+        plan = self.plan_structure(validated_vars)
+        rendered = self._render_plan(plan, validated_vars)
+
         created_files: List[str] = []
+        writes: List[Tuple[str, str]] = []
+        for item, content in zip(plan, rendered):
+            if item.directory:
+                builder.create_directory(item.path)
+                continue
+            writes.append((item.path, content or ""))
+            created_files.append(str(output_path / item.path))
+        builder.write_files(writes, overwrite=True)
+
+        HookRunner.run(
+            self.kit_path,
+            self.config.hooks.get("post_generate", ""),
+            validated_vars,
+            output_path,
+        )
+        return created_files
+
+    def plan_structure(self, variables: Dict[str, Any]) -> List[RenderPlanItem]:
+        """Evaluate structure conditions and template selection up front."""
+
+        plan: List[RenderPlanItem] = []
         for item in self.config.structure:
-            if not self._check_conditions(item.conditions, validated_vars):
+            if not self._check_conditions(item.conditions, variables):
                 continue
-            full_path = output_path / item.path
             template_path: Optional[str] = None
             if item.template:
                 template_path = item.template
             elif hasattr(item, "template_if") and item.template_if:
-                key_val = validated_vars.get("license")
+                key_val = variables.get("license")
                 if isinstance(key_val, str):  # guard Optional[Any]
                     template_path = item.template_if.get(
                         key_val
                     )  # noqa: B905 (safe indexed access)
             if template_path:
-                try:
-                    content = self.template_renderer.render(template_path, validated_vars)
-                    builder.write_file(item.path, content, overwrite=True)
-                    created_files.append(str(full_path))
-                except TemplateError as e:
-                    raise TemplateError(f"Error rendering {template_path}: {e}") from e
+                plan.append(RenderPlanItem(item.path, template=template_path))
             elif item.content:
-                builder.write_file(item.path, item.content, overwrite=True)
-                created_files.append(str(full_path))
+                plan.append(RenderPlanItem(item.path, content=item.content))
             elif item.path.endswith("/"):
-                builder.create_directory(item.path)
+                plan.append(RenderPlanItem(item.path, directory=True))
             else:
-                builder.write_file(item.path, "", overwrite=True)
-                created_files.append(str(full_path))
+                plan.append(RenderPlanItem(item.path, content=""))
+        return plan
 
-        HookRunner.run(
-            self.kit_path,
-            self.config.hooks.get("post_generate", ""),
-            validated_vars,
-            output_path,
-        )
-        return created_files
+    def _render_plan(
+        self, plan: List[RenderPlanItem], variables: Dict[str, Any]
+    ) -> List[Optional[str]]:
+        """Render every template in ``plan``; results keep plan order.
+
+        Rendering is CPU-bound Python, so it stays serial: a thread pool only
+        adds contention on the GIL. The first failing entry raises.
+        """
+
+        rendered: List[Optional[str]] = []
+        for item in plan:
+            if item.template is None:
+                rendered.append(item.content)
+                continue
+            try:
+                rendered.append(self.template_renderer.render(item.template, variables))
+            except TemplateError as e:
+                raise TemplateError(f"Error rendering {item.template}: {e}") from e
+        return rendered
 
     def _run_hook(
         self,
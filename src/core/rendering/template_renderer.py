@@ -1,20 +1,54 @@
 # src / core / rendering / template_renderer.py
 
+import os
 import re
 import secrets
 import string
+import threading
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Tuple
 
 from jinja2 import (
+    BytecodeCache,
     ChoiceLoader,
     Environment,
+    FileSystemBytecodeCache,
     FileSystemLoader,
     StrictUndefined,
     TemplateError,
     TemplateNotFound,
     select_autoescape,
 )
+from jinja2.environment import Template
+
+# Opt-in directory for compiled template bytecode shared across processes.
+TEMPLATE_CACHE_DIR_ENV = "RAPIDKIT_TEMPLATE_CACHE_DIR"
+
+# One Environment (and therefore one compiled-template cache) per loader search path.
+_ENVIRONMENTS: Dict[Tuple[str, ...], Environment] = {}
+_ENVIRONMENTS_LOCK = threading.Lock()
+
+
+def _bytecode_cache() -> Optional[BytecodeCache]:
+    """Return the on-disk bytecode cache named by the env var, or None.
+
+    Nothing is written outside the project unless the user asks for it. Jinja
+    keys entries by template filename and source checksum, so edited templates
+    are recompiled; the cache only spares cold CLI runs the parse/compile cost
+    of unchanged kit templates.
+    """
+
+    raw = (os.environ.get(TEMPLATE_CACHE_DIR_ENV) or "").strip()
+    if raw.lower() in {"", "0", "off", "false", "no"}:
+        return None
+    directory = Path(raw).expanduser()
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+    except OSError:
+        return None
+    if not os.access(directory, os.W_OK):
+        return None
+    return FileSystemBytecodeCache(str(directory))
 
 
 class TemplateRenderer:
@@ -39,33 +73,55 @@ class TemplateRenderer:
         base_templates_path = templates_root / "base" / "templates"
         kit_common_path = self.template_root.parent / "common"
 
-        loaders = [FileSystemLoader(str(self.template_root))]
+        search_path = [str(self.template_root)]
         # Kits may provide sibling `common` directories for shared assets
         if kit_common_path.exists():
-            loaders.append(FileSystemLoader(str(kit_common_path)))
-        loaders.append(FileSystemLoader(str(base_templates_path)))
-
-        self.env = Environment(
-            loader=ChoiceLoader(loaders),
-            undefined=StrictUndefined,
-            trim_blocks=True,
-            lstrip_blocks=True,
-            autoescape=select_autoescape(),
-        )
-
-        self.env.filters.update(
-            {
-                "snake_case": self.snake_case,
-                "pascal_case": self.pascal_case,
-                "kebab_case": self.kebab_case,
-                "generate_secret": self.generate_secret,
-                "unique": self.unique,
-            }
-        )
+            search_path.append(str(kit_common_path))
+        search_path.append(str(base_templates_path))
+
+        self.env = self._shared_environment(tuple(search_path))
+
+    @classmethod
+    def _shared_environment(cls, search_path: Tuple[str, ...]) -> Environment:
+        """Return the process-wide Environment for ``search_path``.
+
+        Every generator for the same kit reuses one compiled-template cache
+        (unbounded, revalidated against template mtimes) instead of recompiling
+        each template per ``generate`` call.
+        """
+
+        with _ENVIRONMENTS_LOCK:
+            env = _ENVIRONMENTS.get(search_path)
+            if env is None:
+                env = Environment(
+                    loader=ChoiceLoader([FileSystemLoader(path) for path in search_path]),
+                    undefined=StrictUndefined,
+                    trim_blocks=True,
+                    lstrip_blocks=True,
+                    autoescape=select_autoescape(),
+                    cache_size=-1,
+                    bytecode_cache=_bytecode_cache(),
+                )
+                env.filters.update(
+                    {
+                        "snake_case": cls.snake_case,
+                        "pascal_case": cls.pascal_case,
+                        "kebab_case": cls.kebab_case,
+                        "generate_secret": cls.generate_secret,
+                        "unique": cls.unique,
+                    }
+                )
+                _ENVIRONMENTS[search_path] = env
+            return env
+
+    def get_template(self, template_name: str) -> Template:
+        """Load (and compile, once per process) ``template_name``."""
+
+        return self.env.get_template(template_name)
 
     def render(self, template_name: str, context: Dict[str, Any]) -> str:
         try:
-            template = self.env.get_template(template_name)
+            template = self.get_template(template_name)
             return template.render(**context)
         except TemplateNotFound as exc:
             fallback_candidates = []
@@ -0,0 +1,418 @@
+"""Compressed, content-addressed blob store for project metadata (``.rapidkit/objects``).
+
+Snapshots and archived vendor copies used to live as one loose file per blob.
+This store appends compressed blobs to a small number of packfiles instead and
+keeps an index mapping ``sha256 -> (pack, offset, length, codec)`` for O(1)
+lookup. Identical content is stored once no matter whether it was written as a
+snapshot or as a vendor copy.
+
+Layout::
+
+    .rapidkit/objects/pack-0001.pack   concatenated compressed blobs
+    .rapidkit/objects/index.json       compacted index (objects + named refs)
+    .rapidkit/objects/index.log        append-only JSON lines since last compaction
+    .rapidkit/objects/lock             advisory lock shared by writers
+
+Writes append to the current pack and to ``index.log`` while holding an
+advisory file lock, so concurrent CLI processes never interleave or
+overwrite each other's blobs. ``gc`` rewrites the retained objects into a
+fresh pack and folds the log into ``index.json``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib
+import json
+import os
+import sys
+import threading
+import time
+import zlib
+from contextlib import AbstractContextManager, contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+OBJECTS_DIR = ".rapidkit/objects"
+INDEX_FILE = "index.json"
+INDEX_LOG = "index.log"
+LOCK_FILE = "lock"
+PACK_PREFIX = "pack-"
+PACK_SUFFIX = ".pack"
+MAX_PACK_BYTES = 32 * 1024 * 1024
+
+try:  # optional dependency
+    _zstd: Any = importlib.import_module("zstandard")
+except ImportError:  # pragma: no cover - optional dependency
+    _zstd = None
+
+# (pack name, offset, stored length, codec, raw size)
+_Location = Tuple[str, int, int, str, int]
+
+if sys.platform == "win32":  # pragma: no cover - exercised on Windows only
+    import msvcrt
+
+    def _lock_fd(fd: int) -> None:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+
+    def _unlock_fd(fd: int) -> None:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+else:
+    import fcntl
+
+    def _lock_fd(fd: int) -> None:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+
+    def _unlock_fd(fd: int) -> None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+
+
+@contextmanager
+def _file_lock(path: Path) -> Iterator[None]:
+    """Hold an exclusive advisory lock on ``path`` (blocks until acquired)."""
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        _lock_fd(fd)
+        try:
+            yield
+        finally:
+            _unlock_fd(fd)
+    finally:
+        os.close(fd)
+
+
+def _compress(content: bytes) -> Tuple[str, bytes]:
+    if _zstd is not None:
+        packed = _zstd.ZstdCompressor(level=10).compress(content)
+        codec = "zstd"
+    else:
+        packed = zlib.compress(content, 6)
+        codec = "zlib"
+    if len(packed) >= len(content):
+        return "raw", content
+    return codec, packed
+
+
+def _decompress(codec: str, payload: bytes) -> bytes:
+    if codec == "raw":
+        return payload
+    if codec == "zlib":
+        return zlib.decompress(payload)
+    if codec == "zstd":
+        if _zstd is None:
+            raise RuntimeError("Blob was stored with zstd but 'zstandard' is not installed")
+        return bytes(_zstd.ZstdDecompressor().decompress(payload))
+    raise RuntimeError(f"Unknown blob codec '{codec}'")
+
+
+@dataclass
+class GCStats:
+    objects_before: int
+    objects_after: int
+    bytes_before: int
+    bytes_after: int
+
+    @property
+    def dropped(self) -> int:
+        return self.objects_before - self.objects_after
+
+    def as_dict(self) -> Dict[str, int]:
+        return {
+            "objects_before": self.objects_before,
+            "objects_after": self.objects_after,
+            "dropped": self.dropped,
+            "bytes_before": self.bytes_before,
+            "bytes_after": self.bytes_after,
+        }
+
+
+class BlobStore:
+    """Packfile-backed store for one project; use :meth:`for_project`."""
+
+    def __init__(self, project_root: Path) -> None:
+        self.root = project_root / OBJECTS_DIR
+        self._lock = threading.RLock()
+        self._objects: Dict[str, _Location] = {}
+        self._refs: Dict[str, Dict[str, str]] = {}
+        self._stored_at: Dict[str, int] = {}
+        self._stamp: Optional[Tuple[int, int]] = None
+
+    @classmethod
+    def for_project(cls, project_root: Path) -> "BlobStore":
+        key = project_root.resolve()
+        with _STORES_LOCK:
+            store = _STORES.get(key)
+            if store is None:
+                store = cls(key)
+                _STORES[key] = store
+            return store
+
+    # -- index -----------------------------------------------------------------
+
+    def _current_stamp(self) -> Tuple[int, int]:
+        stamps = []
+        for name in (INDEX_FILE, INDEX_LOG):
+            try:
+                st = (self.root / name).stat()
+                stamps.append(st.st_mtime_ns ^ st.st_size)
+            except OSError:
+                stamps.append(0)
+        return stamps[0], stamps[1]
+
+    def _refresh(self) -> None:
+        stamp = self._current_stamp()
+        if stamp == self._stamp:
+            return
+        objects: Dict[str, _Location] = {}
+        refs: Dict[str, Dict[str, str]] = {}
+        stored_at: Dict[str, int] = {}
+        try:
+            data = json.loads((self.root / INDEX_FILE).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            data = {}
+        if isinstance(data, dict):
+            for digest, loc in (data.get("objects") or {}).items():
+                objects[digest] = tuple(loc)
+            for digest, stamp in (data.get("stored_at") or {}).items():
+                stored_at[digest] = int(stamp)
+            for namespace, mapping in (data.get("refs") or {}).items():
+                if isinstance(mapping, dict):
+                    refs[namespace] = dict(mapping)
+        try:
+            lines = (self.root / INDEX_LOG).read_text(encoding="utf-8").splitlines()
+        except OSError:
+            lines = []
+        for line in lines:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue  # torn final line after a crash
+            if "object" in entry:
+                objects[entry["object"]] = tuple(entry["loc"])
+                if "t" in entry:
+                    stored_at[entry["object"]] = int(entry["t"])
+            elif "ref" in entry:
+                refs.setdefault(entry["ns"], {})[entry["ref"]] = entry["object_ref"]
+        self._objects = objects
+        self._refs = refs
+        self._stored_at = stored_at
+        self._stamp = stamp
+
+    def _append_log(self, entries: Iterable[Dict[str, Any]]) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        payload = "".join(json.dumps(entry, sort_keys=True) + "\n" for entry in entries)
+        with open(self.root / INDEX_LOG, "a", encoding="utf-8") as fh:
+            fh.write(payload)
+        self._stamp = self._current_stamp()
+
+    # -- packs -----------------------------------------------------------------
+
+    def _pack_names(self) -> List[str]:
+        if not self.root.exists():
+            return []
+        return sorted(
+            p.name
+            for p in self.root.iterdir()
+            if p.name.startswith(PACK_PREFIX) and p.name.endswith(PACK_SUFFIX)
+        )
+
+    def _next_pack_name(self) -> str:
+        names = self._pack_names()
+        last = int(names[-1][len(PACK_PREFIX) : -len(PACK_SUFFIX)]) if names else 0
+        return f"{PACK_PREFIX}{last + 1:04d}{PACK_SUFFIX}"
+
+    def _writable_pack(self) -> str:
+        names = self._pack_names()
+        if names:
+            current = names[-1]
+            if (self.root / current).stat().st_size < MAX_PACK_BYTES:
+                return current
+        return self._next_pack_name()
+
+    # -- public API ------------------------------------------------------------
+
+    def __contains__(self, digest: object) -> bool:
+        with self._lock:
+            self._refresh()
+            return digest in self._objects
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._refresh()
+            return len(self._objects)
+
+    def _locked(self) -> AbstractContextManager[None]:
+        return _file_lock(self.root / LOCK_FILE)
+
+    def put(self, content: bytes) -> str:
+        """Store ``content`` (once) and return its sha256 hex digest."""
+
+        digest = hashlib.sha256(content).hexdigest()
+        with self._lock:
+            self._refresh()
+            if digest in self._objects:
+                return digest
+            codec, payload = _compress(content)
+            with self._locked():
+                # Another process may have written the same blob or grown the pack.
+                self._refresh()
+                if digest in self._objects:
+                    return digest
+                pack = self._writable_pack()
+                with open(self.root / pack, "ab") as fh:
+                    offset = fh.tell()
+                    fh.write(payload)
+                loc: _Location = (pack, offset, len(payload), codec, len(content))
+                stored_at = int(time.time())
+                self._append_log([{"object": digest, "loc": list(loc), "t": stored_at}])
+            self._objects[digest] = loc
+            self._stored_at[digest] = stored_at
+        return digest
+
+    def get(self, digest: str) -> Optional[bytes]:
+        with self._lock:
+            self._refresh()
+            loc = self._objects.get(digest)
+        if loc is None:
+            return None
+        pack, offset, length, codec, _size = loc
+        try:
+            with open(self.root / pack, "rb") as fh:
+                fh.seek(offset)
+                payload = fh.read(length)
+        except OSError:
+            return None
+        if len(payload) != length:
+            return None
+        content = _decompress(codec, payload)
+        if hashlib.sha256(content).hexdigest() != digest:
+            return None
+        return content
+
+    def set_refs(self, namespace: str, refs: Dict[str, str]) -> None:
+        """Point named refs (e.g. archived vendor paths) at stored digests."""
+
+        if not refs:
+            return
+        with self._lock:
+            self._refresh()
+            current = self._refs.setdefault(namespace, {})
+            changed = {k: v for k, v in refs.items() if current.get(k) != v}
+            if not changed:
+                return
+            with self._locked():
+                self._append_log(
+                    {"ns": namespace, "ref": key, "object_ref": digest}
+                    for key, digest in sorted(changed.items())
+                )
+            current.update(changed)
+
+    def resolve(self, namespace: str, key: str) -> Optional[str]:
+        with self._lock:
+            self._refresh()
+            return self._refs.get(namespace, {}).get(key)
+
+    def refs(self, namespace: str) -> Dict[str, str]:
+        with self._lock:
+            self._refresh()
+            return dict(self._refs.get(namespace, {}))
+
+    def _age_key(self, digest: str) -> float:
+        stamp = self._stored_at.get(digest)
+        if stamp is not None:
+            return float(stamp)
+        try:  # objects written before timestamps were recorded
+            return (self.root / self._objects[digest][0]).stat().st_mtime
+        except OSError:
+            return 0.0
+
+    def _retained(
+        self, pinned: Set[str], limit: Optional[int], max_age_seconds: float, now: float
+    ) -> Set[str]:
+        """Unreferenced objects that survive the age and count limits, like loose snapshots."""
+
+        candidates = [(self._age_key(d), d) for d in self._objects if d not in pinned]
+        if max_age_seconds > 0:
+            candidates = [(t, d) for t, d in candidates if t >= now - max_age_seconds]
+        candidates.sort()  # oldest first
+        if limit is not None:
+            candidates = candidates[len(candidates) - limit :] if limit > 0 else []
+        return {d for _t, d in candidates}
+
+    def gc(
+        self,
+        live: Set[str],
+        *,
+        keep: Optional[int] = 0,
+        max_age_seconds: float = 0,
+        dry_run: bool = False,
+    ) -> GCStats:
+        """Compact packs, keeping ``live`` objects, ref targets and recent unreferenced ones.
+
+        Unreferenced objects follow the loose-snapshot retention rule: those older
+        than ``max_age_seconds`` (when > 0) are dropped, then only the newest
+        ``keep`` remain (``None`` = no count limit, ``0`` = drop them all).
+        """
+
+        with self._lock:
+            if dry_run or not self.root.exists():
+                self._refresh()
+                return self._plan_gc(live, keep, max_age_seconds)[1]
+            with self._locked():
+                self._refresh()
+                survivors, stats = self._plan_gc(live, keep, max_age_seconds)
+                self._compact(survivors)
+            return stats
+
+    def _plan_gc(
+        self, live: Set[str], keep: Optional[int], max_age_seconds: float
+    ) -> Tuple[List[str], GCStats]:
+        keep_set = set(live)
+        for mapping in self._refs.values():
+            keep_set.update(mapping.values())
+        keep_set |= self._retained(keep_set, keep, max_age_seconds, time.time())
+        survivors = sorted(d for d in self._objects if d in keep_set)
+        bytes_before = sum(loc[2] for loc in self._objects.values())
+        bytes_after = sum(self._objects[d][2] for d in survivors)
+        return survivors, GCStats(len(self._objects), len(survivors), bytes_before, bytes_after)
+
+    def _compact(self, survivors: List[str]) -> None:
+        old_packs = self._pack_names()
+        new_pack = self._next_pack_name()
+        new_objects: Dict[str, _Location] = {}
+        with open(self.root / new_pack, "wb") as out:
+            for digest in survivors:
+                pack, offset, length, codec, size = self._objects[digest]
+                with open(self.root / pack, "rb") as src:
+                    src.seek(offset)
+                    payload = src.read(length)
+                new_objects[digest] = (new_pack, out.tell(), length, codec, size)
+                out.write(payload)
+        stored_at = {d: int(self._age_key(d)) for d in survivors}
+        refs = {
+            ns: {k: v for k, v in mapping.items() if v in new_objects}
+            for ns, mapping in self._refs.items()
+        }
+        index = {"version": 1, "objects": new_objects, "refs": refs, "stored_at": stored_at}
+        tmp = self.root / f"{INDEX_FILE}.tmp"
+        tmp.write_text(json.dumps(index, sort_keys=True), encoding="utf-8")
+        os.replace(tmp, self.root / INDEX_FILE)
+        (self.root / INDEX_LOG).unlink(missing_ok=True)
+        for name in old_packs:
+            (self.root / name).unlink(missing_ok=True)
+        if not survivors:
+            (self.root / new_pack).unlink(missing_ok=True)
+        self._objects = new_objects
+        self._refs = refs
+        self._stored_at = stored_at
+        self._stamp = self._current_stamp()
+
+
+_STORES: Dict[Path, BlobStore] = {}
+_STORES_LOCK = threading.Lock()
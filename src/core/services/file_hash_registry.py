@@ -2,19 +2,40 @@
 
 Stores per-project hash of generated files to detect local user modifications
 on subsequent installs / upgrades.
+
+Entries may also carry ``stat: [size, mtime_ns, inode]`` captured when the file
+on disk was written or last confirmed to match ``hash``. :func:`hash_tracked_file`
+trusts an unchanged stat instead of re-reading the file; set ``RAPIDKIT_HASH_VERIFY``
+to ``background`` to re-hash those files off-thread or ``always`` to ignore stats.
+A stat captured right after a write is marked ``stat_racy`` and confirmed by one
+re-hash before it is trusted.
 """
 
 from __future__ import annotations
 
 import hashlib
 import json
-from contextlib import suppress
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager, suppress
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from core.services.blob_store import BlobStore
 
 REGISTRY_DIR = ".rapidkit"
 HASH_FILE = "file-hashes.json"
 SNAPSHOT_DIR = "snapshots"
+HASH_VERIFY_ENV = "RAPIDKIT_HASH_VERIFY"
+# Files modified this recently may still change without a visible mtime bump
+# (coarse timestamp granularity), so their stat is not trusted yet.
+_RACY_WINDOW_NS = 2_000_000_000
+
+# Open batch sessions keyed by resolved project root: {"data": registry, "dirty": bool}.
+_SESSIONS: Dict[Path, Dict[str, Any]] = {}
 
 
 def _sha256(content: bytes) -> str:
@@ -22,6 +43,13 @@ def _sha256(content: bytes) -> str:
 
 
 def load_hashes(project_root: Path) -> Dict[str, Any]:
+    session = _SESSIONS.get(project_root.resolve())
+    if session is not None:
+        return session["data"]  # type: ignore[no-any-return]
+    return _read_hashes(project_root)
+
+
+def _read_hashes(project_root: Path) -> Dict[str, Any]:
     f = project_root / REGISTRY_DIR / HASH_FILE
     if not f.exists():
         return {
@@ -37,9 +65,50 @@ def load_hashes(project_root: Path) -> Dict[str, Any]:
 
 
 def save_hashes(project_root: Path, data: Dict[str, Any]) -> None:
+    session = _SESSIONS.get(project_root.resolve())
+    if session is not None:
+        session["data"] = data
+        session["dirty"] = True
+        return
+    _write_hashes(project_root, data)
+
+
+def _write_hashes(project_root: Path, data: Dict[str, Any]) -> None:
     d = project_root / REGISTRY_DIR
     d.mkdir(parents=True, exist_ok=True)
-    (d / HASH_FILE).write_text(json.dumps(data, indent=2, sort_keys=True), encoding="utf-8")
+    payload = json.dumps(data, separators=(",", ":"), sort_keys=True)
+    fd, tmp = tempfile.mkstemp(prefix=f".{HASH_FILE}.", dir=d)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            fh.write(payload)
+        os.replace(tmp, d / HASH_FILE)
+    except BaseException:
+        with suppress(OSError):
+            os.unlink(tmp)
+        raise
+
+
+@contextmanager
+def hash_registry_session(project_root: Path) -> Iterator[Dict[str, Any]]:
+    """Share one in-memory hash registry across several installs.
+
+    Inside the block ``load_hashes`` returns the same dict and ``save_hashes``
+    only marks it dirty; the registry is written once on exit. Nested sessions
+    for the same project join the outer one.
+    """
+
+    key = project_root.resolve()
+    if key in _SESSIONS:
+        yield _SESSIONS[key]["data"]
+        return
+    session: Dict[str, Any] = {"data": _read_hashes(project_root), "dirty": False}
+    _SESSIONS[key] = session
+    try:
+        yield session["data"]
+    finally:
+        _SESSIONS.pop(key, None)
+        if session["dirty"]:
+            _write_hashes(project_root, session["data"])
 
 
 def _snapshot_path(project_root: Path, hash_value: str) -> Path:
@@ -47,19 +116,35 @@ def _snapshot_path(project_root: Path, hash_value: str) -> Path:
 
 
 def store_snapshot(project_root: Path, content: bytes) -> str:
-    h = _sha256(content)
-    p = _snapshot_path(project_root, h)
-    if not p.exists():  # write-once
-        p.parent.mkdir(parents=True, exist_ok=True)
-        p.write_bytes(content)
-    return h
+    """Store ``content`` in the project's packed blob store (write-once)."""
+
+    return BlobStore.for_project(project_root).put(content)
 
 
 def load_snapshot(project_root: Path, hash_value: str) -> Optional[bytes]:
+    content = BlobStore.for_project(project_root).get(hash_value)
+    if content is not None:
+        return content
+    # Loose snapshots written before the packed store existed.
     p = _snapshot_path(project_root, hash_value)
     return p.read_bytes() if p.exists() else None
 
 
+def referenced_hashes(registry: Dict[str, Any]) -> Set[str]:
+    """Return every hash (current, previous, history) referenced by ``registry``."""
+
+    live: Set[str] = set()
+    for entry in (registry.get("files") or {}).values():
+        if not isinstance(entry, dict):
+            continue
+        for key in ("hash", "previous_hash"):
+            value = entry.get(key)
+            if isinstance(value, str):
+                live.add(value)
+        live.update(h for h in entry.get("history") or [] if isinstance(h, str))
+    return live
+
+
 def record_file_hash(
     registry: Dict[str, Any],
     rel_path: str,
@@ -79,7 +164,9 @@ def record_file_hash(
         prev_prev = existing.get("previous_hash")
         if prev_prev and prev_prev not in history:
             history.append(prev_prev)
-    entry = {"hash": new_hash, "module": module, "version": version}
+    entry: Dict[str, Any] = {"hash": new_hash, "module": module, "version": version}
+    if project_root is not None:
+        _stamp_written_file(entry, project_root / rel_path, len(content))
     if previous_hash and previous_hash != new_hash:
         entry["previous_hash"] = previous_hash
     if history:
@@ -90,6 +177,124 @@ def record_file_hash(
     files[rel_path] = entry
 
 
+def _stat_stamp(st: os.stat_result) -> List[int]:
+    return [st.st_size, st.st_mtime_ns, st.st_ino]
+
+
+def _is_racy(st: os.stat_result) -> bool:
+    return time.time_ns() - st.st_mtime_ns <= _RACY_WINDOW_NS
+
+
+def _stamp_written_file(entry: Dict[str, Any], path: Path, size: int) -> None:
+    """Cache the stat of a file whose content was just written as ``entry["hash"]``."""
+
+    try:
+        st = path.stat()
+    except OSError:
+        return
+    if st.st_size != size:
+        return
+    entry["stat"] = _stat_stamp(st)
+    if _is_racy(st):
+        entry["stat_racy"] = True
+
+
+def _verify_mode() -> str:
+    mode = os.environ.get(HASH_VERIFY_ENV, "").strip().lower()
+    return mode if mode in {"background", "always"} else "off"
+
+
+_VERIFY_POOL: Optional[ThreadPoolExecutor] = None
+_VERIFY_LOCK = threading.Lock()
+_PENDING_VERIFICATIONS: List[Tuple[str, Dict[str, Any], "Future[Optional[str]]"]] = []
+
+
+def _hash_path(path: Path) -> Optional[str]:
+    try:
+        return _sha256(path.read_bytes())
+    except OSError:
+        return None
+
+
+def _schedule_verification(path: Path, rel_path: str, entry: Dict[str, Any]) -> None:
+    global _VERIFY_POOL
+    with _VERIFY_LOCK:
+        if _VERIFY_POOL is None:
+            _VERIFY_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="rapidkit-hash")
+        future: "Future[Optional[str]]" = _VERIFY_POOL.submit(_hash_path, path)
+        _PENDING_VERIFICATIONS.append((rel_path, entry, future))
+
+
+def drain_verifications() -> List[str]:
+    """Wait for background re-verification and return paths whose stat lied.
+
+    Mismatching entries lose their cached stat so the next check re-hashes them.
+    """
+
+    with _VERIFY_LOCK:
+        pending = list(_PENDING_VERIFICATIONS)
+        _PENDING_VERIFICATIONS.clear()
+    mismatched: List[str] = []
+    for rel_path, entry, future in pending:
+        if future.result() != entry.get("hash"):
+            entry.pop("stat", None)
+            mismatched.append(rel_path)
+    return mismatched
+
+
+def hash_tracked_file(
+    project_root: Path, registry: Dict[str, Any], rel_path: str, *, trust_stat: bool = True
+) -> Tuple[Optional[str], bool]:
+    """Return ``(current_hash, stat_refreshed)`` for a tracked file.
+
+    ``current_hash`` is ``None`` when the file does not exist. When the file's
+    (size, mtime_ns, inode) matches the entry's cached stat the recorded hash is
+    returned without reading the file. Otherwise the file is hashed and, if it
+    still matches the recorded hash, its stat is cached on the entry;
+    ``stat_refreshed`` tells mutating callers the registry is worth saving.
+    Read-only callers keep the refreshed stats in memory and never save.
+    Callers about to overwrite the file pass ``trust_stat=False`` to always hash.
+    """
+
+    path = project_root / rel_path
+    try:
+        st = path.stat()
+    except OSError:
+        return None, False
+    entry = (registry.get("files") or {}).get(rel_path)
+    if not isinstance(entry, dict):
+        entry = None
+    stamp = _stat_stamp(st)
+    mode = _verify_mode()
+    recorded = entry.get("hash") if entry else None
+    if (
+        entry
+        and isinstance(recorded, str)
+        and entry.get("stat") == stamp
+        and not entry.get("stat_racy")
+        and mode != "always"
+        and trust_stat
+    ):
+        if mode == "background":
+            _schedule_verification(path, rel_path, entry)
+        return recorded, False
+    try:
+        current = _sha256(path.read_bytes())
+    except OSError:
+        current = _sha256(b"")
+    refreshed = False
+    if entry is not None:
+        if current == recorded and not _is_racy(st):
+            refreshed = entry.get("stat") != stamp or "stat_racy" in entry
+            entry["stat"] = stamp
+            entry.pop("stat_racy", None)
+        elif "stat" in entry:
+            entry.pop("stat")
+            entry.pop("stat_racy", None)
+            refreshed = True
+    return current, refreshed
+
+
 def file_was_modified(registry: Dict[str, Any], rel_path: str, content: bytes) -> bool:
     entry_val = registry.get("files", {}).get(rel_path)
     if not isinstance(entry_val, dict):
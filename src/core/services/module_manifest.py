@@ -7,8 +7,9 @@ breaking existing call sites.
 
 from __future__ import annotations
 
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, List, Literal, Optional, Set
+from typing import Any, Dict, Iterator, List, Literal, Optional, Set
 
 from core.services.module_path_resolver import resolve_module_directory
 
@@ -104,6 +105,10 @@ def load_manifest_or_none(modules_root: Path, module_name: str) -> Optional[Modu
     return _with_slug(manifest, slug)
 
 
+# Active scan scopes keyed by modules root; ``None`` until the first scan in the scope.
+_MANIFEST_SCANS: Dict[Path, Optional[Dict[str, ModuleManifest]]] = {}
+
+
 class DependencyCycleError(RuntimeError):
     pass
 
@@ -134,6 +139,33 @@ def _slug_from_manifest_path(modules_root: Path, manifest_path: Path) -> str:
 
 
 def load_all_manifests(modules_root: Path) -> Dict[str, ModuleManifest]:
+    key = modules_root.resolve()
+    cached = _MANIFEST_SCANS.get(key)
+    if cached is not None:
+        return dict(cached)
+    manifests = _scan_manifests(modules_root)
+    if key in _MANIFEST_SCANS:
+        _MANIFEST_SCANS[key] = manifests
+        return dict(manifests)
+    return manifests
+
+
+@contextmanager
+def cached_manifest_scan(modules_root: Path) -> Iterator[None]:
+    """Reuse one ``module.yaml`` scan of ``modules_root`` for the duration of the block."""
+
+    key = modules_root.resolve()
+    if key in _MANIFEST_SCANS:
+        yield
+        return
+    _MANIFEST_SCANS[key] = None
+    try:
+        yield
+    finally:
+        _MANIFEST_SCANS.pop(key, None)
+
+
+def _scan_manifests(modules_root: Path) -> Dict[str, ModuleManifest]:
     manifests: Dict[str, ModuleManifest] = {}
     for manifest_path in modules_root.rglob("module.yaml"):
         if not manifest_path.is_file():
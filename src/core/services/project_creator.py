@@ -12,6 +12,13 @@ from core.engine.registry import KitRegistry
 from core.exceptions import RapidKitError, ValidationError
 from core.services.project_metadata import ProjectMetadata, save_project_metadata
 
+ESSENTIAL_MODULES = [
+    "free/essentials/settings",
+    "free/essentials/logging",
+    "free/essentials/deployment",
+    "free/essentials/middleware",
+]
+
 
 class ProjectCreatorService:
     def __init__(self) -> None:
@@ -95,7 +102,66 @@ class ProjectCreatorService:
         print_success_func: Callable,
         print_error_func: Callable,
     ) -> None:
-        """Install essential modules for the project."""
+        """Install essential modules for the project in one in-process batch.
+
+        Falls back to one ``rapidkit add module`` subprocess per module when the
+        CLI package is not importable (e.g. a core-only embedding).
+        """
+        try:
+            from cli.commands.add.batch import install_modules_batch
+        except ImportError:
+            self._install_essential_modules_subprocess(
+                project_path, profile, print_info_func, print_success_func, print_error_func
+            )
+            return
+
+        print_info_func("\n🔧 Installing essential modules...")
+
+        failed_modules: List[str] = []
+
+        def _on_start(module: str) -> None:
+            print_info_func(f"📦 Installing {module}...")
+
+        def _on_result(result: Any) -> None:
+            if result.ok:
+                print_success_func(f"✅ {result.module} installed successfully")
+                return
+            failed_modules.append(result.module)
+            if result.error:
+                print_error_func(f"❌ Error installing {result.module}: {result.error}")
+                return
+            details = result.output.strip()
+            if details:
+                print_error_func(f"❌ Failed to install {result.module}: {details}")
+            else:
+                print_error_func(f"❌ Failed to install {result.module} (no output)")
+
+        try:
+            install_modules_batch(
+                ESSENTIAL_MODULES,
+                profile=profile,
+                project=str(project_path),
+                force=True,
+                on_start=_on_start,
+                on_result=_on_result,
+            )
+        except Exception as e:  # noqa: BLE001 - lockfile sync failures should not abort creation
+            print_error_func(f"❌ Error finalizing essential modules: {e}")
+
+        if failed_modules:
+            print_error_func(
+                f"❌ Some essential modules failed to install: {', '.join(failed_modules)}"
+            )
+
+    def _install_essential_modules_subprocess(
+        self,
+        project_path: Path,
+        profile: str,
+        print_info_func: Callable,
+        print_success_func: Callable,
+        print_error_func: Callable,
+    ) -> None:
+        """Install essential modules by shelling out to ``rapidkit add module``."""
         rapidkit_exe: Optional[str] = None
 
         # Prefer the currently-running console script path.
@@ -130,18 +196,11 @@ class ProjectCreatorService:
                 "Activate your environment or ensure RapidKit is installed."
             )
 
-        essential_modules = [
-            "free/essentials/settings",
-            "free/essentials/logging",
-            "free/essentials/deployment",
-            "free/essentials/middleware",
-        ]
-
         print_info_func("\n🔧 Installing essential modules...")
 
         failed_modules: List[str] = []
 
-        for module in essential_modules:
+        for module in ESSENTIAL_MODULES:
             print_info_func(f"📦 Installing {module}...")
 
             # Call the rapidkit CLI command directly
@@ -1,11 +1,21 @@
-"""Utilities for storing and retrieving vendor copies of module files."""
+"""Utilities for storing and retrieving vendor copies of module files.
+
+Vendor copies of the installed module versions stay materialized on disk
+because generated runtime code imports from them. Superseded versions can be
+archived into the project's packed blob store (see :func:`archive_vendor_versions`);
+:func:`load_vendor_file` transparently reads them back from there.
+"""
 
 from __future__ import annotations
 
+import shutil
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from core.services.blob_store import BlobStore
 
 VENDOR_DIR = ".rapidkit/vendor"
+VENDOR_REF_NAMESPACE = "vendor"
 
 
 def _vendor_base(project_root: Path) -> Path:
@@ -48,9 +58,63 @@ def load_vendor_file(
 
     candidate = vendor_file_path(project_root, module, version, rel_path)
     if not candidate.exists():
-        return None
+        return _load_archived(project_root, module, version, rel_path)
 
     try:
         return candidate.read_bytes()
     except OSError:
         return None
+
+
+def _ref_key(module: str, version: str, rel_path: str) -> str:
+    parts = [segment for segment in module.split("/") if segment]
+    return "/".join([*parts, version, rel_path.replace("\\", "/")])
+
+
+def _load_archived(project_root: Path, module: str, version: str, rel_path: str) -> Optional[bytes]:
+    store = BlobStore.for_project(project_root)
+    digest = store.resolve(VENDOR_REF_NAMESPACE, _ref_key(module, version, rel_path))
+    return store.get(digest) if digest else None
+
+
+def archive_vendor_versions(
+    project_root: Path,
+    live: Iterable[Tuple[str, str]],
+    *,
+    dry_run: bool = False,
+) -> List[str]:
+    """Move vendor trees of superseded versions into the packed blob store.
+
+    ``live`` lists the ``(module, version)`` pairs that are currently installed.
+    Only modules appearing in ``live`` are considered, and only their other
+    version directories are archived. Returns ``"module@version"`` labels.
+    """
+
+    base = _vendor_base(project_root)
+    versions_by_module: Dict[str, Set[str]] = {}
+    for module, version in live:
+        versions_by_module.setdefault(module, set()).add(version)
+
+    store = BlobStore.for_project(project_root)
+    archived: List[str] = []
+    for module in sorted(versions_by_module):
+        module_dir = _module_path(base, module, "")
+        if not module_dir.is_dir():
+            continue
+        for version_dir in sorted(p for p in module_dir.iterdir() if p.is_dir()):
+            version = version_dir.name
+            nested = f"{module.strip('/')}/{version}"
+            if version in versions_by_module[module] or any(
+                other.strip("/").startswith(nested) for other in versions_by_module
+            ):
+                continue  # installed version, or a nested module namespace
+            archived.append(f"{module}@{version}")
+            if dry_run:
+                continue
+            refs: Dict[str, str] = {}
+            for path in sorted(p for p in version_dir.rglob("*") if p.is_file()):
+                rel = path.relative_to(version_dir).as_posix()
+                refs[_ref_key(module, version, rel)] = store.put(path.read_bytes())
+            store.set_refs(VENDOR_REF_NAMESPACE, refs)
+            shutil.rmtree(version_dir)
+    return archived
@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import Union
+from typing import Iterable, Tuple, Union
 
 
 class StructureBuilder:
@@ -18,7 +18,23 @@ class StructureBuilder:
     ) -> None:
         file_path = self.output_path / relative_path
         file_path.parent.mkdir(parents=True, exist_ok=True)
+        self._write(file_path, relative_path, content, overwrite)
 
+    def write_files(
+        self, entries: Iterable[Tuple[Union[str, Path], str]], overwrite: bool = True
+    ) -> None:
+        """Write many files, creating each distinct parent directory only once."""
+
+        resolved = [(self.output_path / rel, rel, content) for rel, content in entries]
+        for parent in sorted({file_path.parent for file_path, _rel, _content in resolved}):
+            parent.mkdir(parents=True, exist_ok=True)
+        for file_path, rel, content in resolved:
+            self._write(file_path, rel, content, overwrite)
+
+    @staticmethod
+    def _write(
+        file_path: Path, relative_path: Union[str, Path], content: str, overwrite: bool
+    ) -> None:
         if not overwrite and file_path.exists():
             return
 
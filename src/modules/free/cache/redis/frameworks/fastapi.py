@@ -36,6 +36,9 @@ class FastAPIPlugin(FrameworkPlugin):
         return {
             "client": "templates/variants/fastapi/redis_client.py.j2",
             "package": "templates/variants/fastapi/redis_package_init.py.j2",
+            "cache": "templates/base/redis_cache.py.j2",
+            "near_cache": "templates/base/redis_near_cache.py.j2",
+            "pipelining": "templates/base/redis_pipelining.py.j2",
             "facade": "templates/variants/fastapi/redis_module.py.j2",
             "routes": "templates/variants/fastapi/redis_routes.py.j2",
             "config": "templates/variants/fastapi/redis_config.yaml.j2",
@@ -47,6 +50,9 @@ class FastAPIPlugin(FrameworkPlugin):
         return {
             "client": "src/modules/free/cache/redis/client.py",
             "package": "src/modules/free/cache/redis/__init__.py",
+            "cache": "src/modules/free/cache/redis/cache.py",
+            "near_cache": "src/modules/free/cache/redis/near_cache.py",
+            "pipelining": "src/modules/free/cache/redis/pipelining.py",
             "facade": "src/modules/free/cache/redis/redis.py",
             "routes": "src/modules/free/cache/redis/routers/redis.py",
             "config": "config/cache/redis.yaml",
@@ -103,6 +103,16 @@ class RedisModuleGenerator(BaseModuleGenerator):
             "connect_retries": 3,
             "connect_backoff_base": 0.5,
             "cache_ttl": 3600,
+            "cache_namespace": "cache",
+            "cache_codec": "json",
+            "cache_l1_max_entries": 1024,
+            "cache_l1_ttl": 0,
+            "cache_early_expiry_beta": 1.0,
+            "near_cache_max_entries": 10000,
+            "near_cache_ttl": 300,
+            "near_cache_fallback_ttl": 5,
+            "near_cache_prefixes": "",
+            "pipeline_max_batch": 512,
         }
         defaults.update(_defaults_from_config(config))
 
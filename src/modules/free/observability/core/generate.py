@@ -130,15 +130,26 @@ class ObservabilityModuleGenerator(BaseModuleGenerator):
             },
             "tracing": {
                 "enabled": False,
-                "exporter": "console",
+                "exporter": "memory",
                 "endpoint": None,
                 "sample_ratio": 0.25,
                 "include_headers": True,
+                "tail_latency_ms": None,
+                "tail_keep_errors": False,
+                "export_batch_size": 128,
+                "export_interval_seconds": 5,
+                "export_queue_size": 2048,
             },
             "events": {
                 "buffer_size": 1000,
                 "flush_interval_seconds": 5,
                 "audit_enabled": False,
+                "sinks": [],
+                "flush_batch_size": 500,
+                "file_path": "logs/observability-events.jsonl",
+                "file_max_bytes": 10485760,
+                "file_backup_count": 5,
+                "collector_url": None,
             },
             "dashboards": {
                 "enabled": False,
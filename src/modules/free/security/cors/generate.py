@@ -88,6 +88,8 @@ FALLBACK_DEFAULTS: Dict[str, Any] = {
     "allow_headers": ["*"],
     "expose_headers": [],
     "max_age": 600,
+    "allow_origin_regex": None,
+    "preflight_cache_size": 1024,
     "log_level": "INFO",
     "metadata": {},
 }
@@ -110,6 +110,7 @@ FALLBACK_DEFAULTS: Dict[str, Any] = {
     "x_dns_prefetch_control": "off",
     "x_download_options": "noopen",
     "additional_headers": {},
+    "route_overrides": {},
 }
 
 
@@ -275,6 +276,7 @@ def _merge_defaults(module_config: Mapping[str, Any]) -> Dict[str, Any]:
         merged.get("x_download_options"),
     )
     merged["additional_headers"] = _coerce_mapping(bundle_defaults.get("additional_headers"))
+    merged["route_overrides"] = _coerce_mapping(bundle_defaults.get("route_overrides"))
 
     return merged
 
@@ -321,6 +323,7 @@ class SecurityHeadersModuleGenerator(BaseModuleGenerator):
         strict_defaults = _coerce_mapping(defaults.get("strict_transport_security"))
         permissions_defaults = _coerce_mapping(defaults.get("permissions_policy"))
         additional_headers_defaults = _coerce_mapping(defaults.get("additional_headers"))
+        route_overrides_defaults = _coerce_mapping(defaults.get("route_overrides"))
 
         return {
             "module_name": module_name,
@@ -354,6 +357,7 @@ class SecurityHeadersModuleGenerator(BaseModuleGenerator):
             "strict_transport_security_defaults": strict_defaults,
             "permissions_policy_defaults": permissions_defaults,
             "additional_headers_defaults": additional_headers_defaults,
+            "route_overrides_defaults": route_overrides_defaults,
         }
 
     def apply_base_context_overrides(self, context: Mapping[str, Any]) -> dict[str, Any]:
@@ -384,12 +384,27 @@ __all__: list[str] = []
 
 _HEALTH_REGISTRY_TEMPLATE = dedent(
     '''
-"""Shared registry for aggregating RapidKit module health routers."""
+"""Shared registry for aggregating RapidKit module health routers and checks.
+
+Besides mounting each module's own health route, the registry runs every
+module's health probe concurrently behind ``/api/health/ready``. Each probe has
+its own timeout, results are cached for a TTL, and once a check has a result,
+stale reads are served from the cache while one background refresh runs. That
+way orchestrator probes never queue up behind a slow dependency.
+``/api/health/live`` never touches dependencies.
+"""
 
 from __future__ import annotations
 
+import asyncio
+import inspect
 import logging
-from typing import Any, Callable, Iterable, List
+import os
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from importlib import import_module
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -417,6 +432,23 @@ except ImportError:  # pragma: no cover - registry not generated yet
         return []
 
 
+try:  # pragma: no cover - older health packages predate module iteration
+    from src.health import iter_health_modules as _core_iter_health_modules
+except ImportError:  # pragma: no cover
+
+    def _core_iter_health_modules() -> Iterable[Tuple[str, str]]:
+        return ()
+
+
+HEALTH_CACHE_TTL_ENV = "RAPIDKIT_HEALTH_CACHE_TTL"
+HEALTH_CHECK_TIMEOUT_ENV = "RAPIDKIT_HEALTH_CHECK_TIMEOUT"
+DEFAULT_CACHE_TTL = 10.0
+DEFAULT_CHECK_TIMEOUT = 2.0
+
+_PROBE_NAMES = ("check_health", "health_check", "module_health_status")
+_HEALTHY_STATUSES = frozenset({"ok", "healthy", "up", "pass", "passing", "disabled"})
+
+
 def _collect_registrars() -> List[Callable[[Any], None]]:
     registrars: List[Callable[[Any], None]] = []
     for registrar in _core_iter_registrars():
@@ -456,7 +488,244 @@ def list_registered_health_routes(prefix: str = "/api/health") -> List[dict[str,
         return []
 
 
-__all__ = ["build_health_router", "list_registered_health_routes"]
+def _env_float(name: str, default: float) -> float:
+    try:
+        return max(0.0, float(os.getenv(name, default)))
+    except ValueError:
+        return default
+
+
+@dataclass
+class HealthCheck:
+    """One module probe plus its last cached result."""
+
+    name: str
+    probe: Callable[[], Any]
+    timeout: float
+    ttl: float
+    critical: bool = True
+    result: Optional[Dict[str, Any]] = None
+    checked_at: float = 0.0
+
+
+async def _call_probe(probe: Callable[[], Any]) -> Any:
+    if asyncio.iscoroutinefunction(probe):
+        return await probe()
+    # Blocking probes (sync DB pings) run off the event loop.
+    result = await asyncio.to_thread(probe)
+    if hasattr(result, "__await__"):
+        result = await result
+    return result
+
+
+def _takes_no_arguments(probe: Callable[..., Any]) -> bool:
+    """Only argument-free callables can be probed; route handlers expect FastAPI to inject."""
+
+    try:
+        parameters = inspect.signature(probe).parameters.values()
+    except (TypeError, ValueError):
+        return False
+    variadic = (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD)
+    return all(parameter.kind in variadic for parameter in parameters)
+
+
+def _normalise(name: str, result: Any) -> Dict[str, Any]:
+    if isinstance(result, Mapping):
+        payload = dict(result)
+    elif result is None:
+        payload = {}
+    else:
+        payload = {"detail": str(result)}
+    status = str(payload.get("status") or "unknown").lower()
+    payload["module"] = payload.get("module") or name
+    payload["status"] = status
+    payload["healthy"] = status in _HEALTHY_STATUSES
+    return payload
+
+
+class HealthAggregator:
+    """Run module health checks concurrently and serve them from a TTL cache."""
+
+    def __init__(self, *, ttl: Optional[float] = None, timeout: Optional[float] = None) -> None:
+        self.ttl = ttl if ttl is not None else _env_float(HEALTH_CACHE_TTL_ENV, DEFAULT_CACHE_TTL)
+        self.timeout = (
+            timeout
+            if timeout is not None
+            else _env_float(HEALTH_CHECK_TIMEOUT_ENV, DEFAULT_CHECK_TIMEOUT)
+        )
+        self.started_at = time.monotonic()
+        self._checks: Dict[str, HealthCheck] = {}
+        self._inflight: Dict[str, "asyncio.Future[Dict[str, Any]]"] = {}
+
+    def register(
+        self,
+        name: str,
+        probe: Callable[[], Any],
+        *,
+        timeout: Optional[float] = None,
+        ttl: Optional[float] = None,
+        critical: bool = True,
+    ) -> None:
+        """Add a probe; non-critical failures degrade readiness instead of failing it."""
+
+        self._checks[name] = HealthCheck(
+            name=name,
+            probe=probe,
+            timeout=self.timeout if timeout is None else timeout,
+            ttl=self.ttl if ttl is None else ttl,
+            critical=critical,
+        )
+
+    def unregister(self, name: str) -> None:
+        self._checks.pop(name, None)
+        self._inflight.pop(name, None)
+
+    @property
+    def names(self) -> List[str]:
+        return sorted(self._checks)
+
+    async def _execute(self, check: HealthCheck) -> Dict[str, Any]:
+        started = time.monotonic()
+        try:
+            result = await asyncio.wait_for(_call_probe(check.probe), check.timeout)
+            payload = _normalise(check.name, result)
+        except asyncio.TimeoutError:
+            payload = {
+                "module": check.name,
+                "status": "timeout",
+                "healthy": False,
+                "detail": f"no response within {check.timeout:g}s",
+            }
+        except Exception as exc:  # noqa: BLE001 - a failing probe is a health result
+            payload = {"module": check.name, "status": "error", "healthy": False, "detail": str(exc)}
+        payload["duration_ms"] = round((time.monotonic() - started) * 1000, 2)
+        payload["checked_at"] = datetime.now(timezone.utc).isoformat()
+        check.result = payload
+        check.checked_at = time.monotonic()
+        return payload
+
+    def _refresh(self, check: HealthCheck) -> "asyncio.Future[Dict[str, Any]]":
+        """Start (or join) the single in-flight run for ``check``."""
+
+        task = self._inflight.get(check.name)
+        loop = asyncio.get_running_loop()
+        if task is None or task.done() or task.get_loop() is not loop:
+            task = loop.create_task(self._execute(check))
+            self._inflight[check.name] = task
+        return task
+
+    async def _resolve(self, check: HealthCheck, force: bool) -> Dict[str, Any]:
+        if check.result is not None and not force:
+            if time.monotonic() - check.checked_at < check.ttl:
+                return {**check.result, "cached": True}
+            self._refresh(check)  # serve the last result while one refresh runs
+            return {**check.result, "cached": True, "stale": True}
+        payload = await asyncio.shield(self._refresh(check))
+        return {**payload, "cached": False}
+
+    async def readiness(self, *, force: bool = False) -> Dict[str, Any]:
+        """Aggregate every check; ``ready`` is false when a critical check is unhealthy."""
+
+        checks = list(self._checks.values())
+        results = await asyncio.gather(*(self._resolve(check, force) for check in checks))
+        # A probe that reports no status cannot prove the dependency is down.
+        failing = [
+            c.name
+            for c, r in zip(checks, results)
+            if c.critical and not r["healthy"] and r["status"] != "unknown"
+        ]
+        degraded = [
+            c.name for c, r in zip(checks, results) if not r["healthy"] and c.name not in failing
+        ]
+        status = "error" if failing else "degraded" if degraded else "ok"
+        return {
+            "status": status,
+            "ready": not failing,
+            "failing": failing,
+            "degraded": degraded,
+            "checks": {check.name: result for check, result in zip(checks, results)},
+        }
+
+    def liveness(self) -> Dict[str, Any]:
+        """Process-level liveness; never runs dependency checks."""
+
+        return {
+            "status": "ok",
+            "alive": True,
+            "uptime": round(time.monotonic() - self.started_at, 3),
+            "checks": self.names,
+        }
+
+
+def discover_health_checks(aggregator: Optional[HealthAggregator] = None) -> HealthAggregator:
+    """Register the argument-free probe exported by every generated ``src.health.<module>``."""
+
+    aggregator = aggregator or HealthAggregator()
+    for module_path, slug in _core_iter_health_modules():
+        try:
+            module = import_module(module_path)
+        except Exception as exc:  # noqa: BLE001 - skip modules that fail to import
+            logger.warning("Health module %s failed to import; skipping", module_path, exc_info=exc)
+            continue
+        for probe_name in (*_PROBE_NAMES, f"{slug}_health_check"):
+            try:
+                probe = getattr(module, probe_name)
+            except Exception:  # noqa: BLE001 - vendor shims raise on missing payloads
+                continue
+            if callable(probe) and _takes_no_arguments(probe):
+                aggregator.register(slug, probe)
+                break
+    return aggregator
+
+
+_AGGREGATOR: Optional[HealthAggregator] = None
+
+
+def get_health_aggregator() -> HealthAggregator:
+    """Return the process-wide aggregator, discovering module probes on first use."""
+
+    global _AGGREGATOR
+    if _AGGREGATOR is None:
+        _AGGREGATOR = discover_health_checks()
+    return _AGGREGATOR
+
+
+def build_aggregate_health_router(
+    prefix: str = "/api/health", aggregator: Optional[HealthAggregator] = None
+):
+    """Router exposing ``/live`` and the aggregated, cached ``/ready`` probe."""
+
+    if APIRouter is None:
+        raise RuntimeError("FastAPI must be installed to use the shared health registry")
+
+    from fastapi.responses import JSONResponse
+
+    router = APIRouter(prefix=prefix, tags=["health"])
+
+    def _aggregator() -> HealthAggregator:
+        return aggregator if aggregator is not None else get_health_aggregator()
+
+    @router.get("/live", summary="Liveness probe")
+    async def read_liveness() -> Dict[str, Any]:
+        return _aggregator().liveness()
+
+    @router.get("/ready", summary="Aggregated module readiness")
+    async def read_readiness(fresh: bool = False) -> Any:
+        payload = await _aggregator().readiness(force=fresh)
+        return JSONResponse(payload, status_code=200 if payload["ready"] else 503)
+
+    return router
+
+
+__all__ = [
+    "HealthAggregator",
+    "HealthCheck",
+    "build_aggregate_health_router",
+    "build_health_router",
+    "discover_health_checks",
+    "get_health_aggregator",
+    "list_registered_health_routes",
+]
 '''
 )
 
@@ -530,12 +799,25 @@ ${imports_block}
                 yield from _discover_registrars()
 
 
+            def iter_health_modules() -> Iterable[Tuple[str, str]]:
+                """Yield ``(module_path, slug)`` for every importable module health package."""
+
+                for module_path, _registrar, slug in _resolve_health_modules():
+                    yield module_path, slug
+
+
             def register_health_routes(app: Any) -> None:
                 """Register all detected health routers against the provided FastAPI app."""
 
                 for registrar in _discover_registrars():
                     registrar(app)
 
+                try:
+                    from .registry import build_aggregate_health_router
+                except ImportError:  # pragma: no cover - registry bridge not generated yet
+                    return
+                app.include_router(build_aggregate_health_router())
+
 
             def _build_module_path(prefix: str, slug: str) -> str:
                 cleaned_prefix = prefix.rstrip("/") or "/"
@@ -559,6 +841,7 @@ ${imports_block}
 
 
             __all__ = [
+                "iter_health_modules",
                 "iter_health_registrars",
                 "register_health_routes",
                 "list_health_routes",
@@ -5,10 +5,14 @@ from .celery import (
     CeleryRuntimeError,
     CelerySchedule,
     CelerySettings,
+    CeleryTaskIndex,
     CeleryTaskRegistry,
+    clear_celery_app_cache,
     create_celery_app,
+    gather_results,
     get_celery_app,
     load_config_from_env,
+    submit_many,
 )
 
 __all__ = [
@@ -16,8 +20,12 @@ __all__ = [
     "CeleryRuntimeError",
     "CelerySchedule",
     "CelerySettings",
+    "CeleryTaskIndex",
     "CeleryTaskRegistry",
+    "clear_celery_app_cache",
     "create_celery_app",
+    "gather_results",
     "get_celery_app",
     "load_config_from_env",
+    "submit_many",
 ]
@@ -2,31 +2,62 @@
 
 from __future__ import annotations
 
+import ast
+import asyncio
+import hashlib
 import importlib
+import importlib.util
+import json
 import os
-from dataclasses import dataclass, field
+import threading
+import time
+from dataclasses import asdict, dataclass, field
 from datetime import timedelta
 from functools import lru_cache
-from typing import Any, Callable, Mapping, MutableMapping, Optional, Sequence, cast
+from itertools import islice
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    List,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Sequence,
+    cast,
+)
 
 Celery: Any
 crontab: Any | None
 celery_schedule: Any | None
+celery_signals: Any | None
 
 try:  # Optional dependency
     celery_module = importlib.import_module("celery")
     schedules_module = importlib.import_module("celery.schedules")
+    signals_module = importlib.import_module("celery.signals")
 except ImportError:  # pragma: no cover - optional dependency not installed
     Celery = None
     crontab = None
     celery_schedule = None
+    celery_signals = None
 else:
     Celery = getattr(celery_module, "Celery", None)
     crontab = getattr(schedules_module, "crontab", None)
     celery_schedule = getattr(schedules_module, "schedule", None)
+    celery_signals = signals_module
 
 
 DEFAULT_ENV_PREFIX = "RAPIDKIT_CELERY_"
+DEFAULT_SUBMIT_CHUNK_SIZE = 100
+DEFAULT_POLL_INTERVAL = 0.05
+
+# Mirrors ``celery.states.READY_STATES`` so polling works without importing Celery.
+_READY_STATES = frozenset({"SUCCESS", "FAILURE", "REVOKED"})
+_TASK_DECORATORS = frozenset({"task", "shared_task"})
+
+_APP_CACHE: MutableMapping[str, Any] = {}
+_APP_CACHE_LOCK = threading.Lock()
 
 
 class CeleryRuntimeError(RuntimeError):
@@ -112,25 +143,85 @@ class CeleryAppConfig:
     namespace: str = "CELERY"
     autodiscover: Sequence[str] = field(default_factory=tuple)
     config_overrides: MutableMapping[str, Any] = field(default_factory=dict)
+    lazy_autodiscover: bool = True
+    task_index: MutableMapping[str, str] = field(default_factory=dict)
 
     @classmethod
     def from_mapping(cls, payload: Mapping[str, Any]) -> "CeleryAppConfig":
         defaults = cls()
         settings_payload = payload.get("settings", {}) or {}
+        lazy = _flag(payload.get("lazy_autodiscover"))
         return cls(
             name=str(payload.get("name", defaults.name)),
             settings=CelerySettings.from_mapping(settings_payload),
             namespace=str(payload.get("namespace", defaults.namespace)),
             autodiscover=tuple(payload.get("autodiscover", ()) or ()),
             config_overrides=dict(payload.get("config_overrides", {}) or {}),
+            lazy_autodiscover=defaults.lazy_autodiscover if lazy is None else lazy,
+            task_index={
+                str(name): str(module)
+                for name, module in (payload.get("task_index", {}) or {}).items()
+            },
         )
 
+    def fingerprint(self) -> str:
+        """Return a stable digest identifying apps built from this configuration.
+
+        Raises ``CeleryRuntimeError`` when a value has no value-based representation
+        (for example an arbitrary object whose ``repr`` is its memory address).
+        """
+
+        payload = json.dumps(asdict(self), sort_keys=True, default=_fingerprint_value)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+@dataclass(slots=True)
+class CeleryTaskIndex:
+    """Maps task names to the modules defining them, without importing those modules."""
+
+    modules: MutableMapping[str, str] = field(default_factory=dict)
+
+    @classmethod
+    def from_packages(
+        cls, packages: Sequence[str], related_name: str | None = "tasks"
+    ) -> "CeleryTaskIndex":
+        """Statically scan ``<package>.<related_name>`` sources for task definitions.
+
+        Only the parent packages are imported (to locate the sources); the task modules
+        themselves are parsed, so producers can build the index without worker code.
+        """
+
+        index = cls()
+        for package in packages:
+            module_name = f"{package}.{related_name}" if related_name else package
+            try:
+                spec = importlib.util.find_spec(module_name)
+            except (ImportError, ValueError):
+                spec = None
+            if spec is None or not spec.origin or not spec.origin.endswith(".py"):
+                continue
+            with open(spec.origin, encoding="utf-8") as handle:
+                source = handle.read()
+            index.modules.update(_scan_task_names(module_name, source))
+        return index
+
+    def module_for(self, name: str) -> Optional[str]:
+        return self.modules.get(name)
+
+    def task_names(self) -> Sequence[str]:
+        return tuple(sorted(self.modules))
+
+    def import_modules(self) -> None:
+        for module_name in sorted(set(self.modules.values())):
+            importlib.import_module(module_name)
+
 
 class CeleryTaskRegistry:
     """Utility used to register and introspect Celery tasks."""
 
-    def __init__(self, app: Any) -> None:
+    def __init__(self, app: Any, index: CeleryTaskIndex | None = None) -> None:
         self._app = app
+        self._index = index or CeleryTaskIndex()
 
     def task(
         self, *decorator_args: Any, **decorator_kwargs: Any
@@ -146,13 +237,55 @@ class CeleryTaskRegistry:
 
     def list_task_names(self) -> Sequence[str]:
         registered = getattr(self._app, "tasks", {})
-        return tuple(sorted(name for name in registered))
+        return tuple(sorted(set(registered) | set(self._index.modules)))
+
+    def send(
+        self,
+        name: str,
+        args: Sequence[Any] = (),
+        kwargs: Mapping[str, Any] | None = None,
+        **options: Any,
+    ) -> Any:
+        """Publish ``name`` by task name, validating it against the index or registry."""
+
+        if self._index.module_for(name) is None and name not in getattr(self._app, "tasks", {}):
+            raise CeleryRuntimeError(f"Unknown Celery task '{name}'")
+        return self._app.send_task(name, args=tuple(args), kwargs=dict(kwargs or {}), **options)
 
 
 def _maybe(value: Any, *, default: Any = None) -> Any:
     return default if value in (None, "") else value
 
 
+def _scan_task_names(module_name: str, source: str) -> MutableMapping[str, str]:
+    names: MutableMapping[str, str] = {}
+    for node in ast.parse(source).body:
+        if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            continue
+        for decorator in node.decorator_list:
+            target = decorator.func if isinstance(decorator, ast.Call) else decorator
+            if isinstance(target, ast.Attribute):
+                decorator_name = target.attr
+            elif isinstance(target, ast.Name):
+                decorator_name = target.id
+            else:
+                continue
+            if decorator_name not in _TASK_DECORATORS:
+                continue
+            task_name = f"{module_name}.{node.name}"
+            if isinstance(decorator, ast.Call):
+                for keyword in decorator.keywords:
+                    if (
+                        keyword.arg == "name"
+                        and isinstance(keyword.value, ast.Constant)
+                        and isinstance(keyword.value.value, str)
+                    ):
+                        task_name = keyword.value.value
+            names[task_name] = module_name
+            break
+    return names
+
+
 def _coerce_schedule(schedule: Any) -> Any:
     if isinstance(schedule, Mapping):
         schedule_type = str(schedule.get("type", "")).lower()
@@ -205,11 +338,29 @@ def create_celery_app(config: CeleryAppConfig) -> Any:
         },
         **config.config_overrides,
     )
-    if config.autodiscover:
+    if config.lazy_autodiscover:
+        _defer_task_imports(app, config)
+    elif config.autodiscover:
         app.autodiscover_tasks(config.autodiscover, force=True)
     return app
 
 
+def _defer_task_imports(app: Any, config: CeleryAppConfig) -> None:
+    """Import task modules only when a worker boots (``import_modules`` signal)."""
+
+    if config.autodiscover:
+        # Without ``force`` Celery hooks discovery onto the ``import_modules`` signal.
+        app.autodiscover_tasks(config.autodiscover)
+    if not config.task_index or celery_signals is None:
+        return
+    index = CeleryTaskIndex(modules=dict(config.task_index))
+
+    def _import_indexed(*_args: Any, **_kwargs: Any) -> None:
+        index.import_modules()
+
+    celery_signals.import_modules.connect(_import_indexed, weak=False, sender=app)
+
+
 def _serialise_schedule(entry: CelerySchedule) -> Mapping[str, Any]:
     payload: MutableMapping[str, Any] = {
         "task": entry.task,
@@ -229,7 +380,155 @@ def _get_default_celery_app() -> Any:
 def get_celery_app(config: CeleryAppConfig | None = None) -> Any:
     if config is None:
         return _get_default_celery_app()
-    return create_celery_app(config)
+    try:
+        fingerprint = config.fingerprint()
+    except CeleryRuntimeError:
+        # No stable key: build a fresh app rather than growing the cache per call.
+        return create_celery_app(config)
+    with _APP_CACHE_LOCK:
+        app = _APP_CACHE.get(fingerprint)
+        if app is None:
+            app = create_celery_app(config)
+            _APP_CACHE[fingerprint] = app
+    return app
+
+
+def clear_celery_app_cache() -> None:
+    """Drop every cached Celery app, including the default one."""
+
+    with _APP_CACHE_LOCK:
+        _APP_CACHE.clear()
+    _get_default_celery_app.cache_clear()
+
+
+def submit_many(
+    task: Any,
+    arg_iterable: Iterable[Any],
+    *,
+    chunk_size: int = DEFAULT_SUBMIT_CHUNK_SIZE,
+    **options: Any,
+) -> List[Any]:
+    """Enqueue ``task`` once per item of ``arg_iterable`` using one message per chunk.
+
+    Items are grouped into ``celery.starmap`` signatures of ``chunk_size`` calls, so the
+    broker receives a single publish per chunk and every chunk reuses one producer
+    connection. Tuples and lists are unpacked as positional arguments; any other item is
+    passed as the sole argument. Returns one ``AsyncResult`` per chunk whose value is the
+    list of per-item return values.
+    """
+
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be a positive integer")
+    app = getattr(task, "app", None)
+    if app is None:
+        raise CeleryRuntimeError("submit_many requires a task bound to a Celery app")
+
+    iterator = iter(arg_iterable)
+    results: List[Any] = []
+    with app.producer_or_acquire(options.pop("producer", None)) as producer:
+        while True:
+            chunk = [_as_args(item) for item in islice(iterator, chunk_size)]
+            if not chunk:
+                break
+            results.append(task.starmap(chunk).apply_async(producer=producer, **options))
+    return results
+
+
+async def gather_results(
+    results: Sequence[Any],
+    timeout: float | None = None,
+    *,
+    poll_interval: float = DEFAULT_POLL_INTERVAL,
+    propagate: bool = True,
+) -> List[Any]:
+    """Await the values of ``results`` without blocking the running event loop.
+
+    Pending results are polled in batch: key/value result backends (Redis, memcached,
+    the in-memory cache backend) are queried with a single ``MGET`` per interval, other
+    backends fall back to per-result state checks. Backend I/O runs in a worker thread.
+    Values are returned in the order of ``results``. Failed tasks raise their exception
+    when ``propagate`` is true and are returned as exception instances otherwise.
+    """
+
+    values: MutableMapping[int, Any] = {}
+    pending = {index: result for index, result in enumerate(results)}
+    deadline = None if timeout is None else time.monotonic() + timeout
+    while pending:
+        ready = await asyncio.to_thread(_collect_ready, pending)
+        for index, (state, value) in ready.items():
+            del pending[index]
+            if state != "SUCCESS" and propagate:
+                raise value
+            values[index] = value
+        if not pending:
+            break
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(
+                    f"{len(pending)} of {len(results)} Celery results not ready after {timeout}s"
+                )
+            await asyncio.sleep(min(poll_interval, remaining))
+        else:
+            await asyncio.sleep(poll_interval)
+    return [values[index] for index in range(len(results))]
+
+
+def _as_args(item: Any) -> tuple[Any, ...]:
+    if isinstance(item, (tuple, list)):
+        return tuple(item)
+    return (item,)
+
+
+def _collect_ready(pending: Mapping[int, Any]) -> MutableMapping[int, tuple[str, Any]]:
+    by_backend: MutableMapping[int, tuple[Any, List[int]]] = {}
+    for index, result in pending.items():
+        backend = result.backend
+        by_backend.setdefault(id(backend), (backend, []))[1].append(index)
+
+    ready: MutableMapping[int, tuple[str, Any]] = {}
+    for backend, indexes in by_backend.values():
+        batch = _mget_ready(backend, [pending[index] for index in indexes])
+        if batch is None:
+            for index in indexes:
+                result = pending[index]
+                if result.ready():
+                    ready[index] = (str(result.state), result.result)
+            continue
+        for index, outcome in zip(indexes, batch):
+            if outcome is not None:
+                ready[index] = outcome
+    return ready
+
+
+def _mget_ready(backend: Any, results: Sequence[Any]) -> Optional[List[Any]]:
+    """Fetch ready states for ``results`` in one round trip, or ``None`` if unsupported."""
+
+    get_key = getattr(backend, "get_key_for_task", None)
+    if get_key is None:
+        return None
+    keys = [get_key(result.id) for result in results]
+    try:
+        raw_values = backend.mget(keys)
+    except (AttributeError, NotImplementedError):
+        return None
+    if hasattr(raw_values, "get"):
+        raw_values = [raw_values.get(key) for key in keys]
+
+    outcomes: List[Any] = []
+    for raw in raw_values:
+        if raw is None:
+            outcomes.append(None)
+            continue
+        meta = backend.decode_result(raw)
+        state = str(meta.get("status"))
+        if state not in _READY_STATES:
+            outcomes.append(None)
+        elif state == "SUCCESS":
+            outcomes.append((state, meta.get("result")))
+        else:
+            outcomes.append((state, backend.exception_to_python(meta.get("result"))))
+    return outcomes
 
 
 def load_config_from_env(
@@ -252,17 +551,36 @@ def load_config_from_env(
     settings = CelerySettings.from_mapping(
         {k: v for k, v in settings_payload.items() if v not in (None, "")}
     )
+    lazy_autodiscover = _flag(source.get(f"{prefix}LAZY_AUTODISCOVER"))
     return CeleryAppConfig(
         name=name,
         settings=settings,
         autodiscover=tuple(autodiscover),
+        lazy_autodiscover=True if lazy_autodiscover is None else lazy_autodiscover,
     )
 
 
-def _flag(value: Optional[str]) -> Optional[bool]:
+def _flag(value: Any) -> Optional[bool]:
     if value is None:
         return None
-    return value.lower() in {"1", "true", "yes", "on"}
+    if isinstance(value, bool):
+        return value
+    return str(value).strip().lower() in {"1", "true", "yes", "on"}
+
+
+def _fingerprint_value(value: Any) -> Any:
+    if isinstance(value, timedelta):
+        return {"timedelta": value.total_seconds()}
+    if isinstance(value, (set, frozenset)):
+        return sorted(json.dumps(item, sort_keys=True, default=_fingerprint_value) for item in value)
+    if isinstance(value, os.PathLike):
+        return os.fspath(value)
+    if type(value).__repr__ is object.__repr__:
+        raise CeleryRuntimeError(
+            f"Cannot fingerprint {type(value).__name__!r} values in a Celery configuration"
+        )
+    # Celery schedules (crontab, solar, schedule) render their fields in repr.
+    return {type(value).__qualname__: repr(value)}
 
 
 def _split_list(value: Optional[str]) -> Sequence[str]:
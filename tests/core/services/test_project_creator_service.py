@@ -82,7 +82,7 @@ def test_apply_kit_defaults_merges_only_missing(project_creator: ProjectCreatorS
     assert merged == {"size": "L", "color": "blue"}
 
 
-def test_install_essential_modules_handles_errors(
+def test_install_essential_modules_subprocess_handles_errors(
     monkeypatch: pytest.MonkeyPatch, tmp_path: Path
 ) -> None:
     pc = ProjectCreatorService()
@@ -109,7 +109,7 @@ def test_install_essential_modules_handles_errors(
     success_messages: list[str] = []
     error_messages: list[str] = []
 
-    pc._install_essential_modules(
+    pc._install_essential_modules_subprocess(
         tmp_path,
         "fastapi/standard",
         info_messages.append,
@@ -124,6 +124,60 @@ def test_install_essential_modules_handles_errors(
     assert calls["run"] == expected_run_calls
 
 
+def test_install_essential_modules_batches_in_process(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    import typer
+
+    from cli.commands.add import batch
+
+    pc = ProjectCreatorService()
+    installed: list[str] = []
+
+    def _fake_add_module(name: str, **_kwargs: Any) -> None:
+        installed.append(name)
+        if name == "free/essentials/logging":
+            print("logging template missing")
+            raise typer.Exit(code=1)
+        if name == "free/essentials/deployment":
+            raise RuntimeError("boom")
+
+    def _no_subprocess(*_args: Any, **_kwargs: Any) -> None:
+        raise AssertionError("essential modules must not spawn a CLI subprocess")
+
+    monkeypatch.setattr(batch, "add_module", _fake_add_module)
+    monkeypatch.setattr("subprocess.run", _no_subprocess)
+    info_messages: list[str] = []
+    success_messages: list[str] = []
+    error_messages: list[str] = []
+
+    pc._install_essential_modules(
+        tmp_path,
+        "fastapi/standard",
+        info_messages.append,
+        success_messages.append,
+        error_messages.append,
+    )
+
+    assert installed == [
+        "free/essentials/settings",
+        "free/essentials/logging",
+        "free/essentials/deployment",
+        "free/essentials/middleware",
+    ]
+    assert info_messages[0] == "\n🔧 Installing essential modules..."
+    assert "📦 Installing free/essentials/settings..." in info_messages
+    assert "✅ free/essentials/settings installed successfully" in success_messages
+    assert (
+        "❌ Failed to install free/essentials/logging: logging template missing" in error_messages
+    )
+    assert "❌ Error installing free/essentials/deployment: boom" in error_messages
+    assert error_messages[-1] == (
+        "❌ Some essential modules failed to install: "
+        "free/essentials/logging, free/essentials/deployment"
+    )
+
+
 def test_create_project_missing_kit(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
     pc = ProjectCreatorService()
     monkeypatch.setattr(pc.registry, "list_kits_names", lambda: ["fastapi.standard"])
@@ -0,0 +1,156 @@
+import json
+import os
+import subprocess
+import sys
+
+from typer.testing import CliRunner
+
+from cli.commands.snapshot import snapshot_app
+from core.services import blob_store, file_hash_registry, vendor_store
+from core.services.blob_store import BlobStore
+
+
+def test_put_dedups_and_compresses(tmp_path):
+    store = BlobStore(tmp_path)
+    content = b"print('hello')\n" * 200
+    digest = store.put(content)
+    assert store.put(content) == digest
+    assert len(store) == 1
+    assert store.get(digest) == content
+
+    packs = list((tmp_path / blob_store.OBJECTS_DIR).glob("pack-*.pack"))
+    assert len(packs) == 1
+    assert packs[0].stat().st_size < len(content)
+
+
+def test_index_log_is_replayed_by_fresh_instance(tmp_path):
+    digest = BlobStore(tmp_path).put(b"abc")
+    BlobStore(tmp_path).set_refs("vendor", {"mod/1.0/a.py": digest})
+
+    reopened = BlobStore(tmp_path)
+    assert reopened.get(digest) == b"abc"
+    assert reopened.resolve("vendor", "mod/1.0/a.py") == digest
+
+
+def test_snapshots_share_pack_and_read_legacy_loose_files(tmp_path):
+    digest = file_hash_registry.store_snapshot(tmp_path, b"v1")
+    assert not (tmp_path / ".rapidkit" / "snapshots").exists()
+    assert file_hash_registry.load_snapshot(tmp_path, digest) == b"v1"
+
+    legacy = tmp_path / ".rapidkit" / "snapshots" / "deadbeef"
+    legacy.parent.mkdir(parents=True)
+    legacy.write_bytes(b"old")
+    assert file_hash_registry.load_snapshot(tmp_path, "deadbeef") == b"old"
+
+
+def test_gc_drops_unreferenced_blobs_and_keeps_refs(tmp_path):
+    store = BlobStore(tmp_path)
+    live = store.put(b"live")
+    dead = store.put(b"dead")
+    pinned = store.put(b"pinned")
+    store.set_refs("vendor", {"m/1/x": pinned})
+
+    preview = store.gc({live}, dry_run=True)
+    assert preview.dropped == 1
+    assert store.get(dead) == b"dead"
+
+    stats = store.gc({live})
+    assert (stats.objects_before, stats.objects_after) == (3, 2)
+    assert store.get(dead) is None
+    assert BlobStore(tmp_path).get(live) == b"live"
+    assert BlobStore(tmp_path).get(pinned) == b"pinned"
+    assert not (tmp_path / blob_store.OBJECTS_DIR / blob_store.INDEX_LOG).exists()
+
+
+def test_gc_applies_age_and_count_retention_to_unreferenced_blobs(tmp_path, monkeypatch):
+    clock = {"now": 1_000_000.0}
+    monkeypatch.setattr(blob_store.time, "time", lambda: clock["now"])
+    store = BlobStore(tmp_path)
+    ancient = store.put(b"ancient")
+    clock["now"] += 10 * 86400
+    older = store.put(b"older")
+    clock["now"] += 60
+    newer = store.put(b"newer")
+    live = store.put(b"live")
+
+    assert store.gc({live}, keep=None, max_age_seconds=86400, dry_run=True).dropped == 1
+    stats = store.gc({live}, keep=1, max_age_seconds=86400)
+
+    assert stats.dropped == 2
+    reopened = BlobStore(tmp_path)
+    assert [reopened.get(d) for d in (ancient, older, newer, live)] == [
+        None,
+        None,
+        b"newer",
+        b"live",
+    ]
+    # Timestamps survive compaction, so a later gc still sees the blob's real age.
+    clock["now"] += 2 * 86400
+    assert reopened.gc({live}, keep=None, max_age_seconds=86400).dropped == 1
+
+
+def test_concurrent_processes_never_interleave_pack_writes(tmp_path):
+    script = (
+        "import sys\n"
+        "from pathlib import Path\n"
+        "from core.services.blob_store import BlobStore\n"
+        "store = BlobStore(Path(sys.argv[1]))\n"
+        "for i in range(40):\n"
+        "    store.put(f'{sys.argv[2]}-{i}'.encode() * 50)\n"
+    )
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    procs = [
+        subprocess.Popen([sys.executable, "-c", script, str(tmp_path), f"w{n}"], env=env)
+        for n in range(4)
+    ]
+    assert [proc.wait(60) for proc in procs] == [0, 0, 0, 0]
+
+    store = BlobStore(tmp_path)
+    assert len(store) == 160
+    for n in range(4):
+        for i in range(40):
+            content = f"w{n}-{i}".encode() * 50
+            assert store.get(file_hash_registry._sha256(content)) == content
+
+
+def test_archive_vendor_versions_keeps_installed_tree(tmp_path):
+    vendor_store.store_vendor_file(tmp_path, "settings", "0.1.0", "src/a.py", b"same")
+    vendor_store.store_vendor_file(tmp_path, "settings", "0.2.0", "src/a.py", b"same")
+
+    archived = vendor_store.archive_vendor_versions(tmp_path, [("settings", "0.2.0")])
+
+    assert archived == ["settings@0.1.0"]
+    assert not vendor_store.vendor_file_path(tmp_path, "settings", "0.1.0", "src/a.py").exists()
+    assert vendor_store.vendor_file_path(tmp_path, "settings", "0.2.0", "src/a.py").exists()
+    assert vendor_store.load_vendor_file(tmp_path, "settings", "0.1.0", "src/a.py") == b"same"
+
+
+def test_snapshot_gc_command_packs_referenced_loose_snapshots(tmp_path, monkeypatch):
+    (tmp_path / ".rapidkit").mkdir()
+    registry = {}
+    file_hash_registry.record_file_hash(registry, "a.py", "settings", "0.2.0", b"current")
+    registry["files"]["a.py"]["previous_hash"] = file_hash_registry._sha256(b"previous")
+    file_hash_registry.save_hashes(tmp_path, registry)
+    snap_dir = tmp_path / ".rapidkit" / "snapshots"
+    snap_dir.mkdir()
+    (snap_dir / file_hash_registry._sha256(b"previous")).write_bytes(b"previous")
+    (snap_dir / "orphan").write_bytes(b"orphan")
+    file_hash_registry.store_snapshot(tmp_path, b"unreferenced")
+    vendor_store.store_vendor_file(tmp_path, "settings", "0.1.0", "a.py", b"old")
+    vendor_store.store_vendor_file(tmp_path, "settings", "0.2.0", "a.py", b"current")
+    monkeypatch.setattr("cli.commands.snapshot.find_project_root", lambda _p: tmp_path)
+
+    result = CliRunner().invoke(
+        snapshot_app, ["gc", "--keep", "0", "--max-age-days", "0", "--prune-vendor", "--json"]
+    )
+
+    assert result.exit_code == 0, result.output
+    data = json.loads(result.output)
+    assert data["packed_loose"] == 1
+    assert data["vendor_archived"] == ["settings@0.1.0"]
+    # keep=0 / max-age 0 disable retention limits, so the unreferenced blob survives
+    # exactly like the "orphan" loose file does.
+    assert data["pack"]["dropped"] == 0
+    previous = file_hash_registry._sha256(b"previous")
+    assert file_hash_registry.load_snapshot(tmp_path, previous) == b"previous"
+    assert vendor_store.load_vendor_file(tmp_path, "settings", "0.1.0", "a.py") == b"old"
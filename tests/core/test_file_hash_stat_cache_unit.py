@@ -0,0 +1,146 @@
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from core.services import file_hash_registry as fhr
+
+OLD_NS = 1_600_000_000 * 10**9
+
+
+def _tracked(tmp_path: Path, content: bytes = b"generated\n"):
+    target = tmp_path / "app.py"
+    target.write_bytes(content)
+    os.utime(target, ns=(OLD_NS, OLD_NS))
+    registry = {}
+    fhr.record_file_hash(registry, "app.py", "mod", "1.0", content)
+    return target, registry
+
+
+def test_unchanged_stat_skips_hashing(tmp_path, monkeypatch):
+    target, registry = _tracked(tmp_path)
+
+    current, refreshed = fhr.hash_tracked_file(tmp_path, registry, "app.py")
+    assert refreshed is True
+    assert registry["files"]["app.py"]["stat"][0] == target.stat().st_size
+
+    reads = []
+    original = Path.read_bytes
+    monkeypatch.setattr(Path, "read_bytes", lambda self: reads.append(self) or original(self))
+    assert fhr.hash_tracked_file(tmp_path, registry, "app.py") == (current, False)
+    assert reads == []
+
+
+def test_changed_content_is_detected_and_stat_dropped(tmp_path):
+    target, registry = _tracked(tmp_path)
+    fhr.hash_tracked_file(tmp_path, registry, "app.py")
+
+    target.write_bytes(b"edited by user\n")
+    current, refreshed = fhr.hash_tracked_file(tmp_path, registry, "app.py")
+
+    assert current == fhr._sha256(b"edited by user\n")
+    assert refreshed is True
+    assert "stat" not in registry["files"]["app.py"]
+    assert fhr.hash_tracked_file(tmp_path, registry, "missing.py") == (None, False)
+
+
+def test_recently_written_files_are_not_stat_cached(tmp_path):
+    (tmp_path / "app.py").write_bytes(b"fresh")
+    registry = {}
+    fhr.record_file_hash(registry, "app.py", "mod", "1.0", b"fresh")
+
+    fhr.hash_tracked_file(tmp_path, registry, "app.py")
+    assert "stat" not in registry["files"]["app.py"]
+
+
+@pytest.mark.parametrize("mode", ["always", "background"])
+def test_verify_modes_catch_same_stat_edits(tmp_path, monkeypatch, mode):
+    target, registry = _tracked(tmp_path, b"aaaa")
+    fhr.hash_tracked_file(tmp_path, registry, "app.py")
+    # Same size, mtime and inode: invisible to the stat check.
+    target.write_bytes(b"bbbb")
+    os.utime(target, ns=(OLD_NS, OLD_NS))
+    monkeypatch.setenv(fhr.HASH_VERIFY_ENV, mode)
+
+    current, _ = fhr.hash_tracked_file(tmp_path, registry, "app.py")
+    mismatched = fhr.drain_verifications()
+
+    if mode == "always":
+        assert current == fhr._sha256(b"bbbb")
+    else:
+        assert current == fhr._sha256(b"aaaa")
+        assert mismatched == ["app.py"]
+        assert "stat" not in registry["files"]["app.py"]
+
+
+def test_untrusted_stat_always_hashes(tmp_path, monkeypatch):
+    monkeypatch.setenv(fhr.HASH_VERIFY_ENV, "background")
+    target, registry = _tracked(tmp_path, b"aaaa")
+    fhr.hash_tracked_file(tmp_path, registry, "app.py")
+    target.write_bytes(b"bbbb")
+    os.utime(target, ns=(OLD_NS, OLD_NS))
+
+    current, _ = fhr.hash_tracked_file(tmp_path, registry, "app.py", trust_stat=False)
+
+    assert current == fhr._sha256(b"bbbb")
+    assert fhr.drain_verifications() == []
+
+
+def test_save_hashes_is_compact_and_atomic(tmp_path):
+    _target, registry = _tracked(tmp_path)
+    fhr.save_hashes(tmp_path, registry)
+
+    hash_file = tmp_path / fhr.REGISTRY_DIR / fhr.HASH_FILE
+    text = hash_file.read_text(encoding="utf-8")
+    assert "\n" not in text and ": " not in text
+    assert json.loads(text) == registry
+    assert [p.name for p in hash_file.parent.iterdir()] == [fhr.HASH_FILE]
+
+
+def test_record_file_hash_caches_the_written_files_stat(tmp_path, monkeypatch):
+    target = tmp_path / "app.py"
+    target.write_bytes(b"written")
+    registry = {}
+    fhr.record_file_hash(registry, "app.py", "mod", "1.0", b"written", project_root=tmp_path)
+
+    entry = registry["files"]["app.py"]
+    st = target.stat()
+    assert entry["stat"] == [st.st_size, st.st_mtime_ns, st.st_ino]
+    # Just written: one confirming re-hash before the stat is trusted.
+    assert entry["stat_racy"] is True
+    os.utime(target, ns=(OLD_NS, OLD_NS))
+    fhr.record_file_hash(registry, "app.py", "mod", "1.0", b"written", project_root=tmp_path)
+    assert "stat_racy" not in registry["files"]["app.py"]
+
+    reads = []
+    original = Path.read_bytes
+    monkeypatch.setattr(Path, "read_bytes", lambda self: reads.append(self) or original(self))
+    assert fhr.hash_tracked_file(tmp_path, registry, "app.py") == (fhr._sha256(b"written"), False)
+    assert reads == []
+
+
+def test_diff_does_not_write_the_registry(tmp_path, monkeypatch):
+    from typer.testing import CliRunner
+
+    from cli.commands import diff
+
+    modules = tmp_path / "modules"
+    (modules / "mod").mkdir(parents=True)
+    (modules / "mod" / "module.yaml").write_text("name: mod\n")
+    project = tmp_path / "project"
+    project.mkdir()
+    _target, registry = _tracked(project)
+    fhr.save_hashes(project, registry)
+    hash_file = project / fhr.REGISTRY_DIR / fhr.HASH_FILE
+    before = hash_file.read_bytes()
+
+    monkeypatch.setattr(diff, "MODULES_PATH", modules)
+    monkeypatch.setattr(diff, "find_project_root", lambda _p: project)
+    monkeypatch.setattr(diff, "load_module_config", lambda _n, _p: {"root_path": ""})
+    monkeypatch.setattr(diff, "_collect_module_files", lambda *_a: [("base", {"path": "app.py"})])
+    result = CliRunner().invoke(diff.diff_app, ["all"])
+
+    assert result.exit_code == 0, result.output
+    assert '"status": "clean"' in result.output
+    assert hash_file.read_bytes() == before
@@ -0,0 +1,87 @@
+"""Rendering planner: cached environments must render byte-identical output."""
+
+import secrets
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+import pytest
+
+from core.engine.registry import KitRegistry
+from core.rendering import template_renderer
+
+KITS = ("fastapi.standard", "nestjs.standard")
+
+
+@pytest.fixture(autouse=True)
+def _quiet_generation(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Skip post_generate `poetry lock` and make generate_secret deterministic.
+    monkeypatch.setenv("RAPIDKIT_GENERATE_LOCKS", "0")
+    monkeypatch.setattr(secrets, "choice", lambda seq: seq[0])
+
+
+def _kit_variables(registry: KitRegistry, kit: str) -> Dict[str, Any]:
+    variables: Dict[str, Any] = {"project_name": "bench_app", "author": "bench"}
+    for var in registry.get_kit(kit).variables:
+        if var.name not in variables and var.default is not None:
+            variables[var.name] = var.default
+    return variables
+
+
+def _generate(registry: KitRegistry, kit: str, out: Path) -> Tuple[List[str], Dict[str, bytes]]:
+    files = registry.get_generator(kit).generate(out, _kit_variables(registry, kit))
+    relative = [str(Path(f).relative_to(out)) for f in files]
+    return relative, {rel: (out / rel).read_bytes() for rel in relative}
+
+
+@pytest.mark.parametrize("kit", KITS)
+def test_cached_render_matches_fresh_render(kit: str, tmp_path: Path) -> None:
+    registry = KitRegistry()
+    template_renderer._ENVIRONMENTS.clear()
+    fresh_files, fresh_bytes = _generate(registry, kit, tmp_path / "fresh")
+    cached_files, cached_bytes = _generate(registry, kit, tmp_path / "cached")
+
+    assert cached_files == fresh_files
+    assert cached_bytes == fresh_bytes
+
+
+def test_bytecode_cache_is_opt_in(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv(template_renderer.TEMPLATE_CACHE_DIR_ENV, raising=False)
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+    assert template_renderer._bytecode_cache() is None
+    assert not (tmp_path / "home").exists() and not (tmp_path / "xdg").exists()
+
+    monkeypatch.setenv(template_renderer.TEMPLATE_CACHE_DIR_ENV, str(tmp_path / "bytecode"))
+    assert template_renderer._bytecode_cache() is not None
+    assert (tmp_path / "bytecode").is_dir()
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("kit", KITS)
+def test_generate_benchmark(kit: str, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    registry = KitRegistry()
+    timings: Dict[str, float] = {}
+    # "uncompiled" recompiles every template per run, as generate() did before
+    # the shared compiled-template cache existed; "bytecode" does too, but
+    # loads the compiled code from the opt-in on-disk cache.
+    for label, cold, cache_dir in (
+        ("uncompiled", True, None),
+        ("bytecode", True, tmp_path / "bytecode"),
+        ("cached", False, None),
+    ):
+        if cache_dir is None:
+            monkeypatch.delenv(template_renderer.TEMPLATE_CACHE_DIR_ENV, raising=False)
+        else:
+            monkeypatch.setenv(template_renderer.TEMPLATE_CACHE_DIR_ENV, str(cache_dir))
+        template_renderer._ENVIRONMENTS.clear()
+        _generate(registry, kit, tmp_path / f"{label}-warmup")
+        started = time.perf_counter()
+        for run in range(10):
+            if cold:
+                template_renderer._ENVIRONMENTS.clear()
+            _generate(registry, kit, tmp_path / f"{label}-{run}")
+        timings[label] = (time.perf_counter() - started) / 10
+
+    print(f"\n{kit}: " + ", ".join(f"{k} {v * 1000:.1f} ms" for k, v in timings.items()))
+    assert timings["cached"] < timings["uncompiled"]
@@ -0,0 +1,229 @@
+"""Async provider dispatch: thread offload, limits, timeouts, failover, breakers and hedging."""
+
+from __future__ import annotations
+
+import asyncio
+import importlib
+import sys
+import time
+from types import ModuleType
+from typing import Any, Iterator
+from uuid import uuid4
+
+import pytest
+
+from modules.free.ai.ai_assistant import generate
+from modules.shared.generator import TemplateRenderer
+
+
+@pytest.fixture(scope="module")
+def runtime(tmp_path_factory: pytest.TempPathFactory) -> Iterator[ModuleType]:
+    renderer = TemplateRenderer(generate.MODULE_ROOT / "templates")
+    context = generate.build_base_context(generate.load_module_config())
+    root = tmp_path_factory.mktemp("ai_assistant_dispatch")
+    package = f"ai_assistant_dispatch_{uuid4().hex}"
+    (root / package).mkdir()
+    (root / package / "__init__.py").write_text("", encoding="utf-8")
+    for name in ("ai_assistant", "ai_assistant_types"):
+        (root / package / f"{name}.py").write_text(
+            renderer.render_template(f"base/{name}.py.j2", context), encoding="utf-8"
+        )
+    sys.path.insert(0, str(root))
+    try:
+        yield importlib.import_module(f"{package}.ai_assistant")
+    finally:
+        sys.path.remove(str(root))
+
+
+class _AsyncProvider:
+    """Native async provider with a configurable delay, failure mode and in-flight gauge."""
+
+    def __init__(self, runtime: ModuleType, name: str, *, delay: float = 0.0, fail: bool = False):
+        self.name = name
+        self.delay = delay
+        self.fail = fail
+        self.calls = 0
+        self.in_flight = 0
+        self.peak = 0
+        self._status = runtime.ProviderStatus
+
+    async def agenerate(self, prompt: str, *, conversation: Any, settings: Any = None) -> str:
+        self.calls += 1
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            if self.fail:
+                raise ConnectionError(f"{self.name} is down")
+            return f"{self.name}: {prompt}"
+        finally:
+            self.in_flight -= 1
+
+    def generate(self, prompt: str, *, conversation: Any, settings: Any = None) -> str:
+        raise AssertionError("async providers must not be called synchronously")
+
+    def health(self) -> Any:
+        return self._status(name=self.name, status="ok")
+
+
+def _assistant(runtime: ModuleType, *providers: Any, **overrides: Any) -> Any:
+    config = runtime.AiAssistantConfig(cache_enabled=False, **overrides)
+    assistant = runtime.AiAssistant(config)
+    for provider in providers:
+        assistant.register_provider(provider)
+    if providers:
+        assistant.set_default_provider(providers[0].name)
+    return assistant
+
+
+def test_sync_providers_are_offloaded_from_the_event_loop(runtime: ModuleType) -> None:
+    class _BlockingEcho(runtime.EchoProvider):
+        def generate(self, prompt: str, **kwargs: Any) -> str:
+            time.sleep(0.2)
+            return super().generate(prompt, **kwargs)
+
+    assistant = _assistant(runtime, _BlockingEcho(prefix="[slow] "))
+
+    async def exercise() -> tuple[Any, int]:
+        ticks = 0
+
+        async def ticker() -> None:
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        task = asyncio.ensure_future(ticker())
+        response = await assistant.achat("hello")
+        task.cancel()
+        return response, ticks
+
+    response, ticks = asyncio.run(exercise())
+
+    assert response.content == "[slow] hello"
+    assert ticks >= 10  # the loop kept running while the provider blocked its thread
+    assert assistant.health_report()["providers"][0]["latency_ms"] >= 200
+
+
+def test_failover_skips_failing_and_timed_out_providers(runtime: ModuleType) -> None:
+    down = _AsyncProvider(runtime, "down", fail=True)
+    stuck = _AsyncProvider(runtime, "stuck", delay=5)
+    assistant = _assistant(runtime, down, stuck)
+    assistant._provider_options["stuck"] = {"timeout_seconds": 0.05}
+
+    response = asyncio.run(assistant.achat("hi"))
+
+    # Failover follows registration order after the primary; the built-in echo comes first.
+    assert response.provider == "echo" and response.content == "[echo] hi"
+    assert response.metadata["failed_providers"] == ["down: ConnectionError: down is down"]
+
+    started = time.perf_counter()
+    with pytest.raises(runtime.ProviderUnavailableError, match="stuck: TimeoutError"):
+        asyncio.run(assistant.achat("hi", provider="stuck"))
+    assert time.perf_counter() - started < 1
+    with pytest.raises(runtime.ProviderUnavailableError):
+        asyncio.run(assistant.achat("hi", provider="down"))
+
+
+def test_circuit_opens_and_probes_after_reset(runtime: ModuleType) -> None:
+    flaky = _AsyncProvider(runtime, "flaky", fail=True)
+    assistant = _assistant(runtime, flaky, circuit_failure_threshold=2, circuit_reset_seconds=0.1)
+
+    async def burst(count: int) -> list[str]:
+        return [(await assistant.achat(f"q{i}")).provider for i in range(count)]
+
+    assert asyncio.run(burst(5)) == ["echo"] * 5
+    assert flaky.calls == 2
+    assert assistant.circuit_states()["flaky"]["state"] == "open"
+    assert assistant.health_report()["status"] == "degraded"
+
+    time.sleep(0.12)
+    flaky.fail = False
+    assert asyncio.run(burst(2)) == ["flaky", "flaky"]
+    assert assistant.circuit_states()["flaky"] == {"state": "closed", "failures": 0, "opened": 1}
+
+
+def test_cancelled_probe_frees_the_half_open_slot(runtime: ModuleType) -> None:
+    flaky = _AsyncProvider(runtime, "flaky", fail=True)
+    assistant = _assistant(
+        runtime,
+        flaky,
+        failover_enabled=False,
+        circuit_failure_threshold=1,
+        circuit_reset_seconds=0.05,
+    )
+    with pytest.raises(runtime.ProviderUnavailableError):
+        asyncio.run(assistant.achat("q0"))
+    time.sleep(0.06)
+    flaky.fail, flaky.delay = False, 1.0
+
+    async def cancel_probe() -> None:
+        task = asyncio.ensure_future(assistant.achat("probe"))
+        await asyncio.sleep(0.02)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        await asyncio.sleep(0)  # let the cancelled provider call unwind
+
+    asyncio.run(cancel_probe())
+    flaky.delay = 0.0
+
+    assert asyncio.run(assistant.achat("retry")).provider == "flaky"
+    assert assistant.circuit_states()["flaky"] == {"state": "closed", "failures": 0, "opened": 1}
+
+
+def test_slow_calls_and_unhealthy_providers_are_avoided(runtime: ModuleType) -> None:
+    breaker = runtime.CircuitBreaker(failure_threshold=2, slow_call_ms=100)
+    breaker.record_success(250)
+    breaker.record_success(250)
+    assert breaker.state == "open"
+
+    status = {"value": "error", "calls": 0}
+    now = {"t": 0.0}
+
+    def health() -> Any:
+        status["calls"] += 1
+        return runtime.ProviderStatus(name="x", status=status["value"])
+
+    guarded = runtime.CircuitBreaker(health=health, health_ttl_seconds=5, clock=lambda: now["t"])
+    assert guarded.allow() is False and guarded.state == "closed"
+    status["value"] = "degraded"
+    assert [guarded.allow() for _ in range(100)] == [False] * 100  # cached verdict
+    assert status["calls"] == 1
+    now["t"] = 5.0
+    assert guarded.allow() is True and status["calls"] == 2
+
+
+def test_per_provider_concurrency_limit(runtime: ModuleType) -> None:
+    provider = _AsyncProvider(runtime, "limited", delay=0.02)
+    assistant = _assistant(runtime, provider, failover_enabled=False)
+    assistant._provider_options["limited"] = {"max_concurrency": 2}
+
+    async def exercise() -> list[Any]:
+        return await asyncio.gather(
+            *(assistant.achat(f"q{i}", session_id=str(i)) for i in range(10))
+        )
+
+    for _ in range(2):  # a fresh loop must not trip over the previous loop's semaphore
+        responses = asyncio.run(exercise())
+
+        assert {response.provider for response in responses} == {"limited"}
+        assert provider.peak == 2
+
+
+def test_hedged_request_returns_the_first_answer(runtime: ModuleType) -> None:
+    slow = _AsyncProvider(runtime, "slow", delay=1.0)
+    assistant = _assistant(runtime, slow, hedge_after_ms=30)
+
+    async def exercise() -> Any:
+        response = await assistant.achat("race")
+        await asyncio.sleep(0)  # let the cancelled loser unwind
+        return response
+
+    started = time.perf_counter()
+    response = asyncio.run(exercise())
+
+    assert time.perf_counter() - started < 0.5
+    assert response.provider == "echo" and response.metadata == {"hedged": True}
+    assert slow.in_flight == 0
+    assert assistant.circuit_states()["slow"]["failures"] == 0
@@ -0,0 +1,173 @@
+"""Response cache bounds, content-hash keys, shared stores and per-session history."""
+
+from __future__ import annotations
+
+import importlib
+import sys
+from pathlib import Path
+from types import ModuleType
+from typing import Iterator
+from uuid import uuid4
+
+import pytest
+
+from modules.free.ai.ai_assistant import generate
+from modules.shared.generator import TemplateRenderer
+
+
+@pytest.fixture(scope="module")
+def runtime(tmp_path_factory: pytest.TempPathFactory) -> Iterator[ModuleType]:
+    renderer = TemplateRenderer(generate.MODULE_ROOT / "templates")
+    context = generate.build_base_context(generate.load_module_config())
+    root = tmp_path_factory.mktemp("ai_assistant_cache")
+    package = f"ai_assistant_cache_{uuid4().hex}"
+    (root / package).mkdir()
+    (root / package / "__init__.py").write_text("", encoding="utf-8")
+    for name in ("ai_assistant", "ai_assistant_types"):
+        (root / package / f"{name}.py").write_text(
+            renderer.render_template(f"base/{name}.py.j2", context), encoding="utf-8"
+        )
+    sys.path.insert(0, str(root))
+    try:
+        yield importlib.import_module(f"{package}.ai_assistant")
+    finally:
+        sys.path.remove(str(root))
+
+
+def _assistant(runtime: ModuleType, **overrides):  # type: ignore[no-untyped-def]
+    store = overrides.pop("response_store", None)
+    return runtime.AiAssistant(runtime.AiAssistantConfig(**overrides), response_store=store)
+
+
+def test_identical_requests_share_a_fixed_size_key(runtime: ModuleType) -> None:
+    assistant = _assistant(runtime)
+
+    first = assistant.chat("What is RapidKit?", session_id="alice")
+    second = assistant.chat("What is RapidKit?", session_id="bob")
+
+    assert (first.cached, second.cached) == (False, True)
+    key = runtime.cache_key("echo", "What is RapidKit?", assistant.get_history("alice")[:1], None)
+    assert len(key) == 32 and key in assistant._cache._entries
+    assert assistant.cache_stats() == {
+        "entries": 1,
+        "hits": 1,
+        "misses": 1,
+        "store_hits": 0,
+        "evictions": 0,
+        "expirations": 0,
+        "store_errors": 0,
+        "hit_rate": 0.5,
+    }
+
+
+def test_cache_is_bounded_and_expires(runtime: ModuleType) -> None:
+    clock = {"now": 0.0}
+    cache = runtime.ResponseCache(max_entries=3, ttl_seconds=10, clock=lambda: clock["now"])
+    assistant = _assistant(runtime)
+    response = assistant.chat("seed")
+
+    for index in range(10):
+        cache.set(f"key-{index}", response)
+    assert len(cache) == 3 and cache.stats.evictions == 7
+    assert cache.get("key-9") is response
+
+    clock["now"] += 10
+    assert cache.get("key-9") is None
+    assert cache.stats.expirations == 1
+
+
+def test_sessions_are_isolated_and_evicted(runtime: ModuleType) -> None:
+    assistant = _assistant(runtime, session_max_count=2)
+
+    assistant.chat("hello from alice", session_id="alice")
+    assistant.chat("hello from bob", session_id="bob")
+    assistant.chat("hello from carol", session_id="carol")
+
+    assert [msg.content for msg in assistant.get_history("bob")] == [
+        "hello from bob",
+        "[echo] hello from bob",
+    ]
+    assert assistant.get_history("alice") == ()
+    assert assistant.health_report()["sessions"] == 2
+    assistant.clear_session("bob")
+    assert assistant.get_history("bob") == ()
+
+
+def test_idle_sessions_expire(runtime: ModuleType) -> None:
+    clock = {"now": 0.0}
+    sessions = runtime.SessionStore(
+        window=4, max_sessions=100, idle_ttl_seconds=60, clock=lambda: clock["now"]
+    )
+    for index in range(50):
+        sessions.append(f"visitor-{index}", runtime.AssistantMessage(role="user", content="hi"))
+    clock["now"] += 61
+    sessions.append("returning", runtime.AssistantMessage(role="user", content="hi"))
+
+    assert len(sessions) == 1 and sessions.evictions == 50
+
+
+def test_sqlite_store_is_shared_between_instances(runtime: ModuleType, tmp_path: Path) -> None:
+    url = f"sqlite:///{tmp_path / 'responses.db'}"
+    warm = _assistant(runtime, cache_store_url=url)
+    cold = _assistant(runtime, cache_store_url=url)
+
+    warm.chat("cache me")
+    response = cold.chat("cache me")
+
+    assert response.cached is True
+    assert cold.cache_stats()["store_hits"] == 1
+    cold.clear_cache()
+    assert _assistant(runtime, cache_store_url=url).chat("cache me").cached is False
+
+
+def test_redis_store_round_trips_responses(runtime: ModuleType) -> None:
+    fakeredis = pytest.importorskip("fakeredis")
+    client = fakeredis.FakeRedis()
+    store = runtime.RedisResponseStore(client)
+
+    _assistant(runtime, response_store=store).chat("shared")
+    response = _assistant(runtime, response_store=store).chat("shared")
+
+    assert response.cached is True and response.content == "[echo] shared"
+    assert 0 < client.pttl(client.keys("ai_assistant:cache:*")[0]) <= 3_600_000
+    store.clear()
+    assert client.keys("ai_assistant:cache:*") == []
+
+
+def test_store_failures_are_counted_misses(runtime: ModuleType, tmp_path: Path) -> None:
+    url = f"sqlite:///{tmp_path / 'responses.db'}"
+    warm = _assistant(runtime, cache_store_url=url)
+    warm.chat("cache me")
+    store = warm._cache._store
+    key = next(iter(warm._cache._entries))
+    store.set(key, b"{not json", 60)
+
+    cold = _assistant(runtime, cache_store_url=url)
+    assert cold.chat("cache me").cached is False
+    assert cold.cache_stats()["store_errors"] == 1
+    assert store.get(key) is not None  # the fresh response replaced the bad payload
+
+    class _Down:
+        def get(self, key: str) -> bytes:
+            raise ConnectionError("store down")
+
+        set = clear = delete = get
+
+    broken = _assistant(runtime, response_store=_Down())
+    assert broken.chat("still works", session_id="a").content == "[echo] still works"
+    assert broken.chat("still works", session_id="b").cached is True  # from the local LRU
+    assert broken.cache_stats()["store_errors"] == 2
+
+
+def test_unbounded_ttl_still_reaches_the_shared_store(runtime: ModuleType, tmp_path: Path) -> None:
+    url = f"sqlite:///{tmp_path / 'forever.db'}"
+    _assistant(runtime, cache_store_url=url, cache_ttl_seconds=0).chat("keep me")
+
+    assert _assistant(runtime, cache_store_url=url).chat("keep me").cached is True
+
+    fakeredis = pytest.importorskip("fakeredis")
+    client = fakeredis.FakeRedis()
+    store = runtime.RedisResponseStore(client)
+    _assistant(runtime, response_store=store, cache_ttl_seconds=0).chat("keep me")
+
+    assert client.pttl(client.keys("ai_assistant:cache:*")[0]) == -1  # no expiry
@@ -0,0 +1,112 @@
+"""OAuth state stores: heap expiry, parallel consumption, Redis GETDEL and signed states."""
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from types import ModuleType
+
+import pytest
+
+from modules.free.auth.oauth import generate
+
+
+@pytest.fixture(scope="module")
+def oauth(tmp_path_factory: pytest.TempPathFactory) -> ModuleType:
+    target = tmp_path_factory.mktemp("oauth_state_stores")
+    config = generate.load_module_config()
+    generate.generate_vendor_files(
+        config, target, generate.TemplateRenderer(), generate.build_base_context(config)
+    )
+    path = next(target.glob(".rapidkit/vendor/*/*/src/modules/free/auth/oauth/oauth.py"))
+    spec = importlib.util.spec_from_file_location("rapidkit_test_oauth_state_stores", path)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module  # dataclasses resolve annotations through sys.modules
+    spec.loader.exec_module(module)
+    return module
+
+
+def _consume_in_parallel(store, states: list[str]) -> list[object]:  # type: ignore[no-untyped-def]
+    # Every state is popped twice concurrently; exactly one pop may win.
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        return list(pool.map(store.pop, states + states))
+
+
+def test_memory_store_consumes_each_state_once_under_contention(oauth: ModuleType) -> None:
+    store = oauth.OAuthStateStore(ttl_seconds=60)
+
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        states = list(pool.map(lambda i: store.issue("google", {"i": i}), range(2000)))
+    results = _consume_in_parallel(store, states)
+
+    assert len(set(states)) == 2000
+    winners = [entry for entry in results if entry is not None]
+    assert sorted(entry.metadata["i"] for entry in winners) == list(range(2000))
+    assert len(store) == 0
+
+
+def test_memory_store_expires_from_the_heap(oauth: ModuleType) -> None:
+    clock = {"now": 1000.0}
+    store = oauth.OAuthStateStore(ttl_seconds=10, clock=lambda: clock["now"])
+    stale = [store.issue("github") for _ in range(500)]
+    clock["now"] += 5
+    fresh = store.issue("github")
+    clock["now"] += 6
+
+    assert store.pop(stale[0]) is None
+    assert len(store) == 1  # the other stale states were dropped by the same call
+    assert store.pop(fresh).provider == "github"
+    assert len(store._expiry) <= 64 + 2 * len(store)
+
+
+def test_redis_store_uses_getdel_and_server_ttl(oauth: ModuleType) -> None:
+    fakeredis = pytest.importorskip("fakeredis")
+    server = fakeredis.FakeServer()
+    worker_a = oauth.RedisStateStore(fakeredis.FakeRedis(server=server), ttl_seconds=30)
+    worker_b = oauth.RedisStateStore(fakeredis.FakeRedis(server=server), ttl_seconds=30)
+
+    state = worker_a.issue("google", {"next": "/home"})
+    ttl = fakeredis.FakeRedis(server=server).pttl(f"oauth:state:{state}")
+    entry = worker_b.pop(state)
+
+    assert 0 < ttl <= 30_000
+    assert (entry.provider, entry.metadata) == ("google", {"next": "/home"})
+    assert worker_a.pop(state) is None
+
+    states = [worker_a.issue("github") for _ in range(200)]
+    results = _consume_in_parallel(worker_b, states)
+    assert sum(entry is not None for entry in results) == 200
+
+
+def test_signed_store_verifies_without_storage(oauth: ModuleType, monkeypatch) -> None:  # type: ignore[no-untyped-def]
+    issuer = oauth.SignedStateStore("s3cret", ttl_seconds=30)
+    verifier = oauth.SignedStateStore("rotated", ttl_seconds=30, previous_secrets=["s3cret"])
+
+    state = issuer.issue("github", {"next": "/repos"})
+    body, _, tag = state.partition(".")
+
+    assert verifier.pop(state).metadata == {"next": "/repos"}
+    assert oauth.SignedStateStore("other", ttl_seconds=30).pop(state) is None
+    assert issuer.pop(f"{body}x.{tag}") is None
+    assert issuer.pop("not-a-state") is None
+
+    issued_at = oauth.time.time()
+    monkeypatch.setattr(oauth.time, "time", lambda: issued_at + 31)
+    assert issuer.pop(state) is None
+
+
+def test_settings_select_the_state_store(oauth: ModuleType, monkeypatch) -> None:  # type: ignore[no-untyped-def]
+    monkeypatch.setenv("OAUTH_STATE_STORE", "signed")
+    monkeypatch.delenv("OAUTH_STATE_SECRET", raising=False)
+    with pytest.raises(ValueError, match="secret"):
+        oauth.OAuthRuntime(oauth.load_oauth_settings())
+
+    monkeypatch.setenv("OAUTH_STATE_SECRET", "s3cret")
+    runtime = oauth.OAuthRuntime(oauth.load_oauth_settings())
+    state = runtime.issue_state("google", {"ip": "127.0.0.1"})
+
+    assert isinstance(runtime.state_store, oauth.SignedStateStore)
+    assert runtime.validate_callback("google", state) == {"ip": "127.0.0.1"}
+    assert "s3cret" not in repr(runtime.settings)
@@ -0,0 +1,144 @@
+"""Passwordless token stores: bounded memory, atomic attempts and shared cooldowns."""
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from types import ModuleType
+
+import pytest
+
+from modules.free.auth.passwordless import generate
+
+
+@pytest.fixture(scope="module")
+def passwordless(tmp_path_factory: pytest.TempPathFactory) -> ModuleType:
+    target = tmp_path_factory.mktemp("passwordless_stores")
+    config = generate.load_module_config()
+    generate.generate_vendor_files(
+        config, target, generate.TemplateRenderer(), generate.build_base_context(config)
+    )
+    path = next(
+        target.glob(".rapidkit/vendor/*/*/src/modules/free/auth/passwordless/passwordless.py")
+    )
+    spec = importlib.util.spec_from_file_location("rapidkit_test_passwordless_stores", path)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module  # dataclasses resolve annotations through sys.modules
+    spec.loader.exec_module(module)
+    return module
+
+
+def _wrong_guesses_in_parallel(runtime, identifier: str, guesses: int) -> list[str]:  # type: ignore[no-untyped-def]
+    barrier = threading.Barrier(guesses)
+
+    def guess(_: int) -> str:
+        barrier.wait()
+        try:
+            runtime.verify_code(identifier, "not-the-code", delivery_method="email")
+        except ValueError as exc:
+            return str(exc)
+        return "verified"
+
+    with ThreadPoolExecutor(max_workers=guesses) as pool:
+        return list(pool.map(guess, range(guesses)))
+
+
+def test_parallel_guesses_cannot_exceed_max_attempts(passwordless: ModuleType) -> None:
+    settings = passwordless.load_passwordless_settings({"max_attempts": 5})
+    runtime = passwordless.PasswordlessRuntime(settings)
+    token = runtime.issue_code("user@example.com", delivery_method="email")
+
+    outcomes = _wrong_guesses_in_parallel(runtime, "user@example.com", 32)
+
+    assert outcomes.count("Passwordless code is invalid") == 5
+    assert runtime.token_store.active("user@example.com::email") is None
+    with pytest.raises(ValueError):
+        runtime.verify_code("user@example.com", token.code, delivery_method="email")
+
+
+def test_concurrent_valid_verifications_succeed_once(passwordless: ModuleType) -> None:
+    runtime = passwordless.PasswordlessRuntime(passwordless.load_passwordless_settings())
+    token = runtime.issue_code("user@example.com", delivery_method="email")
+    barrier = threading.Barrier(8)
+
+    def verify(_: int) -> bool:
+        barrier.wait()
+        try:
+            runtime.verify_code("user@example.com", token.code, delivery_method="email")
+        except ValueError:
+            return False
+        return True
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        assert sum(pool.map(verify, range(8))) == 1
+
+
+def test_memory_state_stays_bounded_during_floods(passwordless: ModuleType, monkeypatch) -> None:  # type: ignore[no-untyped-def]
+    clock = {"now": 1000.0}
+    monkeypatch.setattr(passwordless.time, "time", lambda: clock["now"])
+    settings = passwordless.load_passwordless_settings(
+        {"token_ttl_seconds": 60, "resend_cooldown_seconds": 30}
+    )
+    runtime = passwordless.PasswordlessRuntime(settings)
+
+    for wave in range(3):
+        for index in range(1000):
+            runtime.issue_magic_link(f"lead-{wave}-{index}@example.com", delivery_method="email")
+        clock["now"] += 61
+
+    runtime.issue_code("late@example.com", delivery_method="email")
+    assert len(runtime.token_store) == 1
+    assert len(runtime.limiter) == 1
+    assert len(runtime.token_store._expiry) <= 64 + 2 * len(runtime.token_store)
+
+
+def test_reissue_replaces_the_previous_token(passwordless: ModuleType, monkeypatch) -> None:  # type: ignore[no-untyped-def]
+    clock = {"now": 1000.0}
+    monkeypatch.setattr(passwordless.time, "time", lambda: clock["now"])
+    runtime = passwordless.PasswordlessRuntime(passwordless.load_passwordless_settings())
+    first = runtime.issue_code("user@example.com", delivery_method="sms")
+    clock["now"] += 61
+    second = runtime.issue_code("user@example.com", delivery_method="sms")
+
+    assert len(runtime.token_store) == 1
+    assert runtime.verify_code("user@example.com", second.code).token_id == second.token_id
+    assert first.token_id != second.token_id
+
+
+def test_redis_backend_shares_attempts_and_cooldowns(passwordless: ModuleType) -> None:
+    fakeredis = pytest.importorskip("fakeredis")
+    server = fakeredis.FakeServer()
+    settings = passwordless.load_passwordless_settings({"max_attempts": 3})
+
+    def worker():  # type: ignore[no-untyped-def]
+        client = fakeredis.FakeRedis(server=server)
+        return passwordless.PasswordlessRuntime(
+            settings,
+            token_store=passwordless.RedisTokenStore(client),
+            limiter=passwordless.RedisCooldownLimiter(client),
+        )
+
+    worker_a, worker_b = worker(), worker()
+    token = worker_a.issue_code("user@example.com", delivery_method="email", metadata={"a": 1})
+    with pytest.raises(ValueError, match="recently sent"):
+        worker_b.issue_code("user@example.com", delivery_method="email")
+
+    outcomes = _wrong_guesses_in_parallel(worker_b, "user@example.com", 16)
+    assert outcomes.count("Passwordless code is invalid") == 3
+    with pytest.raises(ValueError):
+        worker_a.verify_code("user@example.com", token.code, delivery_method="email")
+
+    fakeredis.FakeRedis(server=server).flushall()
+    token = worker_a.issue_code("other@example.com", delivery_method="email", metadata={"a": 1})
+    verified = worker_b.verify_code("other@example.com", token.code)
+    assert (verified.token_id, verified.metadata, verified.attempts) == (
+        token.token_id,
+        {"a": 1},
+        1,
+    )
+    with pytest.raises(ValueError):
+        worker_a.verify_code("other@example.com", token.code)
+    assert fakeredis.FakeRedis(server=server).keys("passwordless:attempts:*") == []
@@ -0,0 +1,248 @@
+"""Incremental totals, versioned check-and-set stores and abandoned-cart expiry."""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+CONFIG = {
+    "defaults": {
+        "currency": "USD",
+        "tax_rate": "0.10",
+        "default_discount_code": "WELCOME10",
+        "auto_apply_default_discount": True,
+        "max_unique_items": 500,
+    },
+    "discount_rules": [
+        {"code": "WELCOME10", "percentage": "0.10"},
+        {"code": "BOLTS", "percentage": "0.25", "applies_to": ["sku-1", "sku-2"]},
+        {"code": "BULK", "amount": "50.00", "minimum_subtotal": "500.00"},
+    ],
+}
+
+
+def _service(runtime, **kwargs):  # type: ignore[no-untyped-def]
+    return runtime.CartService(runtime.CartConfig.from_mapping(CONFIG), **kwargs)
+
+
+def _worker_stores(runtime, tmp_path: Path):  # type: ignore[no-untyped-def]
+    url = f"sqlite:///{tmp_path / 'carts.db'}"
+    yield "sqlite", lambda: runtime.build_cart_store(url)
+    fakeredis = pytest.importorskip("fakeredis")
+    server = fakeredis.FakeServer()
+    yield "redis", lambda: runtime.RedisCartStore(fakeredis.FakeRedis(server=server))
+
+
+def test_incremental_totals_match_a_full_recount(generated_modules) -> None:
+    runtime = generated_modules["runtime"]
+    service = _service(runtime)
+    rng = random.Random(11)
+    for _ in range(600):
+        sku = f"sku-{rng.randrange(40)}"
+        action = rng.random()
+        try:
+            if action < 0.5:
+                service.add_item(
+                    "b2b",
+                    sku=sku,
+                    name=sku,
+                    quantity=rng.randrange(1, 5),
+                    unit_price=f"{rng.randrange(1, 5000) / 100:.2f}",
+                )
+            elif action < 0.75:
+                service.update_item("b2b", sku=sku, quantity=rng.randrange(0, 6))
+            elif action < 0.9:
+                service.remove_item("b2b", sku=sku)
+            elif action < 0.95:
+                service.apply_discount("b2b", rng.choice(["BOLTS", "BULK"]))
+            else:
+                service.remove_discount("b2b", rng.choice(["BOLTS", "BULK", "WELCOME10"]))
+        except runtime.CartError:
+            pass  # rejected mutations must leave the totals untouched
+
+    snapshot = service.get_cart("b2b")
+    recounted = service._recalculate(snapshot.evolve()).totals
+    assert snapshot.totals == recounted
+    assert snapshot.totals.item_count == sum(item.quantity for item in snapshot.items)
+    assert snapshot.version > 100
+
+
+def test_items_are_shared_but_immutable(generated_modules) -> None:
+    runtime = generated_modules["runtime"]
+    service = _service(runtime)
+    first = service.add_item("c", sku="a", name="A", unit_price="1.00")
+    second = service.add_item("c", sku="b", name="B", unit_price="2.00")
+
+    assert second.items[0] is service.get_cart("c").items[0]
+    with pytest.raises(AttributeError):
+        second.items[0].quantity = 99  # type: ignore[misc]
+    first.items.append(second.items[1])
+    assert [item.sku for item in service.get_cart("c").items] == ["a", "b"]
+
+
+def test_stale_writes_are_rejected(generated_modules) -> None:
+    runtime = generated_modules["runtime"]
+    store = runtime.InMemoryCartStore()
+    service = _service(runtime, store=store)
+    created = service.add_item("c", sku="a", name="A", unit_price="3.00")
+    assert created.version == 1
+
+    stale = store.get("c")
+    service.add_item("c", sku="b", name="B", unit_price="4.00")
+    assert store.compare_and_set(stale.evolve(version=2), expected_version=1) is False
+    assert store.compare_and_set(stale.evolve(version=1), expected_version=0) is False
+
+    class _Contended(runtime.InMemoryCartStore):
+        def compare_and_set(self, snapshot, *, expected_version):  # type: ignore[no-untyped-def]
+            return False
+
+    with pytest.raises(runtime.CartConflictError):
+        _service(runtime, store=_Contended()).add_item("c", sku="a", name="A", unit_price="1")
+
+
+def test_concurrent_adds_do_not_lose_lines(generated_modules) -> None:
+    runtime = generated_modules["runtime"]
+    service = _service(runtime)
+    barrier = threading.Barrier(8)
+
+    def worker(index: int) -> None:
+        barrier.wait()
+        for line in range(25):
+            service.add_item("shared", sku=f"{index}-{line}", name="Part", unit_price="1.50")
+            service.add_item("shared", sku="common", name="Common", unit_price="2.00")
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(worker, range(8)))
+
+    snapshot = service.get_cart("shared")
+    assert len(snapshot.items) == 201
+    assert snapshot.totals.item_count == 400
+    assert snapshot.totals.subtotal == Decimal("700.00")
+    assert snapshot.version == 400
+
+
+def test_abandoned_carts_expire_in_memory(generated_modules) -> None:
+    runtime = generated_modules["runtime"]
+    clock = {"now": 1000.0}
+    store = runtime.InMemoryCartStore(ttl_seconds=60, clock=lambda: clock["now"])
+    service = _service(runtime, store=store)
+
+    for index in range(100):
+        service.add_item(f"lead-{index}", sku="a", name="A", unit_price="1")
+    clock["now"] += 30
+    service.add_item("lead-7", sku="b", name="B", unit_price="1")
+    clock["now"] += 31
+
+    assert service.list_carts() == ["lead-7"]
+    assert len(store) == 1
+    assert service.get_cart("lead-8").items == []
+    assert service.purge_abandoned() == 0
+
+
+def test_workers_share_carts_through_durable_stores(generated_modules, tmp_path: Path) -> None:
+    runtime = generated_modules["runtime"]
+    for backend, make_store in _worker_stores(runtime, tmp_path):
+        workers = [_service(runtime, store=make_store()) for _ in range(4)]
+        cart_id = f"{backend}-cart"
+        workers[0].add_item(cart_id, sku="seed", name="Seed", unit_price="10.00", metadata={"a": 1})
+
+        def worker(index: int, workers=workers, cart_id=cart_id) -> None:  # type: ignore[no-untyped-def]
+            for line in range(10):
+                workers[index % 4].add_item(
+                    cart_id, sku=f"{index}-{line}", name="Part", unit_price="0.50"
+                )
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            list(pool.map(worker, range(8)))
+
+        snapshot = workers[3].get_cart(cart_id)
+        assert (len(snapshot.items), snapshot.version) == (81, 81), backend
+        assert snapshot.items[0].metadata == {"a": 1}
+        assert snapshot.totals == workers[1]._recalculate(snapshot.evolve()).totals
+        assert workers[2].list_carts() == [cart_id]
+
+
+def test_sqlite_store_expires_abandoned_carts(generated_modules, tmp_path: Path) -> None:
+    runtime = generated_modules["runtime"]
+    clock = {"now": 1000.0}
+    store = runtime.SqliteCartStore(
+        str(tmp_path / "carts.db"), ttl_seconds=60, clock=lambda: clock["now"]
+    )
+    service = _service(runtime, store=store)
+    service.add_item("old", sku="a", name="A", unit_price="1")
+    clock["now"] += 45
+    service.add_item("fresh", sku="a", name="A", unit_price="1")
+    clock["now"] += 30
+
+    assert service.list_carts() == ["fresh"]
+    recreated = service.add_item("old", sku="b", name="B", unit_price="2")
+    assert ([item.sku for item in recreated.items], recreated.version) == (["b"], 1)
+    clock["now"] += 61
+    assert service.purge_abandoned() == 2
+
+
+def test_redis_store_sets_a_ttl(generated_modules) -> None:
+    fakeredis = pytest.importorskip("fakeredis")
+    runtime = generated_modules["runtime"]
+    client = fakeredis.FakeRedis()
+    service = _service(runtime, store=runtime.RedisCartStore(client, ttl_seconds=3600))
+
+    service.add_item("c", sku="a", name="A", unit_price="1")
+
+    assert 0 < client.pttl("cart:snapshot:c") <= 3_600_000
+    assert service.get_cart("c").version == 1
+
+
+def test_store_urls_select_the_backend(generated_modules, tmp_path: Path) -> None:
+    runtime = generated_modules["runtime"]
+    build = runtime.build_cart_store
+
+    assert isinstance(build(None), runtime.InMemoryCartStore)
+    assert isinstance(build(f"sqlite:///{tmp_path / 'c.db'}"), runtime.SqliteCartStore)
+    with pytest.raises(runtime.CartError, match="Unsupported"):
+        build("mysql://localhost/shop")
+    with pytest.raises(runtime.CartError, match="database file"):
+        build("sqlite:///:memory:")
+    service = runtime.CartService(
+        {
+            "defaults": {
+                "store_url": f"sqlite:///{tmp_path / 'd.db'}",
+                "abandoned_cart_ttl_seconds": 5,
+            }
+        }
+    )
+    assert service._store.ttl_seconds == 5
+
+
+@pytest.mark.slow
+def test_benchmark_mutations_on_a_200_line_cart(generated_modules) -> None:
+    runtime = generated_modules["runtime"]
+    service = _service(runtime)
+    lines, rounds = 200, 2_000
+
+    started = time.perf_counter()
+    for index in range(lines):
+        service.add_item("b2b", sku=f"sku-{index}", name="Part", quantity=3, unit_price="12.34")
+    build_ms = (time.perf_counter() - started) * 1_000
+    started = time.perf_counter()
+    for step in range(rounds):
+        service.update_item("b2b", sku=f"sku-{step % lines}", quantity=1 + step % 7)
+    update_us = (time.perf_counter() - started) / rounds * 1_000_000
+    started = time.perf_counter()
+    for step in range(rounds):
+        service.add_item("b2b", sku=f"sku-{step % lines}", name="Part", unit_price="12.34")
+    add_us = (time.perf_counter() - started) / rounds * 1_000_000
+
+    print(
+        f"build {lines} lines {build_ms:.1f} ms; update_item {update_us:.0f} us/op; "
+        f"add_item on an existing line {add_us:.0f} us/op"
+    )
+    snapshot = service.get_cart("b2b")
+    assert len(snapshot.items) == lines
+    assert snapshot.totals == service._recalculate(snapshot.evolve()).totals
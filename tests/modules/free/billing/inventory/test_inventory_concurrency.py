@@ -0,0 +1,236 @@
+"""Striped SKU locking, atomic multi-SKU reservations, running totals and expiry heap."""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+
+def _recount(service) -> dict[str, object]:  # type: ignore[no-untyped-def]
+    items = list(service.list_items().values())
+    threshold = service.config.low_stock_threshold
+    return {
+        "total_skus": len(items),
+        "total_on_hand": sum(max(item.quantity, 0) for item in items),
+        "total_reserved": sum(max(item.reserved, 0) for item in items),
+        "low_stock_items": sum(1 for item in items if item.available <= threshold),
+        "backorder_skus": sum(1 for item in items if item.available < 0),
+        "currency": service.config.default_currency,
+    }
+
+
+def test_contended_sku_never_oversells(inventory_service, vendor_inventory_module) -> None:
+    reservation_error = vendor_inventory_module.InventoryReservationError
+    inventory_service.upsert_item(sku="hot", name="Flash sale", quantity=20, price="5")
+    barrier = threading.Barrier(16)
+
+    def buy(index: int) -> bool:
+        if index < 16:
+            barrier.wait()
+        try:
+            inventory_service.reserve_stock(sku="hot", quantity=1, reference=f"order-{index}")
+        except reservation_error:
+            return False
+        return True
+
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        assert sum(pool.map(buy, range(64))) == 20
+
+    assert inventory_service.get_item("hot").reserved == 20
+    assert inventory_service.get_metrics() == _recount(inventory_service)
+
+
+def test_disjoint_skus_reserve_and_release_concurrently(inventory_service) -> None:
+    for index in range(32):
+        inventory_service.upsert_item(sku=f"sku-{index}", name="Item", quantity=100, price="1")
+
+    def worker(index: int) -> None:
+        sku = f"sku-{index % 32}"
+        for round_ in range(20):
+            reference = f"{index}-{round_}"
+            inventory_service.reserve_stock(sku=sku, quantity=1, reference=reference)
+            if round_ % 2:
+                inventory_service.release_reservation(reference, commit=round_ % 4 == 1)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(worker, range(64)))
+
+    items = inventory_service.list_items()
+    assert {item.reserved for item in items.values()} == {20}
+    assert {item.quantity for item in items.values()} == {90}
+    assert inventory_service.get_metrics() == _recount(inventory_service)
+
+
+def test_multi_sku_reservations_are_atomic(inventory_service, vendor_inventory_module) -> None:
+    reservation_error = vendor_inventory_module.InventoryReservationError
+    inventory_service.upsert_item(sku="a", name="A", quantity=3, price="1")
+    inventory_service.upsert_item(sku="b", name="B", quantity=1, price="1")
+
+    with pytest.raises(reservation_error, match="Insufficient"):
+        inventory_service.reserve_many(
+            [
+                {"sku": "a", "quantity": 2, "reference": "cart-a"},
+                {"sku": "b", "quantity": 2, "reference": "cart-b"},
+            ]
+        )
+    with pytest.raises(reservation_error, match="unique"):
+        inventory_service.reserve_many(
+            [
+                {"sku": "a", "quantity": 1, "reference": "dup"},
+                {"sku": "b", "quantity": 1, "reference": "dup"},
+            ]
+        )
+    assert inventory_service.snapshot().reservations == {}
+    assert inventory_service.get_item("a").reserved == 0
+
+    reservations = inventory_service.reserve_many(
+        [
+            {"sku": "a", "quantity": 1, "reference": "l1"},
+            {"sku": "a", "quantity": 2, "reference": "l2"},
+            {"sku": "b", "quantity": 1, "reference": "l3", "metadata": {"gift": True}},
+        ]
+    )
+    assert [reservation.reference for reservation in reservations] == ["l1", "l2", "l3"]
+    assert reservations[2].metadata == {"gift": True}
+    assert inventory_service.get_item("a").available == 0
+
+
+def test_opposite_order_batches_do_not_deadlock(vendor_inventory_module) -> None:
+    service = vendor_inventory_module.InventoryService(lock_stripes=4)
+    skus = [f"sku-{index}" for index in range(8)]
+    for sku in skus:
+        service.upsert_item(sku=sku, name=sku, quantity=10_000, price="1")
+
+    def worker(index: int) -> None:
+        order = skus if index % 2 else list(reversed(skus))
+        for round_ in range(50):
+            lines = [
+                {"sku": sku, "quantity": 1, "reference": f"{index}-{round_}-{sku}"} for sku in order
+            ]
+            for reservation in service.reserve_many(lines):
+                service.release_reservation(reservation.reference)
+
+    threads = [threading.Thread(target=worker, args=(index,), daemon=True) for index in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=30)
+    assert not any(thread.is_alive() for thread in threads)
+    assert service.get_metrics()["total_reserved"] == 0
+
+
+def test_expired_reservations_are_popped_from_the_heap(vendor_inventory_module) -> None:
+    clock = {"now": datetime(2026, 1, 1, tzinfo=timezone.utc)}
+    service = vendor_inventory_module.InventoryService(clock=lambda: clock["now"])
+    service.upsert_item(sku="sku", name="Item", quantity=1000, price="1")
+
+    for index in range(300):
+        reference = f"r-{index}"
+        service.reserve_stock(sku="sku", quantity=1, reference=reference, ttl_minutes=5)
+        if index % 3 == 0:
+            service.release_reservation(reference)
+    service.reserve_stock(sku="sku", quantity=1, reference="forever", ttl_minutes=0)
+
+    clock["now"] += timedelta(minutes=5)
+    service.reserve_stock(sku="sku", quantity=1, reference="late", ttl_minutes=5)
+
+    assert set(service.snapshot().reservations) == {"forever", "late"}
+    assert service.get_item("sku").reserved == 2
+    assert len(service._expiry) <= 64 + 2 * len(service._expiring)
+    assert service.purge_expired_reservations() == 0
+
+
+def test_purge_failures_stay_out_of_unrelated_reservations(vendor_inventory_module) -> None:
+    clock = {"now": datetime(2026, 1, 1, tzinfo=timezone.utc)}
+    service = vendor_inventory_module.InventoryService(clock=lambda: clock["now"])
+    for sku in ("gone", "keep", "other"):
+        service.upsert_item(sku=sku, name=sku, quantity=10, price="1")
+    service.reserve_stock(sku="gone", quantity=1, reference="a", ttl_minutes=5)
+    service.reserve_stock(sku="keep", quantity=2, reference="b", ttl_minutes=5)
+    service.reserve_stock(sku="keep", quantity=3, reference="c", ttl_minutes=5)
+    service.remove_item("gone")
+
+    release = service.release_reservation
+    failures = {"c": 1}
+
+    def flaky_release(reference: str, *, commit: bool = False):  # type: ignore[no-untyped-def]
+        if failures.get(reference):
+            failures[reference] -= 1
+            raise RuntimeError("store hiccup")
+        return release(reference, commit=commit)
+
+    service.release_reservation = flaky_release
+    clock["now"] += timedelta(minutes=5)
+    service.reserve_stock(sku="other", quantity=1, reference="d", ttl_minutes=5)
+
+    assert set(service.snapshot().reservations) == {"c", "d"}
+    assert service.get_item("keep").reserved == 3
+    assert service.purge_expired_reservations() == 1  # "c" was pushed back for a retry
+    assert set(service.snapshot().reservations) == {"d"}
+    assert service.get_item("keep").reserved == 0
+    assert service.purge_expired_reservations() == 0
+
+
+def test_running_totals_match_a_full_recount(inventory_service, vendor_inventory_module) -> None:
+    rng = random.Random(7)
+    for step in range(400):
+        sku = f"sku-{rng.randrange(20)}"
+        action = rng.random()
+        try:
+            if action < 0.4:
+                inventory_service.upsert_item(
+                    sku=sku, name=sku, quantity=rng.randrange(12), price="2"
+                )
+            elif action < 0.7:
+                inventory_service.adjust_stock(sku=sku, delta=rng.choice((-1, 1, 3)))
+            elif action < 0.9:
+                inventory_service.reserve_stock(sku=sku, quantity=1, reference=f"r-{step}")
+            else:
+                inventory_service.remove_item(sku)
+        except vendor_inventory_module.InventoryError:
+            pass  # rejected mutations must leave the totals untouched
+    assert inventory_service.get_metrics() == _recount(inventory_service)
+
+    inventory_service.config.low_stock_threshold = 0
+    assert inventory_service.get_metrics() == _recount(inventory_service)
+
+
+@pytest.mark.slow
+def test_benchmark_disjoint_sku_reservations(vendor_inventory_module) -> None:
+    service = vendor_inventory_module.InventoryService()
+    skus = [f"sku-{index}" for index in range(256)]
+    for sku in skus:
+        service.upsert_item(sku=sku, name=sku, quantity=1_000, price="1")
+    threads, per_thread = 8, 1_000
+    barrier = threading.Barrier(threads + 1)
+
+    def worker(index: int) -> None:
+        own = skus[index::threads]  # each thread works on its own SKUs
+        barrier.wait()
+        for round_ in range(per_thread):
+            sku = own[round_ % len(own)]
+            service.reserve_stock(sku=sku, quantity=1, reference=f"{index}-{round_}")
+
+    pool = [threading.Thread(target=worker, args=(index,)) for index in range(threads)]
+    for thread in pool:
+        thread.start()
+    barrier.wait()
+    started = time.perf_counter()
+    for thread in pool:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    metrics_started = time.perf_counter()
+    metrics = service.get_metrics()
+    metrics_us = (time.perf_counter() - metrics_started) * 1_000_000
+    reservations = threads * per_thread
+    print(
+        f"{reservations / elapsed:,.0f} reservations/s across {threads} threads; "
+        f"get_metrics() {metrics_us:.0f} us"
+    )
+    assert metrics["total_reserved"] == reservations
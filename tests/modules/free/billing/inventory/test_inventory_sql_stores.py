@@ -0,0 +1,149 @@
+"""Durable SQL stores: versioned rows, conditional reservations and shared workers."""
+
+from __future__ import annotations
+
+import importlib.util
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture()
+def db_url(tmp_path: Path) -> str:
+    return f"sqlite:///{tmp_path / 'inventory.db'}"
+
+
+def _worker(module, db_url: str, **kwargs):  # type: ignore[no-untyped-def]
+    # Each worker owns its own store object, as separate processes would.
+    return module.InventoryService(
+        {"defaults": {"store_url": db_url, "low_stock_threshold": 2}}, **kwargs
+    )
+
+
+def test_stock_survives_a_restart(vendor_inventory_module, db_url: str) -> None:
+    first = _worker(vendor_inventory_module, db_url)
+    first.upsert_item(
+        sku="sku-1", name="Widget", quantity=5, price="9.99", metadata={"color": "red"}
+    )
+    first.reserve_stock(sku="sku-1", quantity=2, reference="order-1", metadata={"cart": 7})
+
+    restarted = _worker(vendor_inventory_module, db_url)
+    item = restarted.get_item("sku-1")
+    reservation = restarted.snapshot().reservations["order-1"]
+
+    assert isinstance(restarted._store, vendor_inventory_module.SqliteInventoryStore)
+    assert (item.quantity, item.reserved, str(item.price), item.metadata) == (
+        5,
+        2,
+        "9.99",
+        {"color": "red"},
+    )
+    assert reservation.metadata == {"cart": 7}
+    restarted.release_reservation("order-1", commit=True)
+    assert (first.get_item("sku-1").quantity, first.get_item("sku-1").reserved) == (3, 0)
+
+
+def test_workers_never_oversell_a_shared_sku(vendor_inventory_module, db_url: str) -> None:
+    reservation_error = vendor_inventory_module.InventoryReservationError
+    workers = [_worker(vendor_inventory_module, db_url) for _ in range(4)]
+    workers[0].upsert_item(sku="hot", name="Flash sale", quantity=25, price="5")
+    barrier = threading.Barrier(8)
+
+    def buy(index: int) -> bool:
+        if index < 8:
+            barrier.wait()
+        try:
+            workers[index % 4].reserve_stock(sku="hot", quantity=1, reference=f"order-{index}")
+        except reservation_error:
+            return False
+        return True
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        assert sum(pool.map(buy, range(60))) == 25
+
+    assert workers[3].get_item("hot").reserved == 25
+    assert len(workers[2].snapshot().reservations) == 25
+
+
+def test_batch_reservation_is_one_transaction(vendor_inventory_module, db_url: str) -> None:
+    service = _worker(vendor_inventory_module, db_url)
+    service.upsert_item(sku="a", name="A", quantity=3, price="1")
+    service.upsert_item(sku="b", name="B", quantity=1, price="1")
+    service.reserve_stock(sku="b", quantity=1, reference="taken")
+
+    with pytest.raises(vendor_inventory_module.InventoryReservationError, match="Insufficient"):
+        service.reserve_many(
+            [
+                {"sku": "a", "quantity": 2, "reference": "cart-a"},
+                {"sku": "b", "quantity": 1, "reference": "cart-b"},
+            ]
+        )
+    with pytest.raises(vendor_inventory_module.InventoryReservationError, match="already exists"):
+        service.reserve_stock(sku="a", quantity=1, reference="taken")
+    with pytest.raises(vendor_inventory_module.InventoryNotFoundError):
+        service.reserve_stock(sku="missing", quantity=1, reference="ghost")
+
+    assert set(service.snapshot().reservations) == {"taken"}
+    assert service.get_item("a").reserved == 0
+
+
+def test_item_writes_compare_and_swap_on_version(vendor_inventory_module, db_url: str) -> None:
+    service = _worker(vendor_inventory_module, db_url)
+    store = service._store
+    created = service.upsert_item(sku="sku", name="Item", quantity=10, price="1")
+    assert created.version == 1
+
+    stale = store.get_item("sku")
+    service.adjust_stock(sku="sku", delta=5)
+    assert (
+        store.compare_and_set_item(stale.clone(quantity=0), expected_version=stale.version) is False
+    )
+    assert store.compare_and_set_item(stale, expected_version=0) is False
+
+    def bump(_: int) -> None:
+        service.adjust_stock(sku="sku", delta=1)
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(pool.map(bump, range(40)))
+    item = service.get_item("sku")
+    assert (item.quantity, item.version) == (55, 42)
+
+
+def test_expiry_and_metrics_come_from_the_database(vendor_inventory_module, db_url: str) -> None:
+    clock = {"now": datetime(2026, 1, 1, tzinfo=timezone.utc)}
+    service = _worker(vendor_inventory_module, db_url, clock=lambda: clock["now"])
+    for index in range(5):
+        service.upsert_item(sku=f"sku-{index}", name="Item", quantity=index, price="1")
+    service.reserve_stock(sku="sku-4", quantity=3, reference="short", ttl_minutes=5)
+    service.reserve_stock(sku="sku-3", quantity=1, reference="long", ttl_minutes=60)
+
+    clock["now"] += timedelta(minutes=10)
+    other = _worker(vendor_inventory_module, db_url, clock=lambda: clock["now"])
+
+    assert other.purge_expired_reservations() == 1
+    assert set(service.snapshot().reservations) == {"long"}
+    assert service.get_metrics() == {
+        "total_skus": 5,
+        "total_on_hand": 10,
+        "total_reserved": 1,
+        "low_stock_items": 4,
+        "backorder_skus": 0,
+        "currency": "USD",
+    }
+
+
+def test_store_urls_select_the_backend(vendor_inventory_module, db_url: str) -> None:
+    build = vendor_inventory_module.build_inventory_store
+
+    assert isinstance(build(None), vendor_inventory_module.InMemoryInventoryStore)
+    assert isinstance(build(db_url), vendor_inventory_module.SqliteInventoryStore)
+    with pytest.raises(vendor_inventory_module.InventoryError, match="Unsupported"):
+        build("mysql://localhost/shop")
+    with pytest.raises(vendor_inventory_module.InventoryError, match="database file"):
+        build("sqlite:///:memory:")
+    if importlib.util.find_spec("psycopg") is None:
+        with pytest.raises(vendor_inventory_module.InventoryError, match="psycopg"):
+            build("postgresql://localhost/shop")
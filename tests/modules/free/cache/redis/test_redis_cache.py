@@ -0,0 +1,239 @@
+"""Two-tier cache: L1 LRU, single-flight fills, early refresh and codecs."""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import sys
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+import pytest
+
+from modules.free.cache.redis.generate import RedisModuleGenerator
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture(scope="module")
+def vendor_root(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    generator = RedisModuleGenerator()
+    target = tmp_path_factory.mktemp("redis_cache")
+    config = generator.load_module_config()
+    context = generator.apply_base_context_overrides(generator.build_base_context(config))
+    generator.generate_vendor_files(config, target, generator.create_renderer(), context)
+    return next(target.glob(".rapidkit/vendor/*/*/src/modules/free/cache/redis"))
+
+
+@pytest.fixture(scope="module")
+def cache_module(vendor_root: Path) -> ModuleType:
+    path = vendor_root / "cache.py"
+    spec = importlib.util.spec_from_file_location("rapidkit_test_redis_cache", path)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module  # dataclasses resolve annotations through sys.modules
+    spec.loader.exec_module(module)
+    return module
+
+
+def _cache(module: ModuleType, clock: _Clock, **options: Any) -> Any:
+    return module.TwoTierCache(module.MemoryBackend(clock), clock=clock, **options)
+
+
+def test_concurrent_misses_share_one_computation(cache_module: ModuleType) -> None:
+    cache = _cache(cache_module, _Clock())
+    calls: list[int] = []
+
+    async def load() -> dict[str, int]:
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return {"answer": 42}
+
+    async def exercise() -> list[Any]:
+        return await asyncio.gather(*(cache.get_or_compute("k", load) for _ in range(20)))
+
+    results = asyncio.run(exercise())
+
+    assert calls == [1]
+    assert all(result == {"answer": 42} for result in results)
+    assert cache.stats.coalesced == 19
+    assert asyncio.run(cache.get("k")) == {"answer": 42}
+    assert cache.stats.l1_hits == 1
+
+
+def test_l1_is_bounded_and_falls_back_to_l2(cache_module: ModuleType) -> None:
+    clock = _Clock()
+    cache = _cache(cache_module, clock, l1_max_entries=2, codec="pickle")
+
+    async def exercise() -> Any:
+        for name in ("a", "b", "c"):
+            await cache.set(name, {name})
+        return await cache.get("a")
+
+    assert asyncio.run(exercise()) == {"a"}
+    assert len(cache._l1) == 2
+    assert cache.stats.l2_hits == 1  # "a" was evicted from L1 and read back from L2
+
+    clock.now += 3_601
+    assert asyncio.run(cache.get("a", "gone")) == "gone"
+
+
+def test_undecodable_l2_values_are_misses_and_dropped(cache_module: ModuleType) -> None:
+    clock = _Clock()
+    backend = cache_module.MemoryBackend(clock)
+    cache = cache_module.TwoTierCache(backend, clock=clock)
+    header = cache_module._HEADER.pack(clock.now + 60, 0.0)
+
+    async def exercise() -> list[Any]:
+        results = []
+        for payload in (b"legacy", header + b"{not json"):
+            await backend.set("cache:k", payload, 60)
+            results.append(await cache.get("k", "miss"))
+            results.append(await backend.get("cache:k"))
+        results.append(await cache.get_or_compute("k", lambda: "fresh"))
+        return results
+
+    assert asyncio.run(exercise()) == ["miss", None, "miss", None, "fresh"]
+    assert cache.stats.l2_corrupt == 2
+
+
+def test_early_refresh_recomputes_before_expiry(cache_module: ModuleType) -> None:
+    clock = _Clock()
+    cache = _cache(cache_module, clock, beta=1.0)
+    version = {"n": 0}
+
+    def load() -> int:
+        version["n"] += 1
+        return version["n"]
+
+    async def exercise() -> list[int]:
+        await cache.get_or_compute("k", load, ttl=10)
+        await cache.set("k", 1, ttl=10, delta=5.0)  # expensive value: refresh early
+        clock.now += 9.99
+        return [await cache.get_or_compute("k", load, ttl=10) for _ in range(50)]
+
+    values = asyncio.run(exercise())
+
+    assert values[-1] == 2
+    assert cache.stats.early_refreshes == 1
+    assert version["n"] == 2
+
+
+def test_failed_early_refresh_serves_the_cached_value(cache_module: ModuleType) -> None:
+    clock = _Clock()
+    cache = _cache(cache_module, clock, beta=1.0)
+
+    def boom() -> int:
+        raise ValueError("backend down")
+
+    async def exercise() -> list[int]:
+        await cache.set("k", 1, ttl=10, delta=5.0)
+        clock.now += 9.99
+        return [await cache.get_or_compute("k", boom, ttl=10) for _ in range(20)]
+
+    assert asyncio.run(exercise()) == [1] * 20
+    assert cache.stats.early_refreshes >= 1
+
+
+def test_delete_survives_an_l2_outage(cache_module: ModuleType) -> None:
+    clock = _Clock()
+
+    class _Down(cache_module.MemoryBackend):  # type: ignore[name-defined,misc]
+        async def delete(self, *keys: str) -> None:
+            raise ConnectionError("redis down")
+
+    cache = cache_module.TwoTierCache(_Down(clock), clock=clock)
+
+    @cache.cached(ttl=30)
+    async def lookup(user_id: int) -> int:
+        return user_id
+
+    async def exercise() -> Any:
+        await cache.set("k", "v")
+        await cache.delete("k")
+        await lookup(1)
+        await lookup.invalidate(1)
+        return cache._l1.get(cache._key("k"))
+
+    assert asyncio.run(exercise()) is None
+    assert cache.stats.l2_errors == 2
+
+
+def test_failures_reach_every_waiter_and_are_not_cached(cache_module: ModuleType) -> None:
+    cache = _cache(cache_module, _Clock())
+
+    async def boom() -> None:
+        await asyncio.sleep(0.01)
+        raise ValueError("backend down")
+
+    async def exercise() -> list[Any]:
+        return await asyncio.gather(
+            *(cache.get_or_compute("k", boom) for _ in range(3)), return_exceptions=True
+        )
+
+    results = asyncio.run(exercise())
+
+    assert all(isinstance(result, ValueError) for result in results)
+    assert asyncio.run(cache.get_or_compute("k", lambda: "ok")) == "ok"
+
+
+def test_cached_decorator_uses_shared_cache(cache_module: ModuleType) -> None:
+    clock = _Clock()
+    cache_module.set_cache(_cache(cache_module, clock, namespace="svc"))
+    calls: list[tuple[int, str]] = []
+
+    @cache_module.cached(ttl=30)
+    async def profile(user_id: int, *, locale: str = "en") -> dict[str, Any]:
+        calls.append((user_id, locale))
+        return {"id": user_id, "locale": locale}
+
+    async def exercise() -> None:
+        await profile(1)
+        await profile(1)
+        await profile(1, locale="fr")
+        await profile.invalidate(1)
+        await profile(1)
+
+    try:
+        asyncio.run(exercise())
+    finally:
+        cache_module.set_cache(None)
+
+    assert calls == [(1, "en"), (1, "fr"), (1, "en")]
+    with pytest.raises(TypeError):
+        cache_module.cached()(lambda: None)
+
+
+def test_codecs_round_trip_and_unknown_names_fail(cache_module: ModuleType) -> None:
+    value = {"id": 7, "tags": ["a", "b"]}
+    for name in ("json", "pickle"):
+        codec = cache_module.get_codec(name)
+        assert codec.decode(codec.encode(value)) == value
+    with pytest.raises(ValueError, match="Unknown cache codec"):
+        cache_module.get_codec("yaml")
+
+
+def test_settings_come_from_the_client_helper(
+    cache_module: ModuleType, vendor_root: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    spec = importlib.util.spec_from_file_location(
+        cache_module._CLIENT_MODULE, vendor_root / "client.py"
+    )
+    assert spec is not None and spec.loader is not None
+    client = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(client)
+    monkeypatch.setitem(sys.modules, cache_module._CLIENT_MODULE, client)
+    monkeypatch.setenv("REDIS_CACHE_NAMESPACE", "tenant")
+
+    settings = cache_module._cache_settings()
+
+    assert settings["cache_namespace"] == "tenant"
+    assert settings["cache_ttl"] == client.DEFAULTS["cache_ttl"]
+    assert set(settings) == set(cache_module._FALLBACK_SETTINGS)
@@ -0,0 +1,196 @@
+"""Near cache: tracking invalidations, read races, bounds and the TTL fallback."""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import sys
+from types import ModuleType
+from typing import Any
+
+import pytest
+
+from modules.free.cache.redis.generate import RedisModuleGenerator
+
+
+@pytest.fixture(scope="module")
+def near_cache(tmp_path_factory: pytest.TempPathFactory) -> ModuleType:
+    generator = RedisModuleGenerator()
+    target = tmp_path_factory.mktemp("redis_near_cache")
+    config = generator.load_module_config()
+    context = generator.apply_base_context_overrides(generator.build_base_context(config))
+    generator.generate_vendor_files(config, target, generator.create_renderer(), context)
+    path = next(target.glob(".rapidkit/vendor/*/*/src/modules/free/cache/redis/near_cache.py"))
+    spec = importlib.util.spec_from_file_location("rapidkit_test_redis_near_cache", path)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module  # dataclasses resolve annotations through sys.modules
+    spec.loader.exec_module(module)
+    return module
+
+
+class _Connection:
+    async def send_command(self, *args: Any) -> None:
+        return None
+
+    async def read_response(self) -> int:
+        return 7
+
+
+class _PubSub:
+    def __init__(self) -> None:
+        self.connection = _Connection()
+        self.queue: asyncio.Queue[Any] = asyncio.Queue()
+        self.channels: list[str] = []
+        self.fail = False
+
+    async def connect(self) -> None:
+        return None
+
+    async def subscribe(self, channel: str) -> None:
+        self.channels.append(channel)
+
+    async def get_message(self, ignore_subscribe_messages: bool, timeout: float) -> Any:
+        if self.fail:
+            raise ConnectionError("connection reset")
+        try:
+            item = await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+    async def aclose(self) -> None:
+        return None
+
+
+class _TrackingRedis:
+    """Just enough of redis.asyncio.Redis to exercise the tracking path."""
+
+    def __init__(self) -> None:
+        self.data: dict[str, str] = {}
+        self.reads = 0
+        self.tracking: list[dict[str, Any]] = []
+        self.pubsubs: list[_PubSub] = []
+        self.gate: asyncio.Event | None = None
+
+    def pubsub(self) -> _PubSub:
+        self.pubsubs.append(_PubSub())
+        return self.pubsubs[-1]
+
+    def client(self) -> "_TrackingRedis":
+        return self
+
+    async def client_tracking_on(self, **options: Any) -> bool:
+        self.tracking.append(options)
+        return True
+
+    async def get(self, key: str) -> Any:
+        self.reads += 1
+        if self.gate is not None:
+            await self.gate.wait()
+        return self.data.get(key)
+
+    async def mget(self, keys: list[str]) -> list[Any]:
+        self.reads += 1
+        return [self.data.get(key) for key in keys]
+
+    async def aclose(self) -> None:
+        return None
+
+    async def write(self, key: str, value: str) -> None:
+        self.data[key] = value
+        await self.pubsubs[-1].queue.put({"type": "message", "data": [key]})
+        await asyncio.sleep(0.01)  # let the listener drain the channel
+
+
+def test_tracking_invalidations_keep_local_copies_fresh(near_cache: ModuleType) -> None:
+    redis = _TrackingRedis()
+    redis.data.update({"flag:a": "on", "flag:b": "off"})
+    cache = near_cache.NearCache(redis, max_entries=2)
+
+    async def exercise() -> list[Any]:
+        await cache.start()
+        seen = [await cache.get("flag:a"), await cache.get("flag:a")]
+        await redis.write("flag:a", "off")
+        seen.append(await cache.get("flag:a"))
+        seen.append(await cache.mget(["flag:a", "flag:b", "flag:missing"]))
+        seen.append(await cache.get("flag:missing"))  # negative answers are cached too
+        await cache.close()
+        return seen
+
+    seen = asyncio.run(exercise())
+
+    assert seen == ["on", "on", "off", ["off", "off", None], None]
+    assert redis.tracking == [{"clientid": 7, "prefix": [], "bcast": False}]
+    assert redis.pubsubs[0].channels == [near_cache.INVALIDATION_CHANNEL]
+    assert redis.reads == 3
+    stats = cache.stats.as_dict()
+    assert stats["invalidations"] == 1
+    assert stats["evictions"] == 1  # max_entries=2 with three keys read
+    assert (stats["hits"], stats["misses"]) == (3, 4)
+
+
+def test_invalidation_during_a_read_is_not_cached(near_cache: ModuleType) -> None:
+    redis = _TrackingRedis()
+    redis.data["tenant:1"] = "v1"
+    cache = near_cache.NearCache(redis, prefixes=["tenant:"])
+
+    async def exercise() -> Any:
+        await cache.start()
+        redis.gate = asyncio.Event()
+        pending = asyncio.ensure_future(cache.get("tenant:1"))
+        await asyncio.sleep(0)
+        cache.invalidate("tenant:1")  # the value in flight is already stale
+        redis.gate.set()
+        first = await pending
+        redis.gate = None
+        second = await cache.get("tenant:1")
+        await cache.close()
+        return first, second
+
+    assert asyncio.run(exercise()) == ("v1", "v1")
+    assert redis.tracking[0]["bcast"] is True
+    assert cache.stats.discarded == 1
+    assert cache.stats.misses == 2
+
+
+def test_lost_channel_degrades_to_ttl_and_recovers(near_cache: ModuleType) -> None:
+    redis = _TrackingRedis()
+    redis.data["k"] = "v"
+    cache = near_cache.NearCache(redis, retry_interval=0.05)
+
+    async def exercise() -> list[str]:
+        await cache.start()
+        await cache.get("k")
+        await redis.pubsubs[-1].queue.put(ConnectionError("connection reset"))
+        await asyncio.sleep(0.01)
+        modes = [cache.mode, str(len(cache._entries))]
+        await asyncio.sleep(0.15)
+        modes.append(cache.mode)
+        await cache.close()
+        return modes
+
+    assert asyncio.run(exercise()) == ["ttl", "0", "tracking"]
+    assert len(redis.tracking) == 2
+
+
+def test_servers_without_tracking_fall_back_to_ttls(near_cache: ModuleType) -> None:
+    fakeredis = pytest.importorskip("fakeredis")
+    clock = {"now": 100.0}
+    redis = fakeredis.FakeAsyncRedis(decode_responses=True)
+    cache = near_cache.NearCache(redis, fallback_ttl=5, clock=lambda: clock["now"])
+
+    async def exercise() -> list[Any]:
+        await redis.set("cfg", "1")
+        seen = [await cache.get("cfg")]
+        await redis.set("cfg", "2")
+        seen.append(await cache.get("cfg"))  # no invalidations: served until the TTL
+        clock["now"] += 5
+        seen.append(await cache.get("cfg"))
+        await cache.close()
+        return seen
+
+    assert asyncio.run(exercise()) == ["1", "1", "2"]
+    assert cache.describe()["stats"]["hit_rate"] == pytest.approx(1 / 3, abs=1e-4)
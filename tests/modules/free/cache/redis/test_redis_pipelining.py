@@ -0,0 +1,135 @@
+"""Auto-pipelining: per-tick coalescing, explicit batches and batch-size metrics."""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import sys
+from types import ModuleType
+from typing import Any
+
+import pytest
+
+from modules.free.cache.redis.generate import RedisModuleGenerator
+
+fakeredis = pytest.importorskip("fakeredis")
+
+
+@pytest.fixture(scope="module")
+def pipelining(tmp_path_factory: pytest.TempPathFactory) -> ModuleType:
+    generator = RedisModuleGenerator()
+    target = tmp_path_factory.mktemp("redis_pipelining")
+    config = generator.load_module_config()
+    context = generator.apply_base_context_overrides(generator.build_base_context(config))
+    generator.generate_vendor_files(config, target, generator.create_renderer(), context)
+    path = next(target.glob(".rapidkit/vendor/*/*/src/modules/free/cache/redis/pipelining.py"))
+    spec = importlib.util.spec_from_file_location("rapidkit_test_redis_pipelining", path)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module  # dataclasses resolve annotations through sys.modules
+    spec.loader.exec_module(module)
+    return module
+
+
+class _CountingRedis(fakeredis.FakeAsyncRedis):
+    """Counts round trips: one per direct command or pipeline execution."""
+
+    round_trips = 0
+
+    async def execute_command(self, *args: Any, **options: Any) -> Any:
+        type(self).round_trips += 1
+        return await super().execute_command(*args, **options)
+
+    def pipeline(self, transaction: bool = True, shard_hint: Any = None) -> Any:
+        pipe = super().pipeline(transaction=transaction, shard_hint=shard_hint)
+        execute = pipe.execute
+
+        async def counted(raise_on_error: bool = True) -> Any:
+            type(self).round_trips += 1
+            return await execute(raise_on_error=raise_on_error)
+
+        pipe.execute = counted
+        return pipe
+
+
+@pytest.fixture()
+def redis() -> Any:
+    _CountingRedis.round_trips = 0
+    return _CountingRedis(decode_responses=True)
+
+
+def test_commands_in_one_tick_share_a_round_trip(pipelining: ModuleType, redis: Any) -> None:
+    auto = pipelining.AutoPipeline(redis)
+
+    async def exercise() -> list[Any]:
+        await redis.mset({f"user:{i}": f"name-{i}" for i in range(20)})
+        before = _CountingRedis.round_trips
+        results = await asyncio.gather(
+            *(auto.get(f"user:{i}") for i in range(20)),
+            auto.incr("views"),
+            auto.incr("views"),
+        )
+        return [_CountingRedis.round_trips - before, *results]
+
+    round_trips, *results = asyncio.run(exercise())
+
+    assert round_trips == 1
+    assert results == [f"name-{i}" for i in range(20)] + [1, 2]
+    stats = auto.stats.as_dict()
+    assert stats["flushes"] == 1 and stats["commands"] == 22
+    assert stats["max_batch_size"] == 22 and stats["batch_sizes"]["le_32"] == 1
+
+
+def test_errors_reach_only_the_failing_command(pipelining: ModuleType, redis: Any) -> None:
+    auto = pipelining.AutoPipeline(redis)
+
+    async def exercise() -> list[Any]:
+        await redis.set("text", "abc")
+        return await asyncio.gather(
+            auto.incr("text"), auto.get("text"), auto.set("n", 1), return_exceptions=True
+        )
+
+    failed, text, stored = asyncio.run(exercise())
+
+    assert isinstance(failed, Exception)
+    assert (text, stored) == ("abc", True)
+
+
+def test_max_batch_splits_large_ticks(pipelining: ModuleType, redis: Any) -> None:
+    auto = pipelining.AutoPipeline(redis, max_batch=4)
+
+    async def exercise() -> list[Any]:
+        return await asyncio.gather(*(auto.incr("counter") for _ in range(10)))
+
+    assert sorted(asyncio.run(exercise())) == list(range(1, 11))
+    assert auto.stats.flushes == 3
+    assert auto.stats.last_batch_size == 2
+
+
+def test_batch_block_sends_one_pipeline(pipelining: ModuleType, redis: Any) -> None:
+    auto = pipelining.AutoPipeline(redis)
+
+    async def exercise() -> tuple[Any, ...]:
+        async with auto.batch() as batch:
+            first = batch.hset("user:1", mapping={"name": "ada"})
+            views = batch.incrby("views", 5)
+            profile = batch.hgetall("user:1")
+            assert not views.done()
+        with pytest.raises(RuntimeError):
+            async with auto.batch() as aborted:
+                dropped = aborted.incr("views")
+                raise RuntimeError("abort")
+        return first.result(), views.result(), profile.result(), dropped.cancelled()
+
+    assert asyncio.run(exercise()) == (1, 5, {"name": "ada"}, True)
+    assert _CountingRedis.round_trips == 1
+    assert auto.stats.as_dict()["mean_batch_size"] == 3.0
+
+
+def test_only_redis_commands_are_proxied(pipelining: ModuleType, redis: Any) -> None:
+    auto = pipelining.AutoPipeline(redis)
+
+    with pytest.raises(AttributeError):
+        auto.pubsub  # noqa: B018 - not a command
+    with pytest.raises(TypeError):
+        pipelining._CommandProxy()  # abstract: subclasses supply the client and the queue
@@ -0,0 +1,160 @@
+"""Bulk, cached resolution in the settings vendor CustomConfigSource."""
+
+from __future__ import annotations
+
+import gc
+import importlib.util
+import json
+import sys
+from importlib import import_module
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+import pytest
+
+from modules.shared.generator import TemplateRenderer
+
+generate_module = import_module("modules.free.essentials.settings.generate")
+
+FIELD_COUNT = 60
+
+
+def _load(path: Path, name: str) -> ModuleType:
+    spec = importlib.util.spec_from_file_location(name, path)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture()
+def vendor(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> tuple[ModuleType, ModuleType]:
+    config = generate_module.load_module_config()
+    context = generate_module.build_base_context(config)
+    renderer = TemplateRenderer(generate_module.MODULE_ROOT / "templates")
+    generate_module.generate_vendor_files(config, tmp_path, renderer, context)
+    base = next(tmp_path.glob(".rapidkit/vendor/*/*/src/modules/free/essentials/settings"))
+
+    sources = _load(base / "custom_sources.py", "rapidkit_test_custom_sources")
+    monkeypatch.setitem(sys.modules, "core.custom_sources", sources)
+    monkeypatch.setenv("HOT_RELOAD_ENABLED", "false")
+    monkeypatch.chdir(tmp_path)
+    settings = _load(base / "settings.py", "rapidkit_test_vendor_settings")
+    sources.clear_source_caches()
+    return sources, settings
+
+
+def _settings_class(settings: ModuleType, config_files: list[str]) -> Any:
+    fields = {f"FIELD_{idx}": (str | None, None) for idx in range(FIELD_COUNT)}
+    pydantic = import_module("pydantic")
+    model = pydantic.create_model("BulkSettings", __base__=settings.BaseSettings, **fields)
+    model.model_config = {**model.model_config, "config_files": config_files}
+    return model
+
+
+def test_yaml_is_parsed_once_per_build(vendor, tmp_path: Path, monkeypatch) -> None:
+    sources, settings = vendor
+    (tmp_path / "config.yaml").write_text(
+        "\n".join(f"FIELD_{idx}: yaml-{idx}" for idx in range(FIELD_COUNT)), encoding="utf-8"
+    )
+    pydantic_settings = import_module("pydantic_settings")
+    original = pydantic_settings.YamlConfigSettingsSource
+    parses: list[Path] = []
+
+    def _counting(settings_cls: Any, path: Path) -> Any:
+        parses.append(path)
+        return original(settings_cls, path)
+
+    monkeypatch.setattr(pydantic_settings, "YamlConfigSettingsSource", _counting)
+    model = _settings_class(settings, ["config.yaml"])
+
+    values = settings.CustomConfigSource(model)()
+    assert values["FIELD_59"] == "yaml-59"
+    assert len(values) == FIELD_COUNT
+    assert len(parses) == 1
+
+    settings.CustomConfigSource(model)()
+    assert len(parses) == 1  # unchanged file: parsed mapping reused
+
+
+def test_secret_entries_fetch_once_and_respect_ttl(vendor, tmp_path: Path, monkeypatch) -> None:
+    sources, settings = vendor
+    secrets_file = tmp_path / "secrets.json"
+    secrets_file.write_text(
+        json.dumps(
+            {
+                "app/config": {"FIELD_1": "vault-1", "FIELD_2": "vault-2"},
+                "app/aws": {"FIELD_2": "aws-2", "FIELD_3": "aws-3"},
+            }
+        ),
+        encoding="utf-8",
+    )
+    monkeypatch.setenv(sources.SECRETS_BACKEND_FILE_ENV, str(secrets_file))
+    monkeypatch.setenv("VAULT_URL", "http://vault.local")
+    monkeypatch.setenv("AWS_REGION", "eu-west-1")
+    reads: list[str] = []
+    original_read = sources.LocalSecretsBackend._secrets
+
+    def _counting(self: Any) -> Any:
+        reads.append(str(self.path))
+        return original_read(self)
+
+    monkeypatch.setattr(sources.LocalSecretsBackend, "_secrets", _counting)
+    model = _settings_class(settings, ["vault-bulk://app/config", "aws-sm-bulk://app/aws"])
+
+    values = settings.CustomConfigSource(model)()
+    assert values == {"FIELD_1": "vault-1", "FIELD_2": "vault-2", "FIELD_3": "aws-3"}
+    assert len(reads) == 2  # one read per secret, not per field
+
+    settings.CustomConfigSource(model)()
+    assert len(reads) == 2  # served from the TTL cache
+
+    monkeypatch.setenv(sources.SECRETS_CACHE_TTL_ENV, "0")
+    sources.clear_source_caches()
+    settings.CustomConfigSource(model)()
+    settings.CustomConfigSource(model)()
+    assert len(reads) == 6
+
+
+def test_path_less_vault_entry_keeps_per_field_lookup(vendor, tmp_path: Path, monkeypatch) -> None:
+    sources, settings = vendor
+    secrets_file = tmp_path / "secrets.json"
+    secrets_file.write_text(json.dumps({"FIELD_7": "per-field"}), encoding="utf-8")
+    monkeypatch.setenv(sources.SECRETS_BACKEND_FILE_ENV, str(secrets_file))
+    monkeypatch.setenv("VAULT_URL", "http://vault.local")
+    model = _settings_class(settings, ["vault://"])
+
+    assert settings.CustomConfigSource(model)() == {"FIELD_7": "per-field"}
+    assert sources.load_from_vault("http://vault.local", "FIELD_7") == "per-field"
+
+
+def test_vault_path_entry_still_resolves_one_secret_per_field(
+    vendor, tmp_path: Path, monkeypatch
+) -> None:
+    sources, settings = vendor
+    secrets_file = tmp_path / "secrets.json"
+    secrets_file.write_text(
+        json.dumps({"app/config": {"FIELD_1": "bulk"}, "FIELD_1": "single"}), encoding="utf-8"
+    )
+    monkeypatch.setenv(sources.SECRETS_BACKEND_FILE_ENV, str(secrets_file))
+    monkeypatch.setenv("VAULT_URL", "http://vault.local")
+
+    single = _settings_class(settings, ["vault://app/config"])
+    bulk = _settings_class(settings, ["vault-bulk://app/config"])
+
+    assert settings.CustomConfigSource(single)() == {"FIELD_1": "single"}
+    assert settings.CustomConfigSource(bulk)() == {"FIELD_1": "bulk"}
+
+
+def test_yaml_cache_is_scoped_to_live_settings_classes(vendor, tmp_path: Path) -> None:
+    sources, settings = vendor
+    (tmp_path / "config.yaml").write_text("FIELD_1: yaml-1\n", encoding="utf-8")
+
+    model = _settings_class(settings, ["config.yaml"])
+    assert settings.CustomConfigSource(model)() == {"FIELD_1": "yaml-1"}
+    assert model in sources._YAML_CACHE
+
+    del model
+    gc.collect()
+    assert len(sources._YAML_CACHE) == 0
@@ -0,0 +1,174 @@
+"""Hot reload coordinator: one watcher thread, debounced rebuilds, field diffs."""
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+import threading
+import time
+from importlib import import_module
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+import pytest
+
+from modules.shared.generator import TemplateRenderer
+
+generate_module = import_module("modules.free.essentials.settings.generate")
+
+
+def _load(path: Path, name: str) -> ModuleType:
+    spec = importlib.util.spec_from_file_location(name, path)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture()
+def vendor_base(tmp_path: Path) -> Path:
+    config = generate_module.load_module_config()
+    context = generate_module.build_base_context(config)
+    renderer = TemplateRenderer(generate_module.MODULE_ROOT / "templates")
+    generate_module.generate_vendor_files(config, tmp_path, renderer, context)
+    return next(tmp_path.glob(".rapidkit/vendor/*/*/src/modules/free/essentials/settings"))
+
+
+@pytest.fixture()
+def hot_reload(vendor_base: Path, monkeypatch: pytest.MonkeyPatch):
+    module = _load(vendor_base / "hot_reload.py", "rapidkit_test_hot_reload")
+    monkeypatch.setattr(module, "_watchfiles", None)  # exercise the stat watcher
+    yield module
+    module.stop_hot_reload()
+
+
+def _wait_for(predicate: Any, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+def _settings_class(env_file: Path) -> Any:
+    pydantic_settings = import_module("pydantic_settings")
+
+    class DemoSettings(pydantic_settings.BaseSettings):
+        model_config = pydantic_settings.SettingsConfigDict(env_file=str(env_file))
+
+        LOG_LEVEL: str = "INFO"
+        RATE_LIMIT: int = 10
+        CORS_ORIGINS: str = "*"
+
+    return DemoSettings
+
+
+def test_file_change_rebuilds_once_and_notifies_changed_fields(
+    hot_reload: ModuleType, tmp_path: Path
+) -> None:
+    env_file = tmp_path / ".env"
+    env_file.write_text("LOG_LEVEL=INFO\nRATE_LIMIT=10\n", encoding="utf-8")
+    cls = _settings_class(env_file)
+    builds: list[Any] = []
+
+    def _factory() -> Any:
+        builds.append(1)
+        return cls()
+
+    original = cls()
+    coordinator = hot_reload.ReloadCoordinator(
+        original, factory=_factory, poll_interval=0.05, debounce=0.1
+    )
+    log_events: list[dict[str, Any]] = []
+    cors_events: list[dict[str, Any]] = []
+    coordinator.subscribe(lambda _s, diff: log_events.append(diff), fields=["LOG_LEVEL"])
+    coordinator.subscribe(lambda _s, diff: cors_events.append(diff), fields=["CORS_ORIGINS"])
+    coordinator.start()
+    try:
+        # A burst of writes settles into a single rebuild.
+        for level in ("DEBUG", "WARNING", "ERROR"):
+            env_file.write_text(f"LOG_LEVEL={level}\nRATE_LIMIT=10\n", encoding="utf-8")
+            time.sleep(0.01)
+        assert _wait_for(lambda: log_events)
+        time.sleep(0.3)
+    finally:
+        coordinator.stop(timeout=2)
+
+    assert len(builds) == 1
+    assert log_events == [{"LOG_LEVEL": ("INFO", "ERROR")}]
+    assert cors_events == []
+    assert coordinator.current is not original
+    assert coordinator.current.LOG_LEVEL == "ERROR"
+    assert original.LOG_LEVEL == "INFO"
+
+
+def test_vendor_settings_share_one_watcher_thread(
+    hot_reload: ModuleType, vendor_base: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    (tmp_path / ".env").write_text("PROJECT_NAME=Before\n", encoding="utf-8")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("RAPIDKIT_SETTINGS_POLL_INTERVAL", "0.05")
+    monkeypatch.setitem(sys.modules, "core.hot_reload", hot_reload)
+    settings_module = _load(vendor_base / "settings.py", "rapidkit_test_reload_settings")
+
+    def _watchers() -> int:
+        return sum(t.name == "rapidkit-settings-reload" for t in threading.enumerate())
+
+    for _ in range(5):
+        settings_module.Settings().refresh()
+    assert _watchers() == 1
+
+    changed: list[Any] = []
+    hot_reload.subscribe(lambda s, diff: changed.append(diff), fields=["PROJECT_NAME"])
+    before = settings_module.get_settings()
+    (tmp_path / ".env").write_text("PROJECT_NAME=After\n", encoding="utf-8")
+
+    assert _wait_for(lambda: changed)
+    assert changed[0]["PROJECT_NAME"] == ("Before", "After")
+    assert settings_module.get_settings() is not before
+    assert settings_module.get_settings().PROJECT_NAME == "After"
+    assert _watchers() == 1
+
+
+def test_refresh_swaps_fields_without_exposing_a_half_built_instance(
+    hot_reload: ModuleType, vendor_base: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    env_file = tmp_path / ".env"
+    env_file.write_text("PROJECT_NAME=Before\n", encoding="utf-8")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("HOT_RELOAD_ENABLED", "false")
+    monkeypatch.setitem(sys.modules, "core.hot_reload", hot_reload)
+    settings_module = _load(vendor_base / "settings.py", "rapidkit_test_refresh_settings")
+    settings = settings_module.Settings()
+    errors: list[BaseException] = []
+    stop = threading.Event()
+
+    def _reader() -> None:
+        while not stop.is_set():
+            try:
+                assert settings.PROJECT_NAME in {"Before", "After"}
+            except BaseException as exc:  # noqa: BLE001 - surfaced below
+                errors.append(exc)
+                return
+
+    reader = threading.Thread(target=_reader)
+    reader.start()
+    try:
+        env_file.write_text("PROJECT_NAME=After\n", encoding="utf-8")
+        for _ in range(20):
+            settings.refresh()
+    finally:
+        stop.set()
+        reader.join()
+
+    assert errors == []
+    assert settings.PROJECT_NAME == "After"
+
+    # A rebuild that fails validation leaves the instance untouched.
+    monkeypatch.setenv("ENV", "production")
+    with pytest.raises(ValueError):
+        settings.refresh()
+    assert settings.PROJECT_NAME == "After"
+    assert settings.ENV != "production"
@@ -0,0 +1,220 @@
+"""Event flushing and sink tests for the Observability Core runtime."""
+
+from __future__ import annotations
+
+import io
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+
+class _FlakySink:
+    def __init__(self, failures: int = 0) -> None:
+        self.failures = failures
+        self.batches: list[list[dict]] = []
+
+    def write_batch(self, events) -> None:
+        if self.failures:
+            self.failures -= 1
+            raise OSError("collector unavailable")
+        self.batches.append(list(events))
+
+    def close(self) -> None:
+        return None
+
+
+def _runtime(modules, tmp_path: Path, **events):
+    runtime_module = modules.base
+    config = runtime_module.ObservabilityCoreConfig.from_mapping(
+        {
+            "metrics": {"enabled": False},
+            "events": {
+                "sinks": ["jsonl"],
+                "file_path": str(tmp_path / "events.jsonl"),
+                "flush_interval_seconds": 60,
+                **events,
+            },
+        }
+    )
+    return runtime_module.ObservabilityCore(config)
+
+
+@pytest.fixture
+def collector() -> Iterator[tuple[str, list[list[dict]]]]:
+    received: list[list[dict]] = []
+
+    class _Handler(BaseHTTPRequestHandler):
+        def do_POST(self) -> None:  # noqa: N802 - http.server API
+            length = int(self.headers["Content-Length"])
+            received.append(json.loads(self.rfile.read(length)))
+            self.send_response(204)
+            self.end_headers()
+
+        def log_message(self, *_args) -> None:
+            return None
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/events", received
+    server.shutdown()
+    server.server_close()
+
+
+def test_events_flush_to_jsonl_in_batches(generated_observability_modules, tmp_path) -> None:
+    runtime = _runtime(generated_observability_modules, tmp_path, flush_batch_size=3)
+    try:
+        for index in range(7):
+            runtime.emit_event("order.created", attributes={"index": index})
+        assert runtime.flush_events(timeout=2)
+
+        lines = (tmp_path / "events.jsonl").read_text().splitlines()
+        assert [json.loads(line)["attributes"]["index"] for line in lines] == list(range(7))
+        flush = runtime.health_check()["events"]["flush"]
+        assert flush["flushed"] == 7
+        assert flush["dropped"] == 0
+        assert flush["last_flush_ms"] is not None
+    finally:
+        runtime.shutdown()
+
+
+def test_full_backlog_drops_without_blocking(generated_observability_modules, tmp_path) -> None:
+    runtime_module = generated_observability_modules.base
+    buffer = runtime_module._EventBuffer(size=3)
+    buffer.attach(threading.Event(), wake_at=10)
+
+    accepted = [buffer.append({"name": f"e{index}"})[1] for index in range(5)]
+
+    assert accepted == [True, True, True, False, False]
+    assert buffer.dropped == 2
+    assert [event["name"] for event in buffer.drain(10)] == ["e0", "e1", "e2"]
+
+
+def test_failed_batches_are_retried(
+    generated_observability_modules, caplog: pytest.LogCaptureFixture
+) -> None:
+    runtime_module = generated_observability_modules.base
+    buffer = runtime_module._EventBuffer(size=10)
+    sink = _FlakySink(failures=2)
+    flusher = runtime_module._EventFlusher(
+        buffer, [sink], batch_size=5, interval_seconds=60, retry_attempts=1
+    )
+    try:
+        for index in range(3):
+            buffer.append({"name": f"e{index}"})
+        assert not flusher.flush(timeout=0.5)
+        assert flusher.failures == 1
+        assert flusher.stats()["pending"] == 3
+        failure = next(
+            r for r in caplog.records if r.getMessage() == "Event sink _FlakySink failed"
+        )
+        assert isinstance(failure.exc_info[1], OSError)  # the sink's error, not "NoneType: None"
+
+        flusher.retry_attempts = 2
+        assert flusher.flush(timeout=2)
+        assert [event["name"] for event in sink.batches[0]] == ["e0", "e1", "e2"]
+    finally:
+        flusher.shutdown()
+
+
+def test_only_the_failing_sink_is_retried(generated_observability_modules) -> None:
+    runtime_module = generated_observability_modules.base
+    buffer = runtime_module._EventBuffer(size=10)
+    healthy, flaky = _FlakySink(), _FlakySink(failures=1)
+    flusher = runtime_module._EventFlusher(
+        buffer, [healthy, flaky], batch_size=5, interval_seconds=60, retry_attempts=1
+    )
+    try:
+        for index in range(3):
+            buffer.append({"name": f"e{index}"})
+        assert not flusher.flush(timeout=0.5)
+        buffer.append({"name": "e3"})
+        assert flusher.flush(timeout=2)
+
+        assert [len(batch) for batch in healthy.batches] == [3, 1]
+        assert [len(batch) for batch in flaky.batches] == [3, 1]
+    finally:
+        flusher.shutdown()
+
+
+def test_flush_is_not_blocked_by_sink_backoff(generated_observability_modules) -> None:
+    runtime_module = generated_observability_modules.base
+    buffer = runtime_module._EventBuffer(size=10)
+    flusher = runtime_module._EventFlusher(
+        buffer, [_FlakySink(failures=100)], batch_size=5, interval_seconds=60, retry_attempts=8
+    )
+    try:
+        buffer.append({"name": "e0"})
+        flusher._wake.set()
+        time.sleep(0.05)  # the flusher is now sleeping between retries
+
+        started = time.perf_counter()
+        assert not flusher.flush(timeout=0.1)
+        assert time.perf_counter() - started < 0.5
+    finally:
+        flusher._stopped = True
+
+
+def test_backlog_overflow_is_counted_as_dropped(generated_observability_modules) -> None:
+    runtime_module = generated_observability_modules.base
+    buffer = runtime_module._EventBuffer(size=4)
+    lost: list[int] = []
+    flusher = runtime_module._EventFlusher(
+        buffer,
+        [_FlakySink(failures=100)],
+        batch_size=2,
+        interval_seconds=60,
+        retry_attempts=1,
+        on_drop=lost.append,
+    )
+    try:
+        for index in range(6):
+            buffer.append({"name": f"e{index}"})
+            flusher.flush(timeout=0.2)
+
+        stats = flusher.stats()
+        assert stats["dropped"] == sum(lost) > 0
+        assert stats["pending"] <= 4
+    finally:
+        flusher._stopped = True
+
+
+def test_unknown_sinks_are_rejected(generated_observability_modules, tmp_path) -> None:
+    with pytest.raises(ValueError, match="Unknown event sink"):
+        _runtime(generated_observability_modules, tmp_path, sinks=["jsonl", "kafka"])
+    with pytest.raises(ValueError, match="collector_url"):
+        _runtime(generated_observability_modules, tmp_path, sinks=["http"])
+
+
+def test_jsonl_sink_rotates_files(generated_observability_modules, tmp_path) -> None:
+    runtime_module = generated_observability_modules.base
+    path = tmp_path / "audit.jsonl"
+    sink = runtime_module.JSONLFileEventSink(path, max_bytes=120, backup_count=2)
+
+    for index in range(6):
+        sink.write_batch([{"name": "audit", "index": index, "padding": "x" * 40}])
+
+    assert path.exists()
+    assert (tmp_path / "audit.jsonl.1").exists()
+    assert (tmp_path / "audit.jsonl.2").exists()
+    assert not (tmp_path / "audit.jsonl.3").exists()
+
+
+def test_stdout_and_http_sinks_write_one_request_per_batch(
+    generated_observability_modules, collector
+) -> None:
+    runtime_module = generated_observability_modules.base
+    url, received = collector
+    batch = [{"name": "a"}, {"name": "b"}]
+
+    runtime_module.HTTPCollectorEventSink(url).write_batch(batch)
+    stream = io.StringIO()
+    runtime_module.StdoutEventSink(stream).write_batch(batch)
+
+    assert received == [batch]
+    assert len(stream.getvalue().splitlines()) == 2
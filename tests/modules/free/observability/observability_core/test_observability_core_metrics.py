@@ -0,0 +1,124 @@
+"""Metric handle and sharded accumulation tests for the Observability Core runtime."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+
+import pytest
+
+THREADS = 8
+
+
+def _runtime(modules):
+    runtime_module = modules.base
+    config = runtime_module.ObservabilityCoreConfig.from_mapping(
+        {"metrics": {"enabled": False, "buckets": [0.1, 1, 5]}}
+    )
+    return runtime_module.ObservabilityCore(config)
+
+
+def _render(runtime) -> dict:
+    payload, content_type = runtime.export_metrics()
+    assert content_type == "application/json"
+    return json.loads(payload)
+
+
+def test_metric_handles_are_pre_bound_and_shared(generated_observability_modules) -> None:
+    runtime = _runtime(generated_observability_modules)
+
+    handle = runtime.counter("requests_total", {"route": "health"})
+    assert runtime.counter("requests_total", {"route": "health"}) is handle
+
+    handle.inc()
+    runtime.increment_counter("requests_total", value=2, labels={"route": "health"})
+    runtime.gauge("in_flight").set(3)
+    runtime.histogram("latency_seconds").observe(0.5)
+
+    payload = _render(runtime)
+    counters = {key: value for key, value in payload["counters"].items() if "health" in key}
+    assert list(counters.values()) == [3.0]
+    assert list(payload["gauges"].values()) == [3.0]
+
+
+def test_histogram_uses_fixed_cumulative_buckets(generated_observability_modules) -> None:
+    runtime = _runtime(generated_observability_modules)
+    histogram = runtime.histogram("latency_seconds")
+
+    for value in (0.05, 0.1, 0.7, 3.0, 42.0):
+        histogram.observe(value)
+
+    (snapshot,) = _render(runtime)["histograms"].values()
+    assert snapshot["buckets"] == {"0.1": 2, "1.0": 3, "5.0": 4, "+Inf": 5}
+    assert snapshot["count"] == 5
+    assert snapshot["sum"] == pytest.approx(45.85)
+
+
+def test_sharded_counters_merge_exactly_across_threads(generated_observability_modules) -> None:
+    runtime = _runtime(generated_observability_modules)
+    counter = runtime.counter("jobs_total")
+    histogram = runtime.histogram("job_seconds")
+    per_thread = 5_000
+
+    def _work() -> None:
+        for _ in range(per_thread):
+            counter.inc()
+            histogram.observe(0.2)
+
+    threads = [threading.Thread(target=_work) for _ in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert counter.value == THREADS * per_thread
+    assert histogram.snapshot()["count"] == THREADS * per_thread
+
+
+def test_exited_thread_shards_are_folded_into_the_base(generated_observability_modules) -> None:
+    runtime = _runtime(generated_observability_modules)
+    counter = runtime.counter("requests_total")
+    histogram = runtime.histogram("request_seconds")
+
+    def _request() -> None:
+        counter.inc()
+        histogram.observe(0.2)
+
+    for _ in range(300):  # thread-per-request server
+        thread = threading.Thread(target=_request)
+        thread.start()
+        thread.join()
+
+    assert len(counter._shards) < 64 and len(histogram._shards) < 64
+    assert counter.value == 300
+    assert histogram.snapshot()["count"] == 300
+    assert counter._shards == [] and histogram._shards == []
+
+
+@pytest.mark.slow
+def test_benchmark_observations_per_second(generated_observability_modules) -> None:
+    runtime = _runtime(generated_observability_modules)
+    counter = runtime.counter("bench_total", {"route": "bench"})
+    histogram = runtime.histogram("bench_seconds", {"route": "bench"})
+    per_thread = 100_000
+    barrier = threading.Barrier(THREADS + 1)
+
+    def _work() -> None:
+        barrier.wait()
+        for _ in range(per_thread):
+            counter.inc()
+            histogram.observe(0.3)
+
+    threads = [threading.Thread(target=_work) for _ in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    started = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    observations = THREADS * per_thread * 2
+    print(f"{observations / elapsed:,.0f} observations/s across {THREADS} threads")
+    assert counter.value == THREADS * per_thread
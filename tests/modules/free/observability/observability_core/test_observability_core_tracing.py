@@ -0,0 +1,185 @@
+"""Sampling and span export tests for the Observability Core tracing engine."""
+
+from __future__ import annotations
+
+import gc
+import io
+import json
+import time
+from pathlib import Path
+
+import pytest
+
+
+class _MemoryExporter:
+    def __init__(self) -> None:
+        self.batches: list[list[object]] = []
+
+    def export(self, spans) -> None:
+        self.batches.append(list(spans))
+
+    def shutdown(self) -> None:
+        return None
+
+
+def _engine(modules, exporter=None, **tracing):
+    runtime_module = modules.base
+    tracing.setdefault("exporter", "none")
+    config = runtime_module.TracingConfig(enabled=True, **tracing)
+    return runtime_module._TracingEngine(config, exporter=exporter)
+
+
+def test_children_inherit_head_sampling_decision(generated_observability_modules) -> None:
+    engine = _engine(generated_observability_modules, sample_ratio=0.0)
+
+    with engine.span("root") as root:
+        with engine.span("child") as child:
+            pass
+
+    assert root.sampled is False
+    assert child.sampled is False
+    assert child.trace_id == root.trace_id
+    assert child.parent_id == root.span_id
+    assert engine.recent() == []
+
+    sampled = _engine(generated_observability_modules, sample_ratio=1.0)
+    with sampled.span("root"):
+        with sampled.span("child"):
+            pass
+    assert [span["name"] for span in sampled.recent()] == ["child", "root"]
+
+
+def test_ratio_sampler_is_roughly_proportional(generated_observability_modules) -> None:
+    engine = _engine(generated_observability_modules, sample_ratio=0.25)
+
+    for _ in range(2_000):
+        with engine.span("request"):
+            pass
+
+    kept = len(engine.recent(limit=500))
+    assert 350 <= kept <= 650
+
+
+def test_tail_sampling_keeps_slow_and_failed_traces(generated_observability_modules) -> None:
+    engine = _engine(
+        generated_observability_modules,
+        sample_ratio=0.0,
+        tail_latency_ms=20,
+        tail_keep_errors=True,
+    )
+
+    with engine.span("fast"):
+        pass
+    with engine.span("slow"):
+        with engine.span("slow.child"):
+            time.sleep(0.03)
+    with pytest.raises(RuntimeError):
+        with engine.span("failing"):
+            raise RuntimeError("boom")
+
+    names = [span["name"] for span in engine.recent()]
+    assert names == ["slow.child", "slow", "failing"]
+    assert engine.stats()["pending_traces"] == 0
+
+
+def test_batch_processor_flushes_on_size_and_flush(generated_observability_modules) -> None:
+    exporter = _MemoryExporter()
+    engine = _engine(
+        generated_observability_modules,
+        exporter=exporter,
+        sample_ratio=1.0,
+        export_batch_size=4,
+        export_interval_seconds=60,
+    )
+
+    for index in range(10):
+        with engine.span(f"op-{index}"):
+            pass
+    assert engine.flush(timeout=2)
+
+    exported = [span.name for batch in exporter.batches for span in batch]
+    assert exported == [f"op-{index}" for index in range(10)]
+    assert all(len(batch) <= 4 for batch in exporter.batches)
+    engine.shutdown()
+
+
+def test_batch_processor_drops_when_queue_is_full(generated_observability_modules) -> None:
+    runtime_module = generated_observability_modules.base
+    processor = runtime_module._BatchSpanProcessor(
+        _MemoryExporter(), batch_size=100, interval_seconds=60, queue_size=2
+    )
+    for index in range(5):
+        processor.on_end(runtime_module._TracingSpan(f"op-{index}"))
+
+    assert processor.dropped == 3
+    processor.shutdown()
+    assert processor.exported == 2
+
+
+def test_offline_exporters_write_one_document_per_batch(
+    generated_observability_modules, tmp_path: Path
+) -> None:
+    runtime_module = generated_observability_modules.base
+    spans = [runtime_module._TracingSpan("a"), runtime_module._TracingSpan("b")]
+    for span in spans:
+        span.close()
+
+    target = tmp_path / "traces" / "spans.jsonl"
+    runtime_module.OTLPFileSpanExporter(target, {"service.name": "svc"}).export(spans)
+    (document,) = [json.loads(line) for line in target.read_text().splitlines()]
+    resource_spans = document["resourceSpans"][0]
+    assert resource_spans["resource"]["attributes"][0]["key"] == "service.name"
+    assert [span["name"] for span in resource_spans["scopeSpans"][0]["spans"]] == ["a", "b"]
+
+    stream = io.StringIO()
+    runtime_module.ConsoleSpanExporter(stream).export(spans)
+    assert len(stream.getvalue().splitlines()) == 2
+
+
+def test_default_tracing_keeps_spans_in_memory(generated_observability_modules) -> None:
+    runtime_module = generated_observability_modules.base
+    config = runtime_module.TracingConfig(enabled=True, sample_ratio=1.0)
+    engine = runtime_module._TracingEngine(config)
+
+    with engine.span("op"):
+        pass
+
+    assert config.exporter == "memory"
+    assert engine._processor is None
+    assert [span["name"] for span in engine.recent()] == ["op"]
+
+
+def test_runtimes_share_one_export_thread(generated_observability_modules) -> None:
+    runtime_module = generated_observability_modules.base
+    config = runtime_module.TracingConfig(enabled=True, exporter="console")
+    first = runtime_module._TracingEngine(config)
+    second = runtime_module._TracingEngine(config)
+    processor = first._processor
+
+    assert processor is not None and second._processor is processor
+    first.shutdown()
+    assert processor._thread.is_alive()
+    del second
+    gc.collect()
+    processor._thread.join(timeout=2)
+    assert not processor._thread.is_alive()
+    assert runtime_module._SHARED_PROCESSORS == {}
+
+
+@pytest.mark.slow
+def test_benchmark_sampled_out_span_overhead(generated_observability_modules) -> None:
+    iterations = 50_000
+    recorded = _engine(generated_observability_modules, sample_ratio=1.0)
+    sampled_out = _engine(generated_observability_modules, sample_ratio=0.0)
+
+    def _measure(engine) -> float:
+        started = time.perf_counter()
+        for _ in range(iterations):
+            with engine.span("op"):
+                pass
+        return (time.perf_counter() - started) / iterations * 1e9
+
+    recorded_ns = _measure(recorded)
+    sampled_out_ns = _measure(sampled_out)
+    print(f"recorded span: {recorded_ns:,.0f} ns, sampled-out span: {sampled_out_ns:,.0f} ns")
+    assert sampled_out_ns < recorded_ns
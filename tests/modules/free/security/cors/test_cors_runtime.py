@@ -0,0 +1,185 @@
+"""Compiled origin matching and cached preflights in the generated CORS runtime."""
+
+# ruff: noqa: I001
+
+from __future__ import annotations
+
+import importlib.util
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import ModuleType
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("httpx")
+
+from fastapi import FastAPI
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.testclient import TestClient
+
+from modules.free.security.cors import generate as cors_generate
+
+ORIGINS = ["https://app.example.com", "https://*.tenant.example.org", "http://localhost:*"]
+
+
+@pytest.fixture()
+def cors_runtime(tmp_path: Path) -> ModuleType:
+    config = cors_generate.load_module_config()
+    renderer = cors_generate.TemplateRenderer()
+    context = cors_generate.build_base_context(config)
+    cors_generate.generate_variant_files(config, "fastapi", tmp_path, renderer, context)
+    path = tmp_path / "src/modules/free/security/cors/cors.py"
+    spec = importlib.util.spec_from_file_location("rapidkit_test_cors_runtime", path)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_origin_matcher_covers_exact_suffix_and_regex(cors_runtime: ModuleType) -> None:
+    matcher = cors_runtime.OriginMatcher(ORIGINS, regex=r"https://preview-\d+\.example\.net")
+
+    assert matcher.matches("https://app.example.com")
+    assert matcher.matches("https://APP.example.com")
+    assert matcher.matches("https://a.tenant.example.org")
+    assert matcher.matches("https://deep.a.tenant.example.org")
+    assert not matcher.matches("https://tenant.example.org")  # wildcard needs a subdomain
+    assert not matcher.matches("http://a.tenant.example.org")  # scheme is part of the pattern
+    assert not matcher.matches("https://a.tenant.example.org:8443")
+    assert not matcher.matches("https://eviltenant.example.org")
+    assert matcher.matches("http://localhost:3000")
+    assert matcher.matches("https://preview-42.example.net")
+    assert not matcher.matches("https://preview-42.example.net.evil.com")
+
+
+def test_preflight_responses_are_cached_and_counted(cors_runtime: ModuleType) -> None:
+    runtime = cors_runtime.Cors(
+        cors_runtime.CORSConfig(allow_origins=ORIGINS, allow_methods=["GET", "POST"])
+    )
+
+    first = runtime.preflight_response("https://a.tenant.example.org", "POST", "content-type")
+    second = runtime.preflight_response("https://a.tenant.example.org", "POST", "content-type")
+    denied = runtime.preflight_response("https://evil.test", "POST", "")
+
+    assert first is second
+    assert first[0] == 200
+    assert (b"access-control-allow-origin", b"https://a.tenant.example.org") in first[1]
+    assert denied[0] == 400
+    metrics = runtime.metrics.as_dict()
+    assert metrics["preflight_requests"] == 3
+    assert metrics["preflight_cache_hits"] == 1
+    assert metrics["preflight_rejected"] == 1
+    assert metrics["preflight_hit_rate"] == pytest.approx(1 / 3, abs=1e-4)
+
+
+def test_preflight_cache_is_bounded_lru(cors_runtime: ModuleType) -> None:
+    runtime = cors_runtime.Cors(cors_runtime.CORSConfig(preflight_cache_size=2))
+
+    runtime.preflight_response("https://a.test", "GET")
+    runtime.preflight_response("https://b.test", "GET")
+    runtime.preflight_response("https://a.test", "GET")  # refresh a
+    runtime.preflight_response("https://c.test", "GET")  # evicts b
+    runtime.preflight_response("https://a.test", "GET")
+
+    assert runtime.cache_info() == {"size": 2, "capacity": 2}
+    assert runtime.metrics.preflight_cache_hits == 2
+
+
+@pytest.mark.parametrize(
+    ("origins", "credentials", "headers"),
+    [
+        (["https://app.example.com"], True, ["Authorization", "Content-Type"]),
+        (["*"], False, ["*"]),
+        (["*"], True, ["X-Trace"]),
+    ],
+)
+def test_middleware_matches_starlette_responses(
+    cors_runtime: ModuleType, origins: list[str], credentials: bool, headers: list[str]
+) -> None:
+    options = {
+        "allow_origins": origins,
+        "allow_credentials": credentials,
+        "allow_methods": ["GET", "POST", "DELETE"],
+        "allow_headers": headers,
+        "expose_headers": ["X-Request-Id"],
+        "max_age": 900,
+    }
+    compiled = FastAPI()
+    cors_runtime.setup_cors(compiled, cors_runtime.CORSConfig(**options))
+    reference = FastAPI()
+    reference.add_middleware(CORSMiddleware, **options)
+    for app in (compiled, reference):
+
+        @app.get("/items")
+        async def items() -> dict[str, str]:
+            return {"ok": "yes"}
+
+    requests = [
+        ("OPTIONS", {"Access-Control-Request-Method": "POST"}),
+        (
+            "OPTIONS",
+            {
+                "Access-Control-Request-Method": "POST",
+                "Access-Control-Request-Headers": "authorization, x-trace",
+            },
+        ),
+        ("OPTIONS", {"Access-Control-Request-Method": "PATCH"}),
+        ("GET", {}),
+        ("GET", {"Cookie": "session=1"}),
+    ]
+    for origin in ("https://app.example.com", "https://evil.test"):
+        for method, extra in requests:
+            request_headers = {"Origin": origin, **extra}
+            ours = TestClient(compiled).request(method, "/items", headers=request_headers)
+            theirs = TestClient(reference).request(method, "/items", headers=request_headers)
+            assert ours.status_code == theirs.status_code, (origin, method, extra)
+            for name in (
+                "access-control-allow-origin",
+                "access-control-allow-credentials",
+                "access-control-allow-methods",
+                "access-control-allow-headers",
+                "access-control-expose-headers",
+                "access-control-max-age",
+                "vary",
+            ):
+                assert ours.headers.get(name) == theirs.headers.get(name), (name, origin, extra)
+
+    assert compiled.state.cors_runtime.metrics.preflight_cache_hits == 0
+    TestClient(compiled).options(
+        "/items",
+        headers={"Origin": "https://app.example.com", "Access-Control-Request-Method": "POST"},
+    )
+    assert compiled.state.cors_runtime.metrics.preflight_cache_hits == 1
+
+
+def test_factories_keep_the_middleware_and_runtime_apart(cors_runtime: ModuleType) -> None:
+    config = cors_runtime.CORSConfig(allow_origins=ORIGINS, max_age=120)
+
+    middleware = cors_runtime.create_cors_middleware(config)
+    runtime = cors_runtime.create_cors_runtime(config)
+
+    assert isinstance(middleware, CORSMiddleware)
+    assert middleware.allow_origins == ORIGINS
+    assert isinstance(runtime, cors_runtime.Cors)
+    assert runtime.is_allowed_origin("https://a.tenant.example.org")
+
+
+def test_metrics_are_exact_under_concurrency(cors_runtime: ModuleType) -> None:
+    runtime = cors_runtime.Cors(cors_runtime.CORSConfig(allow_origins=ORIGINS))
+    barrier = threading.Barrier(8)
+
+    def worker(index: int) -> None:
+        barrier.wait()
+        for _ in range(500):
+            runtime.preflight_response(f"https://t{index % 2}.tenant.example.org", "GET")
+            runtime.simple_headers("https://evil.test", has_cookie=False)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(worker, range(8)))
+
+    metrics = runtime.metrics.as_dict()
+    assert metrics["preflight_requests"] == 4000
+    assert metrics["preflight_cache_hits"] + metrics["preflight_cache_misses"] == 4000
+    assert metrics["simple_requests"] == metrics["rejected_origins"] == 4000
@@ -0,0 +1,109 @@
+"""ASGI fast path and per-route overrides for the Security Headers vendor payload."""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from typing import Any, Mapping
+
+import pytest
+
+from .conftest import load_module_from_path, prepare_vendor_package
+
+
+@pytest.fixture()
+def vendor_module(
+    tmp_path: Path,
+    module_generate,  # type: ignore[annotation-unchecked]
+    module_config: Mapping[str, Any],
+):
+    renderer = module_generate.TemplateRenderer()
+    context = module_generate.build_base_context(module_config)
+    module_generate.generate_vendor_files(module_config, tmp_path, renderer, context)
+
+    vendor_base = tmp_path / ".rapidkit" / "vendor"
+    prepare_vendor_package(vendor_base, context)
+    vendor_file = (
+        vendor_base
+        / context["rapidkit_vendor_module"]
+        / context["rapidkit_vendor_version"]
+        / context["rapidkit_vendor_relative_path"]
+    )
+    return load_module_from_path(vendor_file, "tests_security.security_headers_asgi_vendor")
+
+
+async def _app(scope: dict[str, Any], receive: Any, send: Any) -> None:
+    await send(
+        {
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [(b"content-type", b"text/plain"), (b"x-frame-options", b"ALLOWALL")],
+        }
+    )
+    await send({"type": "http.response.body", "body": b"ok"})
+
+
+def _call(middleware: Any, path: str, scope_type: str = "http") -> list[dict[str, Any]]:
+    sent: list[dict[str, Any]] = []
+
+    async def _send(message: dict[str, Any]) -> None:
+        sent.append(message)
+
+    asyncio.run(middleware({"type": scope_type, "path": path}, None, _send))
+    return sent
+
+
+def _headers(messages: list[dict[str, Any]]) -> dict[bytes, list[bytes]]:
+    collected: dict[bytes, list[bytes]] = {}
+    for name, value in messages[0]["headers"]:
+        collected.setdefault(name, []).append(value)
+    return collected
+
+
+def test_middleware_splices_block_and_replaces_conflicts(vendor_module) -> None:
+    runtime = vendor_module.SecurityHeaders()
+    middleware = vendor_module.SecurityHeadersASGIMiddleware(_app, runtime)
+
+    messages = _call(middleware, "/items")
+    headers = _headers(messages)
+
+    assert headers[b"x-frame-options"] == [b"DENY"]
+    assert headers[b"content-type"] == [b"text/plain"]
+    assert headers[b"x-content-type-options"] == [b"nosniff"]
+    assert messages[1]["body"] == b"ok"
+    # Non-HTTP scopes pass straight through.
+    assert _headers(_call(middleware, "/ws", "websocket"))[b"x-frame-options"] == [b"ALLOWALL"]
+
+
+def test_route_overrides_prefer_exact_then_longest_prefix(vendor_module) -> None:
+    cfg = vendor_module.SecurityHeadersConfig(
+        route_overrides={
+            "/docs/*": {"X-Frame-Options": "SAMEORIGIN", "Cross-Origin-Embedder-Policy": None},
+            "/docs/private/*": {"X-Frame-Options": "DENY"},
+            "/docs/embed": {"X-Frame-Options": None},
+        }
+    )
+    runtime = vendor_module.SecurityHeaders(cfg)
+    middleware = vendor_module.SecurityHeadersASGIMiddleware(_app, runtime)
+
+    docs = _headers(_call(middleware, "/docs/index"))
+    assert docs[b"x-frame-options"] == [b"SAMEORIGIN"]
+    assert b"cross-origin-embedder-policy" not in docs
+
+    assert _headers(_call(middleware, "/docs/private/a"))[b"x-frame-options"] == [b"DENY"]
+    assert b"x-frame-options" not in _headers(_call(middleware, "/docs/embed/"))
+    assert runtime.headers_for("/other") == runtime.headers()
+
+
+def test_header_block_is_cached_per_config_version(vendor_module) -> None:
+    runtime = vendor_module.SecurityHeaders()
+    first = runtime.header_block("/a")
+    assert runtime.header_block("/b") is first
+    version = runtime.version
+
+    runtime.reconfigure(vendor_module.SecurityHeadersConfig(x_frame_options="SAMEORIGIN"))
+    assert runtime.version == version + 1
+    raw, replaced = runtime.header_block("/a")
+    assert raw is not first[0]
+    assert (b"x-frame-options", b"SAMEORIGIN") in raw
+    assert b"x-frame-options" in replaced
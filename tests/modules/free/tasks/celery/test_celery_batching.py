@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import asyncio
+import sys
+import uuid
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+pytest.importorskip("celery")
+
+from runtime.tasks import celery as runtime  # noqa: E402
+
+
+@pytest.fixture
+def app() -> Any:
+    config = runtime.CeleryAppConfig.from_mapping(
+        {
+            "name": f"batching-{uuid.uuid4().hex}",
+            "settings": {
+                "broker_url": "memory://",
+                "result_backend": "cache+memory://",
+                "task_default_queue": f"batching-{uuid.uuid4().hex}",
+            },
+        }
+    )
+    celery_app = runtime.create_celery_app(config)
+
+    @celery_app.task(name="tests.batching.add")
+    def add(left: int, right: int) -> int:
+        return left + right
+
+    return celery_app
+
+
+def _queued_messages(app: Any) -> int:
+    queue = app.conf.task_default_queue
+    with app.connection_for_write() as connection:
+        declared = connection.default_channel.queue_declare(queue=queue, passive=True)
+    return int(declared.message_count)
+
+
+def test_submit_many_publishes_one_message_per_chunk(app: Any) -> None:
+    task = app.tasks["tests.batching.add"]
+
+    results = runtime.submit_many(task, ((i, i) for i in range(25)), chunk_size=10)
+
+    assert len(results) == 3
+    assert _queued_messages(app) == 3
+
+
+def test_submit_many_rejects_invalid_chunk_size(app: Any) -> None:
+    with pytest.raises(ValueError):
+        runtime.submit_many(app.tasks["tests.batching.add"], [(1, 2)], chunk_size=0)
+
+
+async def test_gather_results_polls_backend_without_blocking(app: Any) -> None:
+    ids = [uuid.uuid4().hex for _ in range(3)]
+    results = [app.AsyncResult(task_id) for task_id in ids]
+
+    def _complete() -> None:
+        for position, task_id in enumerate(ids):
+            app.backend.store_result(task_id, position * 10, "SUCCESS")
+
+    asyncio.get_running_loop().call_later(0.05, _complete)
+    values = await runtime.gather_results(results, timeout=2, poll_interval=0.01)
+
+    assert values == [0, 10, 20]
+
+
+async def test_gather_results_propagates_failures_and_times_out(app: Any) -> None:
+    failed_id = uuid.uuid4().hex
+    app.backend.store_result(failed_id, KeyError("missing"), "FAILURE")
+
+    with pytest.raises(KeyError):
+        await runtime.gather_results([app.AsyncResult(failed_id)], timeout=1)
+
+    values = await runtime.gather_results([app.AsyncResult(failed_id)], timeout=1, propagate=False)
+    assert isinstance(values[0], KeyError)
+
+    with pytest.raises(TimeoutError):
+        await runtime.gather_results(
+            [app.AsyncResult(uuid.uuid4().hex)], timeout=0.05, poll_interval=0.01
+        )
+
+
+def test_task_index_scans_sources_without_importing(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    package = tmp_path / "indexed_jobs"
+    package.mkdir()
+    (package / "__init__.py").write_text("", encoding="utf-8")
+    (package / "tasks.py").write_text(
+        "raise RuntimeError('worker code must not be imported')\n"
+        "@app.task(name='jobs.import_row')\n"
+        "def import_row(row):\n"
+        "    return row\n"
+        "@shared_task\n"
+        "def cleanup():\n"
+        "    return None\n"
+        "def helper():\n"
+        "    return None\n",
+        encoding="utf-8",
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    index = runtime.CeleryTaskIndex.from_packages(["indexed_jobs", "missing_pkg"])
+
+    assert index.modules == {
+        "jobs.import_row": "indexed_jobs.tasks",
+        "indexed_jobs.tasks.cleanup": "indexed_jobs.tasks",
+    }
+    assert "indexed_jobs.tasks" not in sys.modules
+
+
+def test_registry_sends_indexed_tasks_by_name(app: Any) -> None:
+    index = runtime.CeleryTaskIndex(modules={"jobs.import_row": "indexed_jobs.tasks"})
+    registry = runtime.CeleryTaskRegistry(app, index)
+
+    result = registry.send("jobs.import_row", args=(1,))
+
+    assert result.id
+    assert _queued_messages(app) == 1
+    assert "jobs.import_row" in registry.list_task_names()
+    with pytest.raises(runtime.CeleryRuntimeError):
+        registry.send("jobs.unknown")
+
+
+def test_task_index_modules_import_on_worker_boot(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    module_name = f"boot_tasks_{uuid.uuid4().hex}"
+    (tmp_path / f"{module_name}.py").write_text("LOADED = True\n", encoding="utf-8")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    config = runtime.CeleryAppConfig.from_mapping(
+        {
+            "name": f"boot-{uuid.uuid4().hex}",
+            "settings": {"broker_url": "memory://", "result_backend": "cache+memory://"},
+            "task_index": {"jobs.boot": module_name},
+        }
+    )
+    celery_app = runtime.create_celery_app(config)
+    assert module_name not in sys.modules
+
+    celery_app.loader.import_default_modules()
+
+    assert module_name in sys.modules
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import sys
+from datetime import timedelta
 from importlib import import_module, util as import_util
 from pathlib import Path
 from unittest import mock
@@ -192,12 +193,66 @@ def test_get_celery_app_caches_default_instance() -> None:
     runtime._get_default_celery_app.cache_clear()
 
 
-def test_get_celery_app_supports_custom_config_without_cache() -> None:
+def test_get_celery_app_caches_custom_config_by_fingerprint() -> None:
     runtime = load_runtime_module()
+    runtime.clear_celery_app_cache()
     config = runtime.CeleryAppConfig.from_mapping({"name": "custom"})
     with mock.patch.object(runtime, "create_celery_app") as create_app:
-        runtime.get_celery_app(config)
-        create_app.assert_called_once_with(config)
+        create_app.side_effect = lambda _config: mock.Mock()
+        first = runtime.get_celery_app(config)
+        again = runtime.get_celery_app(runtime.CeleryAppConfig.from_mapping({"name": "custom"}))
+        other = runtime.get_celery_app(runtime.CeleryAppConfig.from_mapping({"name": "other"}))
+        create_app.assert_any_call(config)
+        assert create_app.call_count == 2
+    assert first is again
+    assert other is not first
+    runtime.clear_celery_app_cache()
+
+
+def test_app_config_parses_string_flags_and_rejects_address_reprs() -> None:
+    runtime = load_runtime_module()
+    runtime.clear_celery_app_cache()
+    assert (
+        runtime.CeleryAppConfig.from_mapping({"lazy_autodiscover": "false"}).lazy_autodiscover
+        is False
+    )
+    assert (
+        runtime.CeleryAppConfig.from_mapping({"lazy_autodiscover": "on"}).lazy_autodiscover is True
+    )
+    assert runtime.CeleryAppConfig.from_mapping({}).lazy_autodiscover is True
+
+    timed = {"config_overrides": {"visibility": timedelta(seconds=5), "queues": {"a", "b"}}}
+    assert (
+        runtime.CeleryAppConfig.from_mapping(timed).fingerprint()
+        == runtime.CeleryAppConfig.from_mapping(timed).fingerprint()
+    )
+
+    opaque = runtime.CeleryAppConfig.from_mapping({"config_overrides": {"hook": object()}})
+    with pytest.raises(runtime.CeleryRuntimeError, match="fingerprint"):
+        opaque.fingerprint()
+    with mock.patch.object(runtime, "create_celery_app") as create_app:
+        create_app.side_effect = lambda _config: mock.Mock()
+        runtime.get_celery_app(opaque)
+        runtime.get_celery_app(opaque)
+        assert create_app.call_count == 2
+    assert runtime._APP_CACHE == {}
+
+
+def test_create_celery_app_defers_autodiscovery_by_default() -> None:
+    runtime = load_runtime_module()
+    config = runtime.CeleryAppConfig.from_mapping({"autodiscover": ["tests.fake"]})
+    with mock.patch.object(runtime, "Celery") as celery_cls:
+        runtime.create_celery_app(config)
+        celery_cls.return_value.autodiscover_tasks.assert_called_once_with(("tests.fake",))
+
+    eager = runtime.CeleryAppConfig.from_mapping(
+        {"autodiscover": ["tests.fake"], "lazy_autodiscover": False}
+    )
+    with mock.patch.object(runtime, "Celery") as celery_cls:
+        runtime.create_celery_app(eager)
+        celery_cls.return_value.autodiscover_tasks.assert_called_once_with(
+            ("tests.fake",), force=True
+        )
 
 
 def test_celery_schedule_interval_without_schedule_dependency(
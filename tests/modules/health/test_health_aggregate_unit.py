@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import asyncio
+import importlib
+import sys
+import time
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Iterator
+
+import pytest
+
+from modules.shared.utils.health import ensure_health_package
+
+_PROBE_MODULE = """
+from __future__ import annotations
+
+CALLS = []
+
+
+def register_{slug}_health(app):
+    return None
+
+
+{probe}
+"""
+
+
+@pytest.fixture()
+def generated_health(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[ModuleType]:
+    ensure_health_package(tmp_path)
+    health_dir = tmp_path / "src" / "health"
+    (tmp_path / "src" / "__init__.py").write_text("", encoding="utf-8")
+    probes = {
+        "alpha": 'async def check_health():\n    CALLS.append(1)\n    return {"status": "ok"}',
+        "beta": (
+            "import time\n\n\ndef health_check():\n    CALLS.append(1)\n"
+            '    time.sleep(0.2)\n    return {"status": "ok"}'
+        ),
+    }
+    for slug, probe in probes.items():
+        (health_dir / f"{slug}.py").write_text(
+            _PROBE_MODULE.format(slug=slug, probe=probe), encoding="utf-8"
+        )
+
+    saved = {name: mod for name, mod in sys.modules.items() if name.split(".")[0] == "src"}
+    for name in saved:
+        monkeypatch.delitem(sys.modules, name)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    registry = importlib.import_module("src.health.registry")
+    yield registry
+    for name in [name for name in sys.modules if name.split(".")[0] == "src"]:
+        sys.modules.pop(name, None)
+    sys.modules.update(saved)
+
+
+def test_discovery_runs_checks_concurrently_with_ttl_cache(generated_health: ModuleType) -> None:
+    aggregator = generated_health.discover_health_checks(
+        generated_health.HealthAggregator(ttl=60, timeout=1)
+    )
+    assert aggregator.names == ["alpha", "beta"]
+
+    async def exercise() -> tuple[dict[str, Any], dict[str, Any]]:
+        return await aggregator.readiness(), await aggregator.readiness()
+
+    started = time.monotonic()
+    first, second = asyncio.run(exercise())
+
+    assert time.monotonic() - started < 0.6  # beta's sleep is paid once
+    assert first["ready"] is True and first["status"] == "ok"
+    assert first["checks"]["beta"]["cached"] is False
+    assert second["checks"]["beta"]["cached"] is True
+    assert len(sys.modules["src.health.beta"].CALLS) == 1
+
+
+def test_timeouts_fail_readiness_and_stale_results_are_served(
+    generated_health: ModuleType,
+) -> None:
+    aggregator = generated_health.HealthAggregator(ttl=0, timeout=0.05)
+    state = {"delay": 0.0, "calls": 0}
+
+    async def flaky() -> dict[str, str]:
+        state["calls"] += 1
+        await asyncio.sleep(state["delay"])
+        return {"status": "ok"}
+
+    aggregator.register("db", flaky)
+    aggregator.register("cache", lambda: {"status": "down"}, critical=False)
+
+    async def exercise() -> list[dict[str, Any]]:
+        first = await aggregator.readiness()
+        state["delay"] = 1.0
+        stale = await aggregator.readiness()  # served from cache, refresh starts
+        await asyncio.sleep(0.1)  # refresh times out
+        after = await aggregator.readiness()
+        return [first, stale, after]
+
+    first, stale, after = asyncio.run(exercise())
+
+    assert first["status"] == "degraded" and first["ready"] is True
+    assert first["degraded"] == ["cache"]
+    assert stale["checks"]["db"]["stale"] is True and stale["ready"] is True
+    assert after["checks"]["db"]["status"] == "timeout"
+    assert after["ready"] is False and after["failing"] == ["db"]
+    assert aggregator.liveness()["alive"] is True
+
+
+def test_aggregate_router_splits_liveness_and_readiness(generated_health: ModuleType) -> None:
+    fastapi = pytest.importorskip("fastapi")
+    testclient = pytest.importorskip("fastapi.testclient")
+    aggregator = generated_health.HealthAggregator(ttl=60, timeout=1)
+    aggregator.register("db", lambda: {"status": "error", "detail": "refused"})
+    app = fastapi.FastAPI()
+    app.include_router(generated_health.build_aggregate_health_router(aggregator=aggregator))
+    client = testclient.TestClient(app)
+
+    assert client.get("/api/health/live").status_code == 200
+    response = client.get("/api/health/ready")
+    assert response.status_code == 503
+    assert response.json()["checks"]["db"]["detail"] == "refused"
+
+    health_pkg = sys.modules["src.health"]
+    mounted = fastapi.FastAPI()
+    health_pkg.register_health_routes(mounted)
+    mounted_client = testclient.TestClient(mounted)
+    assert mounted_client.get("/api/health/live").json()["checks"] == ["alpha", "beta"]
+    assert mounted_client.get("/api/health/ready").json()["ready"] is True
+
+
+def test_discovery_skips_probes_that_need_arguments(generated_health: ModuleType) -> None:
+    module = importlib.import_module("src.health.alpha")
+    module.check_health = lambda request: {"status": "ok"}  # type: ignore[attr-defined]
+    aggregator = generated_health.discover_health_checks(
+        generated_health.HealthAggregator(ttl=60, timeout=1)
+    )
+    assert aggregator.names == ["beta"]
+
+    aggregator.register("silent", lambda: {"detail": "no status"})
+    payload = asyncio.run(aggregator.readiness())
+
+    assert payload["checks"]["silent"]["status"] == "unknown"
+    assert payload["ready"] is True and payload["degraded"] == ["silent"]
+
+
+def _generate(module: str, target: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    generate = importlib.import_module(f"modules.free.{module}.generate")
+    monkeypatch.setattr(generate, "ensure_version_consistency", lambda config, **_: (config, False))
+    monkeypatch.setattr(sys, "argv", ["generate", "fastapi", str(target)])
+    generate.main()
+
+
+def test_readiness_is_green_for_generated_cors_and_settings(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    pytest.importorskip("jinja2")
+    fastapi = pytest.importorskip("fastapi")
+    testclient = pytest.importorskip("fastapi.testclient")
+    (tmp_path / ".rapidkit").mkdir()
+    (tmp_path / "pyproject.toml").write_text("", encoding="utf-8")
+    for module in ("security.cors", "essentials.settings"):
+        _generate(module, tmp_path, monkeypatch)
+
+    saved = {name: mod for name, mod in sys.modules.items() if name.split(".")[0] == "src"}
+    for name in saved:
+        monkeypatch.delitem(sys.modules, name)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    try:
+        registry = importlib.import_module("src.health.registry")
+        app = fastapi.FastAPI()
+        app.include_router(registry.build_aggregate_health_router())
+        response = testclient.TestClient(app).get("/api/health/ready")
+    finally:
+        for name in [name for name in sys.modules if name.split(".")[0] == "src"]:
+            sys.modules.pop(name, None)
+        sys.modules.update(saved)
+
+    assert response.status_code == 200, response.json()
+    settings = response.json()["checks"]["settings"]
+    assert settings["status"] == "ok" and "uptime" in settings  # the real payload, not a repr
+
+
+def test_readiness_probes_generated_stateful_modules(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    pytest.importorskip("jinja2")
+    pytest.importorskip("redis")
+    (tmp_path / ".rapidkit").mkdir()
+    (tmp_path / "pyproject.toml").write_text("", encoding="utf-8")
+    for module in ("cache.redis", "database.db_sqlite"):
+        _generate(module, tmp_path, monkeypatch)
+    (tmp_path / "src" / "__init__.py").write_text("", encoding="utf-8")
+    monkeypatch.chdir(tmp_path)  # the default SQLite path is relative
+    monkeypatch.setenv("REDIS_URL", "redis://127.0.0.1:1/0")
+
+    saved = {name: mod for name, mod in sys.modules.items() if name.split(".")[0] == "src"}
+    for name in saved:
+        monkeypatch.delitem(sys.modules, name)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    try:
+        registry = importlib.import_module("src.health.registry")
+        aggregator = registry.discover_health_checks(registry.HealthAggregator(timeout=5))
+        payload = asyncio.run(aggregator.readiness())
+    finally:
+        for name in [name for name in sys.modules if name.split(".")[0] == "src"]:
+            sys.modules.pop(name, None)
+        sys.modules.update(saved)
+
+    assert aggregator.names == ["db_sqlite", "redis"]
+    assert payload["checks"]["db_sqlite"]["status"] == "ok"
+    assert payload["checks"]["redis"]["status"] == "error"  # nothing listens on port 1
+    assert payload["ready"] is False and payload["failing"] == ["redis"]
@@ -0,0 +1,132 @@
+import json
+from pathlib import Path
+from typing import List
+
+from typer.testing import CliRunner
+
+from cli.commands.deps import deps_app
+from core.engine import dependency_installer as di
+
+PYPROJECT = """[tool.poetry]
+name = "demo"
+
+[tool.poetry.dependencies]
+python = "^3.11"
+fastapi = "^0.110.0"
+# <<<inject:module-dependencies>>>
+
+[tool.poetry.group.dev.dependencies]
+pytest = "^8.0"
+"""
+
+
+def _fake_poetry_lock(calls: List[Path]):
+    def _sync(project_root: Path) -> None:
+        calls.append(project_root)
+        (project_root / "poetry.lock").write_text("# lock\n")
+
+    return _sync
+
+
+def test_dependency_set_hash_ignores_formatting(tmp_path: Path) -> None:
+    py = tmp_path / "pyproject.toml"
+    py.write_text(PYPROJECT)
+    baseline = di.dependency_set_hash("poetry", tmp_path)
+
+    reformatted = PYPROJECT.replace('fastapi = "^0.110.0"', "fastapi='^0.110.0'  # web")
+    py.write_text(reformatted.replace('python = "^3.11"\n', "") + 'python = "^3.11"\n')
+    # python moved into the dev group: a real change
+    assert di.dependency_set_hash("poetry", tmp_path) != baseline
+
+    py.write_text(reformatted)
+    assert di.dependency_set_hash("poetry", tmp_path) == baseline
+
+    py.write_text(PYPROJECT.replace("^0.110.0", "^0.111.0"))
+    assert di.dependency_set_hash("poetry", tmp_path) != baseline
+
+
+def test_dependency_set_hash_reads_multiline_values(tmp_path: Path) -> None:
+    py = tmp_path / "pyproject.toml"
+    py.write_text(PYPROJECT)
+    baseline = di.dependency_set_hash("poetry", tmp_path)
+
+    py.write_text(
+        PYPROJECT.replace(
+            "# <<<inject:module-dependencies>>>",
+            'uvicorn = { version = "^0.30", extras = [\n  "standard",\n] }',
+        )
+    )
+    with_uvicorn = di.dependency_set_hash("poetry", tmp_path)
+    assert with_uvicorn != baseline
+
+    py.write_text(py.read_text().replace('"standard",', '"standard",\n  "watch",'))
+    assert di.dependency_set_hash("poetry", tmp_path) != with_uvicorn
+
+
+def test_missing_lockfile_keeps_changes_pending(tmp_path: Path, monkeypatch) -> None:
+    (tmp_path / "pyproject.toml").write_text(PYPROJECT)
+    calls: List[Path] = []
+    monkeypatch.setattr(di, "_sync_poetry_lockfile", calls.append)
+
+    di._request_lockfile_sync("poetry", tmp_path, packages=["fastapi"], module="demo")
+
+    journal = di.load_deps_journal(tmp_path)
+    assert calls == [tmp_path]
+    assert [entry["packages"] for entry in journal["pending"]] == [["fastapi"]]
+    assert "poetry" not in journal["synced"]
+
+    for _ in range(5):
+        di._request_lockfile_sync("poetry", tmp_path, packages=["fastapi"], module="demo")
+    di._request_lockfile_sync("poetry", tmp_path, packages=["httpx"], module="demo")
+
+    pending = di.load_deps_journal(tmp_path)["pending"]
+    assert [entry["packages"] for entry in pending] == [["fastapi"], ["httpx"]]
+
+
+def test_sync_lockfile_skips_unchanged_dependency_set(tmp_path: Path, monkeypatch) -> None:
+    (tmp_path / "pyproject.toml").write_text(PYPROJECT)
+    calls: List[Path] = []
+    monkeypatch.setattr(di, "_sync_poetry_lockfile", _fake_poetry_lock(calls))
+
+    di._request_lockfile_sync("poetry", tmp_path, packages=["fastapi"], module="demo")
+    assert len(calls) == 1
+    journal = di.load_deps_journal(tmp_path)
+    assert journal["pending"] == []
+    assert journal["synced"]["poetry"] == di.dependency_set_hash("poetry", tmp_path)
+
+    # Normalisation-only edit: journalled, but no second resolution.
+    di._request_lockfile_sync("poetry", tmp_path)
+    assert len(calls) == 1
+
+    assert di.sync_lockfile("poetry", tmp_path, force=True) == "synced"
+    assert len(calls) == 2
+
+
+def test_deferred_env_journals_until_deps_sync(tmp_path: Path, monkeypatch) -> None:
+    (tmp_path / "pyproject.toml").write_text(PYPROJECT)
+    calls: List[Path] = []
+    monkeypatch.setattr(di, "_sync_poetry_lockfile", _fake_poetry_lock(calls))
+    monkeypatch.setenv(di.DEFER_LOCKFILE_SYNC_ENV, "1")
+
+    with di.deferred_lockfile_sync():
+        di._request_lockfile_sync("poetry", tmp_path, packages=["redis"], module="redis")
+        di._request_lockfile_sync("poetry", tmp_path, packages=["sqlalchemy"], module="db")
+    assert calls == []
+
+    journal_path = tmp_path / di.DEPS_JOURNAL_DIR / di.DEPS_JOURNAL_FILE
+    pending = json.loads(journal_path.read_text())["pending"]
+    assert [entry["packages"] for entry in pending] == [["redis"], ["sqlalchemy"]]
+
+    runner = CliRunner()
+    status = runner.invoke(deps_app, ["status", "--project", str(tmp_path)])
+    assert status.exit_code == 0
+    assert "2 pending dependency change(s)" in status.output
+
+    result = runner.invoke(deps_app, ["sync", "--project", str(tmp_path)])
+    assert result.exit_code == 0, result.output
+    assert calls == [tmp_path]
+    assert di.load_deps_journal(tmp_path)["pending"] == []
+
+    again = runner.invoke(deps_app, ["sync", "--project", str(tmp_path)])
+    assert "Nothing to sync" in again.output
+    assert len(calls) == 1
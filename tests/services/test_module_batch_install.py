@@ -0,0 +1,111 @@
+from pathlib import Path
+from typing import Any, List
+
+import typer
+
+from cli.commands.add import batch
+from core.engine import dependency_installer as di
+from core.services import file_hash_registry as fhr
+from core.services import module_manifest as mm
+
+
+def _manifest(slug: str, depends_on: List[str]) -> mm.ModuleManifest:
+    return mm.ModuleManifest(name=slug.split("/")[-1], slug=slug, depends_on=depends_on)
+
+
+def test_resolve_batch_order_places_dependencies_first() -> None:
+    manifests = {
+        "free/a": _manifest("free/a", []),
+        "free/b": _manifest("free/b", ["free/a"]),
+        "free/c": _manifest("free/c", ["free/b"]),
+    }
+
+    assert batch.resolve_batch_order(["free/c", "free/x"], manifests) == [
+        "free/a",
+        "free/b",
+        "free/c",
+        "free/x",
+    ]
+    # An already-sorted request keeps its order.
+    assert batch.resolve_batch_order(["free/a", "free/b"], manifests) == ["free/a", "free/b"]
+
+
+def test_deferred_lockfile_sync_runs_once_per_project(tmp_path: Path, monkeypatch) -> None:
+    (tmp_path / "pyproject.toml").write_text('[tool.poetry.dependencies]\npython = "^3.11"\n')
+    synced: List[Path] = []
+    monkeypatch.setattr(di, "_sync_poetry_lockfile", synced.append)
+
+    with di.deferred_lockfile_sync():
+        with di.deferred_lockfile_sync():
+            di._request_lockfile_sync("poetry", tmp_path)
+        di._request_lockfile_sync("poetry", tmp_path)
+        assert synced == []
+
+    assert synced == [tmp_path.resolve()]
+
+    di._request_lockfile_sync("poetry", tmp_path)
+    assert len(synced) == 2
+
+
+def test_hash_registry_session_writes_once(tmp_path: Path, monkeypatch) -> None:
+    writes: List[Any] = []
+    original_write = fhr._write_hashes
+
+    def _counting_write(project_root: Path, data: Any) -> None:
+        writes.append(project_root)
+        original_write(project_root, data)
+
+    monkeypatch.setattr(fhr, "_write_hashes", _counting_write)
+
+    with fhr.hash_registry_session(tmp_path):
+        for idx in range(3):
+            registry = fhr.load_hashes(tmp_path)
+            fhr.record_file_hash(registry, f"f{idx}.py", "mod", "1.0", b"x%d" % idx)
+            fhr.save_hashes(tmp_path, registry)
+        assert writes == []
+
+    assert len(writes) == 1
+    assert sorted(fhr.load_hashes(tmp_path)["files"]) == ["f0.py", "f1.py", "f2.py"]
+
+
+def test_install_modules_batch_shares_deferred_work(tmp_path: Path, monkeypatch) -> None:
+    (tmp_path / "pyproject.toml").write_text('[tool.poetry.dependencies]\npython = "^3.11"\n')
+    scans: List[Path] = []
+    synced: List[Path] = []
+    with_deps: List[bool] = []
+    original_scan = mm._scan_manifests
+
+    def _counting_scan(modules_root: Path) -> Any:
+        scans.append(modules_root)
+        return original_scan(modules_root)
+
+    def _fake_add_module(name: str, **kwargs: Any) -> None:
+        with_deps.append(kwargs["with_deps"])
+        mm.load_all_manifests(batch.MODULES_PATH)
+        registry = fhr.load_hashes(tmp_path)
+        fhr.record_file_hash(registry, f"{name}.py", name, "1.0", name.encode())
+        fhr.save_hashes(tmp_path, registry)
+        di._request_lockfile_sync("poetry", tmp_path)
+        if name == "free/essentials/middleware":
+            raise typer.Exit(code=2)
+
+    monkeypatch.setattr(mm, "_scan_manifests", _counting_scan)
+    monkeypatch.setattr(di, "_sync_poetry_lockfile", synced.append)
+    monkeypatch.setattr(batch, "add_module", _fake_add_module)
+
+    results = batch.install_modules_batch(
+        ["free/essentials/logging", "free/essentials/middleware"],
+        profile="fastapi/standard",
+        project=str(tmp_path),
+        force=True,
+    )
+
+    assert [(r.module, r.ok) for r in results] == [
+        ("free/essentials/settings", True),
+        ("free/essentials/logging", True),
+        ("free/essentials/middleware", False),
+    ]
+    assert with_deps == [False, False, False]
+    assert len(scans) == 1
+    assert synced == [tmp_path.resolve()]
+    assert len(fhr.load_hashes(tmp_path)["files"]) == 3